@@ -0,0 +1,378 @@
+"""Performance measurement for the plugin benchmark tests"""
+
+import gc
+import hashlib
+import sys
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from statistics import median, quantiles
+from time import perf_counter
+
+import pytest
+
+if sys.platform != "win32":
+    import resource
+
+# Median differences below this many seconds are timer noise, never regressions
+NOISE_FLOOR = 0.001
+
+# Per instance size differences below this many bytes are allocator noise, never regressions
+MEMORY_NOISE_FLOOR = 256
+
+
+def peak_rss() -> int | None:
+    """The peak resident set size of this process
+
+    Returns:
+        The size in bytes, or None where the platform doesn't report it
+    """
+
+    if sys.platform == "win32":
+        return None
+
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # macOS reports bytes, everything else kilobytes
+    return usage if sys.platform == "darwin" else usage * 1024
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """The timings of one benchmarked operation"""
+
+    name: str
+    timings: tuple[float, ...]
+    rss_growth: int | None
+    peak_allocated: int | None = None
+
+    @property
+    def minimum(self) -> float:
+        """The fastest round in seconds"""
+        return min(self.timings)
+
+    @property
+    def median(self) -> float:
+        """The median round in seconds"""
+        return median(self.timings)
+
+    @property
+    def p95(self) -> float:
+        """The 95th percentile round in seconds"""
+
+        if len(self.timings) < 2:
+            return self.timings[0]
+
+        return quantiles(self.timings, n=20, method="inclusive")[18]
+
+
+def measure(name: str, operation: Callable[[], object], rounds: int, trace_memory: bool = False) -> BenchmarkResult:
+    """Times repeated calls of an operation
+
+    Args:
+        name: The operation name
+        operation: The operation to call
+        rounds: How many times to call it
+        trace_memory: Whether to run one extra, untimed round that measures the operation's peak allocation
+
+    Returns:
+        The timings
+    """
+
+    timings = []
+
+    # The process peak only ever grows and mostly comes from earlier tests, only the operation's raise is attributable
+    rss_before = peak_rss()
+
+    for _ in range(max(rounds, 1)):
+        start = perf_counter()
+        operation()
+        timings.append(perf_counter() - start)
+
+    rss_after = peak_rss()
+    rss_growth = rss_after - rss_before if rss_after is not None and rss_before is not None else None
+
+    peak_allocated = None
+
+    # Tracing slows allocations down, so it never overlaps the timed rounds
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+        try:
+            operation()
+            peak_allocated = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return BenchmarkResult(name=name, timings=tuple(timings), rss_growth=rss_growth, peak_allocated=peak_allocated)
+
+
+@dataclass(frozen=True)
+class FootprintResult:
+    """The memory cost of creating one object, averaged over several instances"""
+
+    name: str
+    instances: int
+    peak: int
+    retained: int
+
+
+def measure_footprint(name: str, factory: Callable[[], object], instances: int = 1) -> FootprintResult:
+    """Measures the allocations of creating objects and the memory they keep alive
+
+    Args:
+        name: The operation name
+        factory: Creates one object
+        instances: How many objects to create and keep alive at once, which averages out allocator noise
+
+    Returns:
+        The per instance peak allocation and retained size in bytes
+    """
+
+    instances = max(instances, 1)
+
+    # Warm caches, such as the validators pydantic builds on first use, so they don't count as retained
+    factory()
+
+    tracing = tracemalloc.is_tracing()
+
+    if not tracing:
+        tracemalloc.start()
+
+    try:
+        gc.collect()
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+
+        created = [factory() for _ in range(instances)]
+
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+    del created
+
+    return FootprintResult(
+        name=name,
+        instances=instances,
+        peak=(peak - before) // instances,
+        retained=max(current - before, 0) // instances,
+    )
+
+
+class BenchmarkRecorder:
+    """Session wide benchmark settings, stored baselines and results"""
+
+    def __init__(self, cache: pytest.Cache | None, rounds: int, threshold: float, update: bool) -> None:
+        self.cache = cache
+        self.rounds = rounds
+        self.threshold = threshold
+        self.update = update
+        self.results: list[tuple[str, BenchmarkResult, float | None]] = []
+        self.footprints: list[tuple[str, FootprintResult, int | None]] = []
+
+    @staticmethod
+    def baseline_key(node_id: str, name: str) -> str:
+        """Creates the cache key of a baseline
+
+        Args:
+            node_id: The benchmarking test
+            name: The operation name
+
+        Returns:
+            The pytest cache key
+        """
+
+        # Node IDs contain characters that aren't valid in file names on every platform
+        digest = hashlib.sha256(f"{node_id}::{name}".encode()).hexdigest()[:32]
+        return f"cppython/benchmark/{digest}"
+
+    @staticmethod
+    def footprint_key(node_id: str, name: str) -> str:
+        """Creates the cache key of a footprint baseline
+
+        Args:
+            node_id: The measuring test
+            name: The operation name
+
+        Returns:
+            The pytest cache key
+        """
+
+        digest = hashlib.sha256(f"{node_id}::{name}".encode()).hexdigest()[:32]
+        return f"cppython/footprint/{digest}"
+
+    def run(
+        self,
+        node_id: str,
+        name: str,
+        operation: Callable[[], object],
+        rounds: int | None = None,
+        trace_memory: bool = False,
+    ) -> BenchmarkResult:
+        """Measures an operation and checks it against its baseline
+
+        Args:
+            node_id: The benchmarking test
+            name: The operation name
+            operation: The operation to call
+            rounds: Overrides the session's round count
+            trace_memory: Whether to also measure the operation's peak allocation
+
+        Returns:
+            The timings
+        """
+
+        result = measure(name, operation, rounds or self.rounds, trace_memory)
+        baseline: float | None = None
+
+        if self.cache is not None:
+            stored = self.cache.get(self.baseline_key(node_id, name), None)
+            baseline = float(stored["median"]) if isinstance(stored, dict) else None
+
+            if baseline is None or self.update:
+                self.cache.set(self.baseline_key(node_id, name), {"median": result.median, "p95": result.p95})
+
+        self.results.append((node_id, result, baseline))
+
+        if baseline is not None and not self.update:
+            limit = baseline * (1 + self.threshold)
+
+            if result.median > limit and result.median - baseline > NOISE_FLOOR:
+                pytest.fail(
+                    f"'{name}' regressed: median {result.median * 1000:.2f} ms exceeds the baseline"
+                    f" {baseline * 1000:.2f} ms by more than {self.threshold:.0%}"
+                )
+
+        return result
+
+    def footprint(self, node_id: str, name: str, factory: Callable[[], object], instances: int = 1) -> FootprintResult:
+        """Measures the memory cost of creating objects and checks the retained size against its baseline
+
+        Args:
+            node_id: The measuring test
+            name: The operation name
+            factory: Creates one object
+            instances: How many objects to create at once
+
+        Returns:
+            The per instance sizes
+        """
+
+        result = measure_footprint(name, factory, instances)
+        baseline: int | None = None
+
+        if self.cache is not None:
+            stored = self.cache.get(self.footprint_key(node_id, name), None)
+            baseline = int(stored["retained"]) if isinstance(stored, dict) else None
+
+            if baseline is None or self.update:
+                self.cache.set(self.footprint_key(node_id, name), {"retained": result.retained, "peak": result.peak})
+
+        self.footprints.append((node_id, result, baseline))
+
+        if baseline is not None and not self.update:
+            limit = baseline * (1 + self.threshold)
+
+            if result.retained > limit and result.retained - baseline > MEMORY_NOISE_FLOOR:
+                pytest.fail(
+                    f"'{name}' grew: {result.retained} bytes retained per instance exceeds the baseline"
+                    f" {baseline} bytes by more than {self.threshold:.0%}"
+                )
+
+        return result
+
+    def report(self, terminal_reporter: pytest.TerminalReporter) -> None:
+        """Writes the benchmark and footprint tables
+
+        Args:
+            terminal_reporter: The reporter to write to
+        """
+
+        self._report_footprints(terminal_reporter)
+
+        if not self.results:
+            return
+
+        terminal_reporter.write_sep("-", "cppython benchmarks")
+        terminal_reporter.write_line(
+            f"{'min ms':>10} {'median ms':>10} {'p95 ms':>10} {'base ms':>10} {'rss+ MiB':>9} {'alloc MiB':>9}"
+            "  operation [test]"
+        )
+
+        for node_id, result, baseline in self.results:
+            base = f"{baseline * 1000:>10.2f}" if baseline is not None else f"{'-':>10}"
+            rss = f"{result.rss_growth / 2**20:>9.1f}" if result.rss_growth is not None else f"{'-':>9}"
+            allocated = f"{result.peak_allocated / 2**20:>9.1f}" if result.peak_allocated is not None else f"{'-':>9}"
+
+            terminal_reporter.write_line(
+                f"{result.minimum * 1000:>10.2f} {result.median * 1000:>10.2f} {result.p95 * 1000:>10.2f}"
+                f" {base} {rss} {allocated}  {result.name} [{node_id}]"
+            )
+
+    def _report_footprints(self, terminal_reporter: pytest.TerminalReporter) -> None:
+        """Writes the footprint table
+
+        Args:
+            terminal_reporter: The reporter to write to
+        """
+
+        if not self.footprints:
+            return
+
+        terminal_reporter.write_sep("-", "cppython memory footprints")
+        terminal_reporter.write_line(
+            f"{'retained KiB':>12} {'base KiB':>10} {'peak KiB':>10} {'instances':>9}  operation [test]"
+        )
+
+        for node_id, result, baseline in self.footprints:
+            base = f"{baseline / 1024:>10.2f}" if baseline is not None else f"{'-':>10}"
+
+            terminal_reporter.write_line(
+                f"{result.retained / 1024:>12.2f} {base} {result.peak / 1024:>10.2f} {result.instances:>9}"
+                f"  {result.name} [{node_id}]"
+            )
+
+
+class Benchmark:
+    """Runs benchmarks on behalf of a single test"""
+
+    def __init__(self, recorder: BenchmarkRecorder, node_id: str) -> None:
+        self.recorder = recorder
+        self.node_id = node_id
+
+    def __call__(
+        self, name: str, operation: Callable[[], object], rounds: int | None = None, trace_memory: bool = False
+    ) -> BenchmarkResult:
+        """Measures an operation and fails the test if it regressed
+
+        Args:
+            name: The operation name
+            operation: The operation to call
+            rounds: Overrides the session's round count
+            trace_memory: Whether to also measure the operation's peak allocation
+
+        Returns:
+            The timings
+        """
+
+        return self.recorder.run(self.node_id, name, operation, rounds, trace_memory)
+
+    def footprint(self, name: str, factory: Callable[[], object], instances: int = 1) -> FootprintResult:
+        """Measures the memory cost of creating objects and fails the test if it grew
+
+        Args:
+            name: The operation name
+            factory: Creates one object
+            instances: How many objects to create at once
+
+        Returns:
+            The per instance sizes
+        """
+
+        return self.recorder.footprint(self.node_id, name, factory, instances)
+
+
+benchmark_recorder_key = pytest.StashKey[BenchmarkRecorder]()
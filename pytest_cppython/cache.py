@@ -0,0 +1,373 @@
+"""Caching of resolved fixture data"""
+
+import copy
+import hashlib
+import importlib
+import json
+import types
+from collections import Counter
+from collections.abc import Callable, Hashable, Sequence
+from functools import cache
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+# Stands in for the session's base temporary directory so entries survive between sessions
+_ROOT_PLACEHOLDER = "{cppython-root}"
+
+# Stands in for a project workspace so entries are shared by every workspace cloned from one template
+_WORKSPACE_PLACEHOLDER = "{cppython-workspace}"
+
+# A workspace directory and the key of the template it was cloned from
+type WorkspaceOrigin = tuple[Path, Hashable]
+
+
+def _relativize(text: str, root: Path | None, workspace: Path | None = None) -> str:
+    """Replaces the session root and the workspace in serialized data with placeholders
+
+    Args:
+        text: Serialized data
+        root: The session's base temporary directory
+        workspace: The workspace directory. It usually lives below the root, so it is replaced first
+
+    Returns:
+        The session independent text
+    """
+
+    for path, placeholder in ((workspace, _WORKSPACE_PLACEHOLDER), (root, _ROOT_PLACEHOLDER)):
+        if path is None:
+            continue
+
+        # JSON escapes the separators on Windows, so replace both spellings
+        escaped = json.dumps(str(path))[1:-1]
+        text = text.replace(escaped, placeholder).replace(str(path), placeholder)
+
+    return text
+
+
+def _localize(text: str, root: Path | None, workspace: Path | None = None) -> str:
+    """Replaces the placeholders in serialized data with the session root and the workspace
+
+    Args:
+        text: Session independent text
+        root: The session's base temporary directory
+        workspace: The workspace directory
+
+    Returns:
+        The serialized data
+    """
+
+    for path, placeholder in ((workspace, _WORKSPACE_PLACEHOLDER), (root, _ROOT_PLACEHOLDER)):
+        if path is not None:
+            text = text.replace(placeholder, json.dumps(str(path))[1:-1])
+
+    return text
+
+
+def fingerprint(
+    *inputs: Any, files: Sequence[Path] = (), root: Path | None = None, workspace: Path | None = None
+) -> str:
+    """Creates a stable hash of resolution inputs
+
+    Args:
+        inputs: Pydantic models or plain values that affect the resolution
+        files: Files whose content affects the resolution
+        root: The session's base temporary directory, which is excluded from the hash
+        workspace: The workspace directory, which is excluded from the hash
+
+    Returns:
+        A hex digest that is equal for equal inputs
+    """
+
+    hasher = hashlib.sha256()
+
+    for item in inputs:
+        match item:
+            case BaseModel():
+                hasher.update(f"{type(item).__module__}.{type(item).__qualname__}".encode())
+                hasher.update(_relativize(item.model_dump_json(by_alias=True), root, workspace).encode())
+            case type():
+                hasher.update(f"{item.__module__}.{item.__qualname__}".encode())
+            case _:
+                hasher.update(_relativize(repr(item), root, workspace).encode())
+
+        # Separates entries so that adjacent inputs can't collide
+        hasher.update(b"\0")
+
+    for file in files:
+        hasher.update(file.read_bytes() if file.is_file() else b"")
+        hasher.update(b"\0")
+
+    return hasher.hexdigest()
+
+
+# Maps the subclasses created by 'freeze' back to the original model types
+_mutable_types: dict[type[BaseModel], type[BaseModel]] = {}
+
+
+@cache
+def _frozen_type(model_type: type[BaseModel]) -> type[BaseModel]:
+    """Derives a frozen subclass of a model type
+
+    Args:
+        model_type: The mutable model type
+
+    Returns:
+        A subclass that rejects attribute assignment
+    """
+
+    def body(namespace: dict[str, Any]) -> None:
+        namespace["model_config"] = ConfigDict(**{**model_type.model_config, "frozen": True})
+        namespace["__module__"] = model_type.__module__
+
+    frozen_type = types.new_class(f"Frozen{model_type.__name__}", (model_type,), {}, body)
+    _mutable_types[frozen_type] = model_type
+
+    return frozen_type
+
+
+def freeze[M: BaseModel](model: M) -> M:
+    """Creates a read-only copy of a model, and of the models nested in it, without validating again
+
+    Args:
+        model: The model to freeze
+
+    Returns:
+        An instance of a frozen subclass of the model's type
+    """
+
+    if type(model).model_config.get("frozen"):
+        return model
+
+    values = {name: freeze(value) if isinstance(value, BaseModel) else value for name, value in model}
+    frozen_type = _frozen_type(type(model))
+
+    return frozen_type.model_construct(_fields_set=model.model_fields_set, **values)  # type: ignore[return-value]
+
+
+def thaw[M: BaseModel](model: M) -> M:
+    """Creates an independent, mutable copy of a frozen model
+
+    Args:
+        model: The frozen model
+
+    Returns:
+        An instance of the original model type
+    """
+
+    model_type = _mutable_types.get(type(model), type(model))
+    values = {name: thaw(value) if isinstance(value, BaseModel) else copy.deepcopy(value) for name, value in model}
+
+    return model_type.model_construct(_fields_set=model.model_fields_set, **values)  # type: ignore[return-value]
+
+
+def environment_salt(*files: Path) -> str:
+    """Hashes everything outside the fixture inputs that changes resolution results
+
+    Args:
+        files: Source files that define the resolution inputs, such as the variant definitions
+
+    Returns:
+        A hex digest that changes when the environment does
+    """
+
+    return fingerprint(
+        metadata.version("pytest-cppython"),
+        metadata.version("cppython-core"),
+        metadata.version("pydantic"),
+        files=files,
+    )
+
+
+class PersistentStore:
+    """Stores resolved models in the pytest cache so later sessions can skip resolution"""
+
+    def __init__(self, cache: pytest.Cache, salt: str) -> None:
+        self.cache = cache
+        self.salt = salt
+
+    def _key(self, name: str, digest: str) -> str:
+        """Creates the cache key of an entry
+
+        Args:
+            name: The resolution category
+            digest: The input fingerprint
+
+        Returns:
+            The pytest cache key
+        """
+
+        return f"cppython/resolution/{name}/{fingerprint(self.salt, digest)}"
+
+    def load(self, name: str, digest: str, root: Path | None, workspace: Path | None = None) -> BaseModel | None:
+        """Rehydrates a stored model
+
+        Args:
+            name: The resolution category
+            digest: The input fingerprint
+            root: The session's base temporary directory
+            workspace: The workspace directory the model is restored into
+
+        Returns:
+            The model, or None if there is no usable entry
+        """
+
+        entry = self.cache.get(self._key(name, digest), None)
+
+        if not isinstance(entry, dict):
+            return None
+
+        try:
+            model_type = getattr(importlib.import_module(entry["module"]), entry["type"])
+        except (KeyError, ImportError, AttributeError):
+            return None
+
+        if not (isinstance(model_type, type) and issubclass(model_type, BaseModel)):
+            return None
+
+        data = _localize(str(entry.get("data", "")), root, workspace)
+
+        try:
+            return model_type.model_validate_json(data)
+        except ValidationError:
+            # Stale entries, such as ones pointing at a deleted path, are resolved again
+            return None
+
+    def save(self, name: str, digest: str, result: Any, root: Path | None, workspace: Path | None = None) -> None:
+        """Stores a resolved model. Anything else is ignored
+
+        Args:
+            name: The resolution category
+            digest: The input fingerprint
+            result: The resolved data
+            root: The session's base temporary directory
+            workspace: The workspace directory the model was resolved in
+        """
+
+        if not isinstance(result, BaseModel):
+            return
+
+        entry = {
+            "module": type(result).__module__,
+            "type": type(result).__qualname__,
+            "data": _relativize(result.model_dump_json(by_alias=True), root, workspace),
+        }
+
+        self.cache.set(self._key(name, digest), entry)
+
+
+def _rebase(result: Any, source: Path | None, target: Path | None) -> Any:
+    """Moves a resolved model from one workspace into another cloned from the same template
+
+    Args:
+        result: The resolved data
+        source: The workspace the data was resolved in
+        target: The workspace to move it to
+
+    Returns:
+        The data pointing into the target workspace, or None if it no longer validates there
+    """
+
+    if not isinstance(result, BaseModel) or source is None or target is None:
+        return result
+
+    data = _localize(_relativize(result.model_dump_json(by_alias=True), None, source), None, target)
+
+    try:
+        return type(result).model_validate_json(data)
+    except ValidationError:
+        return None
+
+
+class ResolutionCache:
+    """Memoizes resolution results by the content of their inputs"""
+
+    def __init__(self, store: PersistentStore | None = None) -> None:
+        self.store = store
+        self.root: Path | None = None
+        self._entries: dict[tuple[str, str], dict[Path | None, Any]] = {}
+        self.hits: Counter[str] = Counter()
+        self.restored: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+
+    def resolve[R](
+        self,
+        name: str,
+        resolver: Callable[..., R],
+        *args: Any,
+        files: Sequence[Path] = (),
+        workspace: WorkspaceOrigin | None = None,
+        persist: bool = True,
+    ) -> R:
+        """Returns the cached result of 'resolver(*args)', calling it only on the first request
+
+        Args:
+            name: The resolution category, used for the key and the statistics
+            resolver: The resolution function
+            args: The resolver arguments
+            files: Files read by the resolver whose content should invalidate the entry
+            workspace: The workspace the arguments point into and its template key. The key replaces the workspace
+                directory in the fingerprint, so every workspace cloned from one template shares the entry
+            persist: Whether later sessions may restore the result. Resolvers with side effects, such as creating
+                directories, have to run again in every session
+
+        Returns:
+            The resolved data. The instance is shared and must not be modified
+        """
+
+        directory, template = workspace if workspace is not None else (None, None)
+        inputs = args if workspace is None else (*args, template)
+
+        digest = fingerprint(*inputs, files=files, root=self.root, workspace=directory)
+        instances = self._entries.setdefault((name, digest), {})
+
+        if directory in instances:
+            self.hits[name] += 1
+            return instances[directory]  # type: ignore[no-any-return]
+
+        for source, result in instances.items():
+            if (rebased := _rebase(result, source, directory)) is not None:
+                self.hits[name] += 1
+                instances[directory] = rebased
+                return rebased  # type: ignore[no-any-return]
+
+        store = self.store if persist else None
+
+        if store is not None and (restored := store.load(name, digest, self.root, directory)) is not None:
+            self.restored[name] += 1
+            instances[directory] = restored
+            return restored  # type: ignore[return-value]
+
+        self.misses[name] += 1
+        result = resolver(*args)
+        instances[directory] = result
+
+        if store is not None:
+            store.save(name, digest, result, self.root, directory)
+
+        return result
+
+    def report(self, terminal_reporter: pytest.TerminalReporter) -> None:
+        """Writes the hit and miss statistics
+
+        Args:
+            terminal_reporter: The reporter to write to
+        """
+
+        names = sorted(self.hits.keys() | self.restored.keys() | self.misses.keys())
+
+        if not names:
+            return
+
+        terminal_reporter.write_sep("-", "cppython resolution cache")
+
+        for name in names:
+            terminal_reporter.write_line(
+                f"{name}: {self.hits[name]} hits, {self.restored[name]} restored, {self.misses[name]} misses"
+            )
+
+
+resolution_cache_key = pytest.StashKey[ResolutionCache]()
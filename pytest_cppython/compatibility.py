@@ -0,0 +1,128 @@
+"""Precomputed sync type compatibility between providers and generators"""
+
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from importlib import metadata
+
+from cppython_core.plugin_schema.generator import Generator
+from cppython_core.plugin_schema.provider import Provider
+from cppython_core.schema import SyncData
+
+
+def load_plugin_types[P](group: str, plugin_type: type[P]) -> list[type[P]]:
+    """Loads the plugins registered in an entry point group
+
+    Args:
+        group: The entry point group, such as 'cppython.provider'
+        plugin_type: The base type the plugins must derive from
+
+    Returns:
+        The plugin types, skipping entries that aren't subclasses of the base type
+    """
+
+    loaded = (entry_point.load() for entry_point in metadata.entry_points(group=group))
+    return [entry for entry in loaded if isinstance(entry, type) and issubclass(entry, plugin_type)]
+
+
+@dataclass(frozen=True)
+class CompatibilityIndex:
+    """Maps sync types to the plugins that produce and consume them, replacing per pair negotiation with lookups"""
+
+    providers: dict[type[SyncData], frozenset[type[Provider]]]
+    generators: dict[type[SyncData], frozenset[type[Generator]]]
+    pairs: dict[tuple[type[Provider], type[Generator]], tuple[type[SyncData], ...]] = field(repr=False)
+
+    @property
+    def sync_types(self) -> list[type[SyncData]]:
+        """Every sync type a known generator consumes"""
+        return list(self.generators)
+
+    @property
+    def provider_types(self) -> frozenset[type[Provider]]:
+        """Every indexed provider"""
+        return frozenset(provider for provider, _ in self.pairs)
+
+    @property
+    def generator_types(self) -> frozenset[type[Generator]]:
+        """Every indexed generator"""
+        return frozenset(generator for _, generator in self.pairs)
+
+    def providers_for(self, sync_type: type[SyncData]) -> frozenset[type[Provider]]:
+        """The providers that can produce a sync type
+
+        Args:
+            sync_type: The sync type
+
+        Returns:
+            The providers
+        """
+
+        return self.providers.get(sync_type, frozenset())
+
+    def generators_for(self, sync_type: type[SyncData]) -> frozenset[type[Generator]]:
+        """The generators that consume a sync type
+
+        Args:
+            sync_type: The sync type
+
+        Returns:
+            The generators
+        """
+
+        return self.generators.get(sync_type, frozenset())
+
+    def compatible(self, provider_type: type[Provider], generator_type: type[Generator]) -> tuple[type[SyncData], ...]:
+        """The sync types a provider can hand to a generator
+
+        Args:
+            provider_type: The provider
+            generator_type: The generator
+
+        Returns:
+            The shared sync types in the generator's order of preference
+        """
+
+        return self.pairs.get((provider_type, generator_type), ())
+
+
+def build_compatibility_index(
+    provider_types: Iterable[type[Provider]], generator_types: Iterable[type[Generator]]
+) -> CompatibilityIndex:
+    """Asks every plugin once which sync types it supports
+
+    Args:
+        provider_types: The providers to index
+        generator_types: The generators to index
+
+    Returns:
+        The index
+    """
+
+    providers = list(dict.fromkeys(provider_types))
+    generator_sync_types: dict[type[Generator], Sequence[type[SyncData]]] = {
+        generator: generator.sync_types() for generator in dict.fromkeys(generator_types)
+    }
+
+    consumers: defaultdict[type[SyncData], set[type[Generator]]] = defaultdict(set)
+
+    for generator, sync_types in generator_sync_types.items():
+        for sync_type in sync_types:
+            consumers[sync_type].add(generator)
+
+    producers = {
+        sync_type: frozenset(provider for provider in providers if provider.supported_sync_type(sync_type))
+        for sync_type in consumers
+    }
+
+    pairs = {
+        (provider, generator): tuple(sync_type for sync_type in sync_types if provider in producers[sync_type])
+        for provider in providers
+        for generator, sync_types in generator_sync_types.items()
+    }
+
+    return CompatibilityIndex(
+        providers=producers,
+        generators={sync_type: frozenset(generators) for sync_type, generators in consumers.items()},
+        pairs=pairs,
+    )
@@ -0,0 +1,221 @@
+"""Concurrent stress testing of plugin methods"""
+
+import hashlib
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+
+import pytest
+from pydantic import BaseModel
+
+
+def checksum(value: object) -> str:
+    """Creates a digest of a plugin method's output, so that results of concurrent calls can be compared
+
+    Args:
+        value: The output. Models are compared by their data, directories by their content
+
+    Returns:
+        A hex digest that is equal for equal outputs
+    """
+
+    hasher = hashlib.sha256()
+
+    match value:
+        case BaseModel():
+            hasher.update(f"{type(value).__module__}.{type(value).__qualname__}".encode())
+            hasher.update(value.model_dump_json(by_alias=True).encode())
+        case Path() if value.is_dir():
+            for file in sorted(value.rglob("*")):
+                if file.is_file():
+                    hasher.update(file.relative_to(value).as_posix().encode())
+                    hasher.update(b"\0")
+                    hasher.update(file.read_bytes())
+                    hasher.update(b"\0")
+        case _:
+            hasher.update(repr(value).encode())
+
+    return hasher.hexdigest()
+
+
+def invoke(target: object, method: str, *args: object) -> str:
+    """Calls a method and digests its output. Module level, so that process pools can pickle it
+
+    Args:
+        target: The plugin instance or type
+        method: The method name
+        args: The method arguments
+
+    Returns:
+        The output's checksum
+    """
+
+    return checksum(getattr(target, method)(*args))
+
+
+def worker_counts(maximum: int) -> list[int]:
+    """The worker counts of a scaling curve: powers of two up to, and including, the maximum
+
+    Args:
+        maximum: The largest worker count
+
+    Returns:
+        The ascending counts
+    """
+
+    counts = []
+    workers = 1
+
+    while workers < maximum:
+        counts.append(workers)
+        workers *= 2
+
+    counts.append(max(maximum, 1))
+
+    return counts
+
+
+@dataclass(frozen=True)
+class ScalingPoint:
+    """The throughput of one worker count"""
+
+    workers: int
+    calls: int
+    elapsed: float
+
+    @property
+    def throughput(self) -> float:
+        """Calls per second"""
+        return self.calls / self.elapsed if self.elapsed > 0 else float("inf")
+
+
+def _create_executor(workers: int, processes: bool) -> Executor:
+    """Creates a pool
+
+    Args:
+        workers: The pool size
+        processes: Whether the workers are processes instead of threads
+
+    Returns:
+        The pool
+    """
+
+    if processes:
+        # Forking a process that runs threads can deadlock, and spawn behaves the same on every platform
+        return ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+
+    return ThreadPoolExecutor(workers)
+
+
+def hammer(task: Callable[[], str], workers: int, calls: int, processes: bool = False) -> tuple[list[str], float]:
+    """Runs a task many times at once
+
+    Args:
+        task: Returns the checksum of one call. It must be picklable when 'processes' is set
+        workers: The number of simultaneous workers
+        calls: The total number of calls
+        processes: Whether the workers are processes instead of threads
+
+    Returns:
+        The checksum of every call and the seconds the calls took, excluding the pool start up
+    """
+
+    with _create_executor(workers, processes) as executor:
+        # Start every worker before timing, spawned processes take long to import
+        warm_up = [executor.submit(task) for _ in range(workers)]
+
+        for future in warm_up:
+            future.result()
+
+        start = perf_counter()
+        futures = [executor.submit(task) for _ in range(calls)]
+        checksums = [future.result() for future in futures]
+
+        return checksums, perf_counter() - start
+
+
+class ScalingRecorder:
+    """Session wide throughput scaling curves"""
+
+    def __init__(self) -> None:
+        self.curves: list[tuple[str, str, list[ScalingPoint]]] = []
+
+    def run(
+        self, node_id: str, name: str, task: Callable[[], str], max_workers: int, calls: int, processes: bool = False
+    ) -> set[str]:
+        """Runs a task at every worker count of the curve
+
+        Args:
+            node_id: The measuring test
+            name: The operation name
+            task: Returns the checksum of one call
+            max_workers: The largest worker count
+            calls: The number of calls per worker count
+            processes: Whether the workers are processes instead of threads
+
+        Returns:
+            The distinct checksums over every call. More than one means the calls raced
+        """
+
+        points = []
+        distinct: set[str] = set()
+
+        for workers in worker_counts(max_workers):
+            checksums, elapsed = hammer(task, workers, calls, processes)
+            distinct.update(checksums)
+            points.append(ScalingPoint(workers=workers, calls=calls, elapsed=elapsed))
+
+        self.curves.append((node_id, f"{name} ({'processes' if processes else 'threads'})", points))
+
+        return distinct
+
+    def report(self, terminal_reporter: pytest.TerminalReporter) -> None:
+        """Writes the scaling curves
+
+        Args:
+            terminal_reporter: The reporter to write to
+        """
+
+        if not self.curves:
+            return
+
+        terminal_reporter.write_sep("-", "cppython concurrency scaling")
+
+        for node_id, name, points in self.curves:
+            terminal_reporter.write_line(f"{name} [{node_id}]")
+
+            for point in points:
+                speedup = point.throughput / points[0].throughput if points[0].throughput else 0.0
+                terminal_reporter.write_line(
+                    f"{point.workers:>8} workers {point.throughput:>12.1f} calls/s {speedup:>6.2f}x"
+                )
+
+
+class ConcurrencyProbe:
+    """Runs concurrency stress tests on behalf of a single test"""
+
+    def __init__(self, recorder: ScalingRecorder, node_id: str, max_workers: int, calls: int) -> None:
+        self.recorder = recorder
+        self.node_id = node_id
+        self.max_workers = max_workers
+        self.calls = calls
+
+    def __call__(self, name: str, task: Callable[[], str], processes: bool = False) -> set[str]:
+        """Runs a task from increasing numbers of workers
+
+        Args:
+            name: The operation name
+            task: Returns the checksum of one call. It must be picklable when 'processes' is set
+            processes: Whether the workers are processes instead of threads
+
+        Returns:
+            The distinct checksums over every call
+        """
+
+        return self.recorder.run(self.node_id, name, task, self.max_workers, self.calls, processes)
+
+
+scaling_recorder_key = pytest.StashKey[ScalingRecorder]()
@@ -0,0 +1,103 @@
+"""Data directory discovery for test parametrization"""
+
+from pathlib import Path
+from time import perf_counter
+
+import pytest
+
+
+class DirectoryScanner:
+    """Lists data directories once per session, rescanning only when a directory's mtime changes"""
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[Path, bool], tuple[int, list[Path]]] = {}
+        self.scans = 0
+        self.reuses = 0
+        self.hook_calls = 0
+        self.hook_time = 0.0
+
+    def _list(self, directory: Path, directories_only: bool) -> list[Path]:
+        """Lists the children of a directory through the cache
+
+        Args:
+            directory: The directory to list
+            directories_only: Whether to skip anything that isn't a directory
+
+        Returns:
+            The sorted children
+        """
+
+        try:
+            mtime = directory.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = -1
+
+        key = (directory, directories_only)
+
+        if (entry := self._entries.get(key)) is not None and entry[0] == mtime:
+            self.reuses += 1
+            return list(entry[1])
+
+        self.scans += 1
+        children = sorted(directory.glob("*")) if mtime != -1 else []
+
+        if directories_only:
+            children = [child for child in children if child.is_dir()]
+
+        self._entries[key] = (mtime, children)
+
+        return list(children)
+
+    def children(self, directory: Path) -> list[Path]:
+        """Lists every entry in a directory
+
+        Args:
+            directory: The directory to list
+
+        Returns:
+            The sorted entries
+        """
+
+        return self._list(directory, False)
+
+    def subdirectories(self, directory: Path) -> list[Path]:
+        """Lists the directories in a directory
+
+        Args:
+            directory: The directory to list
+
+        Returns:
+            The sorted subdirectories
+        """
+
+        return self._list(directory, True)
+
+    def record(self, start: float) -> None:
+        """Accounts for one parametrization hook call
+
+        Args:
+            start: The 'perf_counter' value when the call started
+        """
+
+        self.hook_calls += 1
+        self.hook_time += perf_counter() - start
+
+    def report(self, terminal_reporter: pytest.TerminalReporter) -> None:
+        """Writes the collection profile
+
+        Args:
+            terminal_reporter: The reporter to write to
+        """
+
+        # Sessions without CPPython data directories, such as unrelated suites, stay silent
+        if not self.scans and not self.reuses:
+            return
+
+        terminal_reporter.write_sep("-", "cppython collection profile")
+        terminal_reporter.write_line(
+            f"pytest_generate_tests: {self.hook_calls} calls, {self.hook_time * 1000:.1f} ms,"
+            f" {self.scans} directory scans, {self.reuses} reused"
+        )
+
+
+directory_scanner_key = pytest.StashKey[DirectoryScanner]()
@@ -0,0 +1,130 @@
+"""Event loop responsiveness measurement for the async plugin tests"""
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from statistics import fmean, quantiles
+
+import pytest
+
+# Seconds between the probe's wake ups
+SAMPLE_INTERVAL = 0.005
+
+
+@dataclass(frozen=True)
+class LagResult:
+    """The event loop lag observed while one operation ran"""
+
+    name: str
+    samples: tuple[float, ...]
+
+    @property
+    def maximum(self) -> float:
+        """The worst lag in seconds"""
+        return max(self.samples, default=0.0)
+
+    @property
+    def mean(self) -> float:
+        """The mean lag in seconds"""
+        return fmean(self.samples) if self.samples else 0.0
+
+    @property
+    def p95(self) -> float:
+        """The 95th percentile lag in seconds"""
+
+        if len(self.samples) < 2:
+            return self.maximum
+
+        return quantiles(self.samples, n=20, method="inclusive")[18]
+
+
+async def _probe(interval: float, samples: list[float]) -> None:
+    """Sleeps in a loop, recording how much later than requested each wake up happens
+
+    Args:
+        interval: Seconds between wake ups
+        samples: Receives the lag of every wake up
+    """
+
+    loop = asyncio.get_running_loop()
+
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        samples.append(max(loop.time() - start - interval, 0.0))
+
+
+class EventLoopLagRecorder:
+    """Session wide event loop lag results. Coroutines that block the loop show up as lag"""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL) -> None:
+        self.interval = interval
+        self.results: list[tuple[str, LagResult]] = []
+
+    @contextlib.asynccontextmanager
+    async def watch(self, node_id: str, name: str) -> AsyncIterator[list[float]]:
+        """Samples the running loop's lag for the duration of the block
+
+        Args:
+            node_id: The measuring test
+            name: The operation name
+
+        Yields:
+            The samples collected so far
+        """
+
+        samples: list[float] = []
+        probe = asyncio.create_task(_probe(self.interval, samples))
+
+        try:
+            yield samples
+        finally:
+            probe.cancel()
+
+            with contextlib.suppress(asyncio.CancelledError):
+                await probe
+
+            self.results.append((node_id, LagResult(name=name, samples=tuple(samples))))
+
+    def report(self, terminal_reporter: pytest.TerminalReporter) -> None:
+        """Writes the lag table, worst first
+
+        Args:
+            terminal_reporter: The reporter to write to
+        """
+
+        if not self.results:
+            return
+
+        terminal_reporter.write_sep("-", "cppython event loop lag")
+        terminal_reporter.write_line(f"{'max ms':>10} {'p95 ms':>10} {'mean ms':>10} {'samples':>8}  operation [test]")
+
+        for node_id, result in sorted(self.results, key=lambda entry: -entry[1].maximum):
+            terminal_reporter.write_line(
+                f"{result.maximum * 1000:>10.2f} {result.p95 * 1000:>10.2f} {result.mean * 1000:>10.2f}"
+                f" {len(result.samples):>8}  {result.name} [{node_id}]"
+            )
+
+
+class EventLoopLag:
+    """Measures event loop lag on behalf of a single test"""
+
+    def __init__(self, recorder: EventLoopLagRecorder, node_id: str) -> None:
+        self.recorder = recorder
+        self.node_id = node_id
+
+    def watch(self, name: str) -> contextlib.AbstractAsyncContextManager[list[float]]:
+        """Samples the running loop's lag for the duration of an 'async with' block
+
+        Args:
+            name: The operation name
+
+        Returns:
+            The context manager, which yields the samples collected so far
+        """
+
+        return self.recorder.watch(self.node_id, name)
+
+
+event_loop_lag_key = pytest.StashKey[EventLoopLagRecorder]()
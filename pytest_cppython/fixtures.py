@@ -0,0 +1,512 @@
+"""CPPython data fixtures. The pytest plugin registers this module once the test suite imports cppython_core, so
+that unrelated test suites never pay for importing it or for building the variants
+"""
+
+import asyncio
+from collections.abc import Iterator
+from pathlib import Path
+from typing import cast
+
+import pytest
+from cppython_core.plugin_schema.generator import Generator
+from cppython_core.plugin_schema.provider import Provider
+from cppython_core.plugin_schema.scm import SCM
+from cppython_core.resolution import (
+    PluginBuildData,
+    PluginCPPythonData,
+    resolve_cppython,
+    resolve_pep621,
+    resolve_project_configuration,
+)
+from cppython_core.schema import (
+    CoreData,
+    CPPythonData,
+    CPPythonGlobalConfiguration,
+    CPPythonLocalConfiguration,
+    PEP621Configuration,
+    PEP621Data,
+    ProjectConfiguration,
+    ProjectData,
+    PyProject,
+    ToolData,
+)
+
+from pytest_cppython.cache import (
+    PersistentStore,
+    ResolutionCache,
+    environment_salt,
+    freeze,
+    resolution_cache_key,
+    thaw,
+)
+from pytest_cppython.compatibility import (
+    CompatibilityIndex,
+    build_compatibility_index,
+    load_plugin_types,
+)
+from pytest_cppython.concurrency import (
+    ConcurrencyProbe,
+    ScalingRecorder,
+    scaling_recorder_key,
+)
+from pytest_cppython.tooling import (
+    ToolCache,
+    ToolingManager,
+    collect_provider_types,
+    collected_providers_key,
+)
+from pytest_cppython.variants import (
+    cppython_global_variants,
+    cppython_local_variants,
+    generator_variants,
+    pep621_variants,
+    project_variants,
+    provider_variants,
+)
+from pytest_cppython.workspace import WorkspaceMaterializer, WorkspaceSnapshot
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Creates the session wide state of the data fixtures
+
+    Args:
+        config: The pytest configuration
+    """
+
+    store = None
+
+    # The cache is missing entirely when the cacheprovider plugin is disabled
+    cache = getattr(config, "cache", None)
+
+    if config.getoption("cppython_persistent_cache") and cache is not None:
+        store = PersistentStore(cache, environment_salt(Path(__file__).parent / "variants.py"))
+
+    config.stash[resolution_cache_key] = ResolutionCache(store)
+    config.stash[scaling_recorder_key] = ScalingRecorder()
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter, config: pytest.Config) -> None:
+    """Reports the data fixture statistics at the end of the session
+
+    Args:
+        terminalreporter: The terminal reporter
+        config: The pytest configuration
+    """
+
+    config.stash[resolution_cache_key].report(terminalreporter)
+    config.stash[scaling_recorder_key].report(terminalreporter)
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Records which providers the session tests, so their tooling downloads can be batched
+
+    Args:
+        config: The pytest configuration
+        items: The collected test items
+    """
+
+    config.stash[collected_providers_key] = collect_provider_types(items)
+
+
+@pytest.fixture(name="resolution_cache", scope="session")
+def fixture_resolution_cache(request: pytest.FixtureRequest, install_path: Path) -> ResolutionCache:
+    """The session wide cache of resolved data
+
+    Args:
+        request: The fixture request, used to reach the session state
+        install_path: The temporary install directory
+
+    Returns:
+        The resolution cache
+    """
+
+    resolution_cache = request.config.stash[resolution_cache_key]
+
+    # Workspaces live under the install path, which changes between sessions
+    resolution_cache.root = install_path
+
+    return resolution_cache
+
+
+@pytest.fixture(name="concurrency_probe")
+def fixture_concurrency_probe(
+    request: pytest.FixtureRequest, concurrency: int, concurrency_calls: int
+) -> ConcurrencyProbe:
+    """Calls plugin methods from growing numbers of threads or processes and records the throughput
+
+    Args:
+        request: The fixture request, used to identify the test
+        concurrency: The largest worker count
+        concurrency_calls: The calls per worker count
+
+    Returns:
+        The probe for the requesting test
+    """
+
+    return ConcurrencyProbe(
+        request.config.stash[scaling_recorder_key], request.node.nodeid, concurrency, concurrency_calls
+    )
+
+
+@pytest.fixture(name="compatibility_index", scope="session")
+def fixture_compatibility_index() -> CompatibilityIndex:
+    """Which providers and generators share each sync type, negotiated once for the whole session
+
+    Returns:
+        The index over the registered plugins and the mock variants
+    """
+
+    return build_compatibility_index(
+        [*load_plugin_types("cppython.provider", Provider), *provider_variants],
+        [*load_plugin_types("cppython.generator", Generator), *generator_variants],
+    )
+
+
+@pytest.fixture(name="tooling_manager", scope="session")
+def fixture_tooling_manager(
+    request: pytest.FixtureRequest, install_path: Path, event_loop_runner: asyncio.Runner
+) -> ToolingManager:
+    """Session wide tooling downloads that share the session event loop
+
+    Args:
+        request: The fixture request, used to reach the collected providers
+        install_path: The temporary install directory
+        event_loop_runner: The session event loop
+
+    Returns:
+        The tooling manager
+    """
+
+    tool_cache = None
+
+    if (directory := request.config.getoption("cppython_tool_cache")) is not None:
+        size = request.config.getoption("cppython_tool_cache_size")
+        root = request.config.invocation_params.dir / directory
+        tool_cache = ToolCache(root, size * 2**20 if size is not None else None)
+
+    manager = ToolingManager(install_path, event_loop_runner, tool_cache)
+    manager.register(request.config.stash.get(collected_providers_key, []))
+
+    return manager
+
+
+@pytest.fixture(
+    name="pep621_configuration",
+    scope="session",
+    params=pep621_variants,
+)
+def fixture_pep621_configuration(request: pytest.FixtureRequest) -> PEP621Configuration:
+    """Fixture defining all testable variations of PEP621
+
+    Args:
+        request: Parameterization list
+
+    Returns:
+        PEP621 variant
+    """
+
+    return cast(PEP621Configuration, request.param)
+
+
+@pytest.fixture(
+    name="pep621_data",
+    scope="session",
+)
+def fixture_pep621_data(
+    pep621_configuration: PEP621Configuration,
+    project_configuration: ProjectConfiguration,
+    resolution_cache: ResolutionCache,
+    workspace_materializer: WorkspaceMaterializer,
+) -> PEP621Data:
+    """Resolved project table fixture
+
+    Args:
+        pep621_configuration: The input configuration to resolve
+        project_configuration: The project configuration to help with the resolve
+        resolution_cache: The session wide cache of resolved data
+        workspace_materializer: Identifies the template of the project's workspace
+
+    Returns:
+        The resolved project table
+    """
+
+    return resolution_cache.resolve(
+        "pep621_data",
+        resolve_pep621,
+        pep621_configuration,
+        project_configuration,
+        None,
+        files=[project_configuration.pyproject_file],
+        workspace=workspace_materializer.origin(project_configuration.pyproject_file),
+    )
+
+
+@pytest.fixture(
+    name="cppython_local_configuration",
+    scope="session",
+    params=cppython_local_variants,
+)
+def fixture_cppython_local_configuration(
+    request: pytest.FixtureRequest, install_path: Path
+) -> CPPythonLocalConfiguration:
+    """Fixture defining all testable variations of CPPythonData
+
+    Args:
+        request: Parameterization list
+        install_path: The temporary install directory
+
+    Returns:
+        Variation of CPPython data
+    """
+    cppython_local_configuration = cast(CPPythonLocalConfiguration, request.param)
+
+    data = cppython_local_configuration.model_dump(by_alias=True)
+
+    # Pin the install location to the base temporary directory
+    data["install-path"] = install_path
+
+    # Fill the plugin names with mocked values
+    data["provider-name"] = "mock"
+    data["generator-name"] = "mock"
+
+    return CPPythonLocalConfiguration(**data)
+
+
+@pytest.fixture(
+    name="cppython_global_configuration",
+    scope="session",
+    params=cppython_global_variants,
+)
+def fixture_cppython_global_configuration(request: pytest.FixtureRequest) -> CPPythonGlobalConfiguration:
+    """Fixture defining all testable variations of CPPythonData
+
+    Args:
+        request: Parameterization list
+
+    Returns:
+        Variation of CPPython data
+    """
+    cppython_global_configuration = cast(CPPythonGlobalConfiguration, request.param)
+
+    return cppython_global_configuration
+
+
+@pytest.fixture(
+    name="plugin_build_data",
+    scope="session",
+)
+def fixture_plugin_build_data(
+    provider_type: type[Provider],
+    generator_type: type[Generator],
+    scm_type: type[SCM],
+) -> PluginBuildData:
+    """Fixture for constructing resolved CPPython table data
+
+    Args:
+        provider_type: The provider type
+        generator_type: The generator type
+        scm_type: The scm type
+
+    Returns:
+        The plugin build data
+    """
+
+    return PluginBuildData(generator_type=generator_type, provider_type=provider_type, scm_type=scm_type)
+
+
+@pytest.fixture(
+    name="plugin_cppython_data",
+    scope="session",
+)
+def fixture_plugin_cppython_data(
+    provider_type: type[Provider],
+    generator_type: type[Generator],
+    scm_type: type[SCM],
+) -> PluginCPPythonData:
+    """Fixture for constructing resolved CPPython table data
+
+    Args:
+        provider_type: The provider type
+        generator_type: The generator type
+        scm_type: The scm type
+
+    Returns:
+        The plugin data for CPPython resolution
+    """
+
+    return PluginCPPythonData(
+        generator_name=generator_type.name(), provider_name=provider_type.name(), scm_name=scm_type.name()
+    )
+
+
+@pytest.fixture(
+    name="cppython_data",
+    scope="session",
+)
+def fixture_cppython_data(
+    cppython_local_configuration: CPPythonLocalConfiguration,
+    cppython_global_configuration: CPPythonGlobalConfiguration,
+    project_data: ProjectData,
+    plugin_cppython_data: PluginCPPythonData,
+    resolution_cache: ResolutionCache,
+    workspace_materializer: WorkspaceMaterializer,
+) -> CPPythonData:
+    """Fixture for constructing resolved CPPython table data
+
+    Args:
+        cppython_local_configuration: The local configuration to resolve
+        cppython_global_configuration: The global configuration to resolve
+        project_data: The project data to help with the resolve
+        plugin_cppython_data: Plugin data for CPPython resolution
+        resolution_cache: The session wide cache of resolved data
+        workspace_materializer: Identifies the template of the project's workspace
+
+    Returns:
+        The resolved CPPython table
+    """
+
+    return resolution_cache.resolve(
+        "cppython_data",
+        resolve_cppython,
+        cppython_local_configuration,
+        cppython_global_configuration,
+        project_data,
+        plugin_cppython_data,
+        workspace=workspace_materializer.origin(project_data.pyproject_file),
+        # Resolving creates the install directories
+        persist=False,
+    )
+
+
+@pytest.fixture(
+    name="core_data",
+    scope="session",
+)
+def fixture_core_data(cppython_data: CPPythonData, project_data: ProjectData) -> CoreData:
+    """Fixture for creating the wrapper CoreData type. The instance is shared and read-only
+
+    Args:
+        cppython_data: CPPython data
+        project_data: The project data
+
+    Returns:
+        Wrapper Core Type
+    """
+
+    return freeze(CoreData(cppython_data=cppython_data, project_data=project_data))
+
+
+@pytest.fixture(name="mutable_core_data")
+def fixture_mutable_core_data(core_data: CoreData) -> CoreData:
+    """A private, modifiable copy of core_data for tests that need to change it
+
+    Args:
+        core_data: The shared core data
+
+    Returns:
+        Wrapper Core Type
+    """
+
+    return thaw(core_data)
+
+
+@pytest.fixture(
+    name="project_configuration",
+    scope="session",
+    params=project_variants,
+)
+def fixture_project_configuration(
+    request: pytest.FixtureRequest,
+    workspace_materializer: WorkspaceMaterializer,
+    data_path: Path,
+    plugin_data_path: Path | None,
+) -> ProjectConfiguration:
+    """Project configuration fixture
+
+    Args:
+        request: Parameterized configuration data
+        workspace_materializer: Clones the data directories into a new workspace
+        data_path: Project file requirements
+        plugin_data_path: Parameterized path to a data directory
+
+    Returns:
+        Configuration with temporary directory capabilities
+    """
+
+    tmp_path = workspace_materializer.materialize(data_path, plugin_data_path)
+
+    configuration = cast(ProjectConfiguration, request.param)
+
+    # Pin the project location
+    paths = list(tmp_path.rglob("pyproject.toml"))
+
+    # 'paths' length guaranteed to be 1
+    configuration.pyproject_file = paths[0].resolve()
+
+    return configuration
+
+
+@pytest.fixture(name="workspace_snapshot")
+def fixture_workspace_snapshot(
+    project_configuration: ProjectConfiguration, workspace_materializer: WorkspaceMaterializer
+) -> Iterator[WorkspaceSnapshot]:
+    """Opt in isolation from the shared project workspace, undoing the test's changes once it finishes.
+    The snapshot is captured when first requested, after the session fixtures have set the workspace up.
+    It doesn't cover the install path, see the 'plugin_snapshot' fixture of the data plugin tests
+
+    Args:
+        project_configuration: The project whose workspace is shared
+        workspace_materializer: Owns the workspace snapshots
+
+    Yields:
+        The workspace snapshot
+    """
+
+    snapshot = workspace_materializer.snapshot(project_configuration.pyproject_file.parent)
+
+    yield snapshot
+
+    workspace_materializer.restore(snapshot)
+
+
+@pytest.fixture(
+    name="project_data",
+    scope="session",
+)
+def fixture_project_data(
+    project_configuration: ProjectConfiguration,
+    resolution_cache: ResolutionCache,
+    workspace_materializer: WorkspaceMaterializer,
+) -> ProjectData:
+    """Fixture that creates a project space at 'workspace/test_project/pyproject.toml'
+    Args:
+        project_configuration: Project data
+        resolution_cache: The session wide cache of resolved data
+        workspace_materializer: Identifies the template of the project's workspace
+    Returns:
+        A project data object that has populated a function level temporary directory
+    """
+
+    return resolution_cache.resolve(
+        "project_data",
+        resolve_project_configuration,
+        project_configuration,
+        files=[project_configuration.pyproject_file],
+        workspace=workspace_materializer.origin(project_configuration.pyproject_file),
+    )
+
+
+@pytest.fixture(name="project")
+def fixture_project(
+    cppython_local_configuration: CPPythonLocalConfiguration, pep621_configuration: PEP621Configuration
+) -> PyProject:
+    """Parameterized construction of PyProject data
+    Args:
+        cppython_local_configuration: The parameterized cppython table
+        pep621_configuration: The project table
+    Returns:
+        All the data as one object
+    """
+
+    tool = ToolData(cppython=cppython_local_configuration)
+    return PyProject(project=pep621_configuration, tool=tool)
@@ -0,0 +1,145 @@
+"""Pruning of the variant matrix"""
+
+from collections.abc import Mapping, Sequence
+from enum import StrEnum
+from itertools import combinations
+from typing import Protocol
+
+import pytest
+
+
+class MatrixMode(StrEnum):
+    """How much of the variant matrix is run"""
+
+    FULL = "full"
+    PAIRWISE = "pairwise"
+    SMOKE = "smoke"
+
+
+# The session fixtures whose parameters form the variant matrix
+VARIANT_DIMENSIONS = (
+    "pep621_configuration",
+    "cppython_local_configuration",
+    "cppython_global_configuration",
+    "project_configuration",
+    "provider_type",
+    "generator_type",
+    "scm_type",
+)
+
+# Parameters that select the workspace, which together with the dimensions decide what session setup a test needs
+WORKSPACE_PARAMETERS = (
+    "internal_data_path",
+    "internal_plugin_data_path",
+)
+
+type Combination = tuple[tuple[str, int], ...]
+
+
+def _coverage(combination: Combination) -> set[Combination]:
+    """The single values and value pairs a combination covers
+
+    Args:
+        combination: Variant indices keyed by dimension
+
+    Returns:
+        The covered interactions
+    """
+
+    covered: set[Combination] = {(value,) for value in combination}
+    covered.update(combinations(combination, 2))
+    return covered
+
+
+def covering_subset(rows: Sequence[Combination]) -> list[int]:
+    """Greedily picks rows until every value and every pair of values that appears in 'rows' is covered
+
+    Args:
+        rows: The available combinations
+
+    Returns:
+        The indices of the picked rows, in their original order
+    """
+
+    coverages = [_coverage(row) for row in rows]
+    uncovered: set[Combination] = set().union(*coverages)
+    picked: list[int] = []
+
+    while uncovered:
+        best = max(range(len(rows)), key=lambda index: len(coverages[index] & uncovered))
+        picked.append(best)
+        uncovered -= coverages[best]
+
+    return sorted(picked)
+
+
+class CallSpec(Protocol):
+    """The parameter indices of one generated test, as held by pytest's call specifications"""
+
+    @property
+    def indices(self) -> Mapping[str, int]:
+        """The parameter indices by argument name"""
+        ...
+
+
+def prune_callspecs[C: CallSpec](callspecs: Sequence[C], mode: MatrixMode) -> list[C]:
+    """Picks the parametrizations of one test function that the matrix mode keeps
+
+    Parametrizations are grouped by any parameters outside the variant dimensions, so every group still runs at least
+    once. The pruning happens before the items are created, and '-k' or '-m' then select from what was kept, which
+    can drop combinations the pairwise subset relied on for coverage.
+
+    Args:
+        callspecs: The parametrizations of a test function
+        mode: The matrix mode
+
+    Returns:
+        The kept parametrizations, in their original order
+    """
+
+    if mode == MatrixMode.FULL:
+        return list(callspecs)
+
+    groups: dict[Combination, list[tuple[Combination, int]]] = {}
+    kept: set[int] = set()
+
+    for position, callspec in enumerate(callspecs):
+        indices = callspec.indices
+        variant = tuple(sorted((name, index) for name, index in indices.items() if name in VARIANT_DIMENSIONS))
+        other = tuple(sorted((name, index) for name, index in indices.items() if name not in VARIANT_DIMENSIONS))
+
+        groups.setdefault(other, []).append((variant, position))
+
+    for members in groups.values():
+        rows = [variant for variant, _ in members]
+
+        if mode == MatrixMode.SMOKE:
+            picked = [min(range(len(rows)), key=lambda index: rows[index])]
+        else:
+            picked = covering_subset(rows)
+
+        kept.update(members[index][1] for index in picked)
+
+    return [callspec for position, callspec in enumerate(callspecs) if position in kept]
+
+
+def variant_group(item: pytest.Item) -> str | None:
+    """Names the session setup an item needs, so pytest-xdist can keep items that share it on one worker
+
+    Args:
+        item: The collected item
+
+    Returns:
+        The group name, or None if the item doesn't use any variant
+    """
+
+    if (callspec := getattr(item, "callspec", None)) is None:
+        return None
+
+    indices: dict[str, int] = callspec.indices
+    names = [name for name in (*VARIANT_DIMENSIONS, *WORKSPACE_PARAMETERS) if name in indices]
+
+    if not names:
+        return None
+
+    return "cppython-" + ".".join(f"{name}{indices[name]}" for name in names)
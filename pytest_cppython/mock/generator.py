@@ -1,5 +1,6 @@
 """Shared definitions for testing."""
 
+from pathlib import Path
 from typing import Any
 
 from cppython_core.plugin_schema.generator import (
@@ -12,7 +13,11 @@ from pydantic import DirectoryPath
 
 
 class MockSyncData(SyncData):
-    """A Mock data type"""
+    """A Mock data type. The lists are empty unless a test needs a realistically sized payload"""
+
+    dependencies: list[str] = []
+    include_paths: list[Path] = []
+    targets: list[str] = []
 
 
 class MockGeneratorData(CPPythonModel):
@@ -1,6 +1,10 @@
 """Mock provider definitions"""
 
-from typing import Any
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Annotated, Any
 
 from cppython_core.plugin_schema.generator import SyncConsumer
 from cppython_core.plugin_schema.provider import (
@@ -9,13 +13,24 @@ from cppython_core.plugin_schema.provider import (
     SupportedProviderFeatures,
 )
 from cppython_core.schema import CorePluginData, CPPythonModel, Information, SyncData
-from pydantic import DirectoryPath
+from pydantic import DirectoryPath, Field
 
 from pytest_cppython.mock.generator import MockSyncData
 
+# The registry file the mock provider fetches its packages from
+MOCK_ARTIFACT = "mock-artifact"
+
 
 class MockProviderData(CPPythonModel):
-    """Dummy data"""
+    """Workload of the mock provider. The defaults do no work"""
+
+    package_count: Annotated[int, Field(alias="package-count", ge=0, description="Packages written per command")] = 0
+    artifact_size: Annotated[int, Field(alias="artifact-size", ge=0, description="Bytes written per package")] = 0
+    latency: Annotated[float, Field(ge=0, description="Seconds each package waits, like a registry round trip")] = 0
+    concurrency: Annotated[int, Field(ge=1, description="Packages processed at the same time")] = 1
+    registry: Annotated[
+        str | None, Field(description="Registry URL to fetch the packages from instead of generating them")
+    ] = None
 
 
 class MockProvider(Provider):
@@ -83,12 +98,35 @@ class MockProvider(Provider):
 
         return None
 
+    def _write_packages(self) -> None:
+        """Simulates a package manager by fetching and writing the configured packages into the install path"""
+
+        data = self.configuration_data
+        install_path = Path(self.core_data.cppython_data.install_path)
+        artifact = (bytes(range(256)) * (data.artifact_size // 256 + 1))[: data.artifact_size]
+
+        def write(index: int) -> None:
+            time.sleep(data.latency)
+
+            content = artifact
+
+            if data.registry is not None:
+                with urllib.request.urlopen(f"{data.registry}/files/{MOCK_ARTIFACT}", timeout=10) as response:
+                    content = response.read()
+
+            package = install_path / f"package-{index}"
+            package.mkdir(parents=True, exist_ok=True)
+            (package / "artifact.bin").write_bytes(content)
+
+        with ThreadPoolExecutor(max_workers=data.concurrency) as executor:
+            list(executor.map(write, range(data.package_count)))
+
     @classmethod
     async def download_tooling(cls, directory: DirectoryPath) -> None:
         cls.downloaded = directory
 
     def install(self) -> None:
-        pass
+        self._write_packages()
 
     def update(self) -> None:
-        pass
+        self._write_packages()
@@ -0,0 +1,80 @@
+"""Stage timing of the provider to generator sync pipeline"""
+
+import contextlib
+from collections.abc import Iterator
+from time import perf_counter
+
+import pytest
+
+# The report's column order. Stages outside this list are appended in the order they first ran
+PIPELINE_STAGES = ("resolve", "construct", "negotiate", "sync_data", "sync")
+
+
+class PipelineRecorder:
+    """Session wide per stage latencies of every pipeline run"""
+
+    def __init__(self) -> None:
+        self.runs: dict[str, dict[str, float]] = {}
+
+    def record(self, node_id: str, stage: str, elapsed: float) -> None:
+        """Adds the latency of one stage
+
+        Args:
+            node_id: The running test
+            stage: The stage name
+            elapsed: The stage's seconds
+        """
+
+        stages = self.runs.setdefault(node_id, {})
+        stages[stage] = stages.get(stage, 0.0) + elapsed
+
+    def report(self, terminal_reporter: pytest.TerminalReporter) -> None:
+        """Writes the stage table, slowest pipeline first
+
+        Args:
+            terminal_reporter: The reporter to write to
+        """
+
+        if not self.runs:
+            return
+
+        stages = list(PIPELINE_STAGES)
+
+        for timings in self.runs.values():
+            stages.extend(stage for stage in timings if stage not in stages)
+
+        terminal_reporter.write_sep("-", "cppython sync pipeline")
+        terminal_reporter.write_line(" ".join(f"{stage[:10]:>10}" for stage in stages) + f" {'total ms':>10}  test")
+
+        for node_id, timings in sorted(self.runs.items(), key=lambda entry: -sum(entry[1].values())):
+            cells = [f"{timings[stage] * 1000:>10.2f}" if stage in timings else f"{'-':>10}" for stage in stages]
+            terminal_reporter.write_line(" ".join(cells) + f" {sum(timings.values()) * 1000:>10.2f}  {node_id}")
+
+
+class SyncPipeline:
+    """Times the pipeline stages on behalf of a single test"""
+
+    def __init__(self, recorder: PipelineRecorder, node_id: str) -> None:
+        self.recorder = recorder
+        self.node_id = node_id
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Times the block as one pipeline stage
+
+        Args:
+            name: The stage name
+
+        Yields:
+            Control to the stage
+        """
+
+        start = perf_counter()
+
+        try:
+            yield
+        finally:
+            self.recorder.record(self.node_id, name, perf_counter() - start)
+
+
+pipeline_recorder_key = pytest.StashKey[PipelineRecorder]()
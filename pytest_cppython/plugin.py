@@ -1,255 +1,676 @@
 """Direct Fixtures"""
 
+import os
 import shutil
+import sys
+import time
+from collections.abc import Callable, Generator, Iterator
 from pathlib import Path
-from typing import cast
+from time import perf_counter
+from typing import TYPE_CHECKING, NoReturn, Protocol
 
 import pytest
-from cppython_core.plugin_schema.generator import Generator
-from cppython_core.plugin_schema.provider import Provider
-from cppython_core.plugin_schema.scm import SCM
-from cppython_core.resolution import (
-    PluginBuildData,
-    PluginCPPythonData,
-    resolve_cppython,
-    resolve_pep621,
-    resolve_project_configuration,
+
+from pytest_cppython.discovery import DirectoryScanner, directory_scanner_key
+from pytest_cppython.matrix import MatrixMode, prune_callspecs, variant_group
+from pytest_cppython.pipeline import (
+    PipelineRecorder,
+    SyncPipeline,
+    pipeline_recorder_key,
 )
-from cppython_core.schema import (
-    CoreData,
-    CPPythonData,
-    CPPythonGlobalConfiguration,
-    CPPythonLocalConfiguration,
-    PEP621Configuration,
-    PEP621Data,
-    ProjectConfiguration,
-    ProjectData,
-    PyProject,
-    ToolData,
+from pytest_cppython.profiling import FixtureProfiler
+
+# The fixtures and hooks import the modules they use, so loading the plugin stays cheap for every pytest session
+if TYPE_CHECKING:
+    import asyncio
+
+    from pytest_cppython.benchmark import Benchmark
+    from pytest_cppython.eventloop import EventLoopLag
+    from pytest_cppython.registry import RegistryServer
+    from pytest_cppython.repository import RepositoryFactory
+    from pytest_cppython.startup import StartupProfiler
+    from pytest_cppython.storage import WorkspaceStorage
+    from pytest_cppython.workspace import WorkspaceMaterializer
+
+# Holds the fixtures that need cppython_core, registered on first use
+FIXTURES_PLUGIN = "pytest_cppython.fixtures"
+
+# The fixtures of FIXTURES_PLUGIN, which resolve to placeholders until it is registered
+DEFERRED_FIXTURES = (
+    "resolution_cache",
+    "concurrency_probe",
+    "compatibility_index",
+    "tooling_manager",
+    "pep621_configuration",
+    "pep621_data",
+    "cppython_local_configuration",
+    "cppython_global_configuration",
+    "plugin_build_data",
+    "plugin_cppython_data",
+    "cppython_data",
+    "core_data",
+    "mutable_core_data",
+    "project_configuration",
+    "workspace_snapshot",
+    "project_data",
+    "project",
 )
 
-from pytest_cppython.variants import (
-    cppython_global_variants,
-    cppython_local_variants,
-    pep621_variants,
-    project_variants,
-)
+# The values of CloneStrategy and WorkspaceBackend, spelled out so registering the options doesn't import their modules
+CLONE_STRATEGIES = ("auto", "reflink", "hardlink", "copy")
+WORKSPACE_BACKENDS = ("disk", "memory")
 
+# Marks the benchmark test classes, which build large synthetic inputs and only run when requested
+BENCHMARK_MARKER = "cppython_benchmark"
+
+# When the session started, in nanoseconds since the epoch, so the tool cache keeps what the session used
+session_start_key = pytest.StashKey[int]()
+
+
+class Reporter(Protocol):
+    """Session state that reports its statistics at the end of the session"""
+
+    def report(self, terminal_reporter: pytest.TerminalReporter) -> None:
+        """Writes the statistics to the terminal
+
+        Args:
+            terminal_reporter: The terminal reporter
+        """
+        ...
+
+
+# The session state the fixtures created, in creation order
+session_reporters_key = pytest.StashKey[list[Reporter]]()
+
+
+def _session_state[T: Reporter](config: pytest.Config, key: pytest.StashKey[T], create: Callable[[], T]) -> T:
+    """The session state stored under a key, created by the first fixture that needs it
 
-@pytest.fixture(
-    name="install_path",
-    scope="session",
-)
-def fixture_install_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
-    """Creates temporary install location
     Args:
-        tmp_path_factory: Factory for centralized temporary directories
+        config: The pytest configuration
+        key: Where the state is stored
+        create: Creates the state
+
     Returns:
-        A temporary directory
+        The state
     """
-    path = tmp_path_factory.getbasetemp()
-    path.mkdir(parents=True, exist_ok=True)
-    return path
 
+    if key not in config.stash:
+        state = config.stash[key] = create()
+        config.stash.setdefault(session_reporters_key, []).append(state)
 
-@pytest.fixture(
-    name="pep621_configuration",
-    scope="session",
-    params=pep621_variants,
-)
-def fixture_pep621_configuration(request: pytest.FixtureRequest) -> PEP621Configuration:
-    """Fixture defining all testable variations of PEP621
+    return config.stash[key]
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Registers the plugin's command line options
+
+    Args:
+        parser: The pytest option parser
+    """
+
+    group = parser.getgroup("cppython")
+    group.addoption(
+        "--cppython-workspace-clone",
+        choices=CLONE_STRATEGIES,
+        default="auto",
+        help=(
+            "How project workspaces are cloned from their template. 'hardlink' shares contents with it. Without"
+            " reflink support, 'auto' copies every workspace in full, plus one more full copy for the template"
+        ),
+    )
+    group.addoption(
+        "--cppython-workspace-backend",
+        choices=WORKSPACE_BACKENDS,
+        default="disk",
+        help="Create workspaces and the install path on a RAM backed filesystem such as /dev/shm, when one exists",
+    )
+    group.addoption(
+        "--cppython-workspace-memory-size",
+        type=int,
+        default=1024,
+        metavar="MIB",
+        help="Create further workspaces on disk once the session uses MIB mebibytes of memory",
+    )
+    group.addoption(
+        "--cppython-persistent-cache",
+        action="store_true",
+        default=False,
+        help="Reuse the project and PEP 621 data resolved in previous sessions via the pytest cache",
+    )
+    group.addoption(
+        "--cppython-matrix",
+        choices=[mode.value for mode in MatrixMode],
+        default=MatrixMode.FULL.value,
+        help=(
+            "Run every variant combination, a pairwise covering subset, or a single combination per test. The matrix"
+            " is pruned as tests are generated, so '-k' and '-m' select from the kept combinations"
+        ),
+    )
+    group.addoption(
+        "--cppython-no-xdist-group",
+        action="store_true",
+        default=False,
+        help="Don't switch pytest-xdist's load distribution to variant grouped 'loadgroup' distribution",
+    )
+    group.addoption(
+        "--cppython-profile",
+        nargs="?",
+        const="cppython-profile.folded",
+        default=None,
+        metavar="PATH",
+        help="Time the CPPython fixtures per variant and write collapsed stacks to PATH",
+    )
+    group.addoption(
+        "--cppython-tool-cache",
+        default=None,
+        metavar="DIRECTORY",
+        help="Keep provider tooling downloads in DIRECTORY between sessions instead of downloading them every session",
+    )
+    group.addoption(
+        "--cppython-tool-cache-size",
+        type=int,
+        default=None,
+        metavar="MIB",
+        help=(
+            "At the end of the session, evict the least recently used tooling the session didn't use until the tool"
+            " cache fits in MIB mebibytes"
+        ),
+    )
+    group.addoption(
+        "--cppython-benchmarks",
+        action="store_true",
+        default=False,
+        help="Run the benchmark test classes, which are skipped by default",
+    )
+    group.addoption(
+        "--cppython-benchmark-rounds",
+        type=int,
+        default=5,
+        help="How many times each benchmarked plugin operation runs",
+    )
+    group.addoption(
+        "--cppython-benchmark-threshold",
+        type=float,
+        default=0.25,
+        help="Relative median slowdown against the stored baseline that fails a benchmark",
+    )
+    group.addoption(
+        "--cppython-benchmark-update",
+        action="store_true",
+        default=False,
+        help="Replace the stored benchmark baselines instead of comparing against them",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Creates the session wide plugin state
 
     Args:
-        request: Parameterization list
+        config: The pytest configuration
+    """
+
+    config.addinivalue_line(
+        "markers", f"{BENCHMARK_MARKER}: benchmark test, skipped unless --cppython-benchmarks is given"
+    )
+
+    # Keep tests that share session fixtures on one worker, so workers only set up the variants they run
+    if config.getoption("dist", "no") == "load" and not config.getoption("cppython_no_xdist_group"):
+        config.option.dist = "loadgroup"
+
+    if (profile := config.getoption("cppython_profile")) is not None:
+        output = config.invocation_params.dir / profile
+
+        # pytest-xdist workers each profile their own share of the session
+        if hasattr(config, "workerinput"):
+            output = output.with_name(f"{output.stem}.{config.workerinput['workerid']}{output.suffix}")
+        config.pluginmanager.register(FixtureProfiler(output), "cppython-profiler")
+
+    config.stash[session_start_key] = time.time_ns()
+    config.stash[directory_scanner_key] = DirectoryScanner()
+    config.stash[pipeline_recorder_key] = PipelineRecorder()
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter, config: pytest.Config) -> None:
+    """Reports the plugin statistics at the end of the session
+
+    Args:
+        terminalreporter: The terminal reporter
+        config: The pytest configuration
+    """
+
+    config.stash[directory_scanner_key].report(terminalreporter)
+
+    for reporter in config.stash.get(session_reporters_key, []):
+        reporter.report(terminalreporter)
+
+    config.stash[pipeline_recorder_key].report(terminalreporter)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Releases the RAM backed root and evicts the tool cache once every pytest-xdist worker is done with them.
+    Runs after the session fixtures of an interrupted session are torn down
+
+    Args:
+        session: The pytest session
+    """
+
+    config = session.config
+
+    if hasattr(config, "workerinput"):
+        return
+
+    if config.getoption("cppython_workspace_backend") == "memory":
+        from pytest_cppython.storage import WorkspaceBackend, WorkspaceStorage
+
+        # The workers' base directories are below this one, which they pass to 'open'
+        WorkspaceStorage(WorkspaceBackend.MEMORY).remove(config._tmp_path_factory.getbasetemp())
+
+    directory = config.getoption("cppython_tool_cache")
+    size = config.getoption("cppython_tool_cache_size")
+
+    if directory is None or size is None:
+        return
+
+    # The tooling module needs cppython_core, which only sessions that use the tool cache have
+    from pytest_cppython.tooling import ToolCache
+
+    ToolCache(config.invocation_params.dir / directory, size * 2**20).evict(config.stash[session_start_key])
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skips the benchmarks unless requested and groups items for pytest-xdist
+
+    Args:
+        config: The pytest configuration
+        items: The collected test items
+    """
+
+    if not config.getoption("cppython_benchmarks"):
+        skip = pytest.mark.skip(reason="benchmarks only run with --cppython-benchmarks")
+
+        for item in items:
+            if item.get_closest_marker(BENCHMARK_MARKER) is not None:
+                item.add_marker(skip)
+
+    # Runs before pytest-xdist turns the groups into node ID suffixes
+    if config.getoption("loadgroup", False):
+        for item in items:
+            if item.get_closest_marker("xdist_group") is None and (group := variant_group(item)) is not None:
+                item.add_marker(pytest.mark.xdist_group(name=group))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pycollect_makeitem(collector: pytest.Module | pytest.Class) -> None:
+    """Registers the CPPython data fixtures once a collected test module has imported cppython_core
+
+    Args:
+        collector: The module or class being collected
+    """
+
+    plugin_manager = collector.config.pluginmanager
+
+    # The fixtures are parsed on registration, before any test function of the module is created
+    if "cppython_core" in sys.modules and not plugin_manager.has_plugin(FIXTURES_PLUGIN):
+        plugin_manager.import_plugin(FIXTURES_PLUGIN)
+
+
+def _deferred_fixture(name: str) -> Callable[[pytest.FixtureRequest], NoReturn]:
+    """Creates the placeholder of a FIXTURES_PLUGIN fixture, so tests can request it before cppython_core is imported
+
+    Args:
+        name: The fixture name
 
     Returns:
-        PEP621 variant
+        The placeholder fixture
     """
 
-    return cast(PEP621Configuration, request.param)
+    @pytest.fixture(name=name, scope="session")
+    def fixture(request: pytest.FixtureRequest) -> NoReturn:
+        """Stands in for the real fixture, which replaces it once the test that requests it is generated
 
+        Args:
+            request: The fixture request, used to register the real fixtures
+
+        Raises:
+            pytest.fail: The fixture was only requested with 'request.getfixturevalue'
+        """
+
+        request.config.pluginmanager.import_plugin(FIXTURES_PLUGIN)
+        pytest.fail(f"'{name}' was requested dynamically before the CPPython fixtures were registered")
+
+    return fixture
+
+
+fixture_resolution_cache = _deferred_fixture("resolution_cache")
+fixture_concurrency_probe = _deferred_fixture("concurrency_probe")
+fixture_compatibility_index = _deferred_fixture("compatibility_index")
+fixture_tooling_manager = _deferred_fixture("tooling_manager")
+fixture_pep621_configuration = _deferred_fixture("pep621_configuration")
+fixture_pep621_data = _deferred_fixture("pep621_data")
+fixture_cppython_local_configuration = _deferred_fixture("cppython_local_configuration")
+fixture_cppython_global_configuration = _deferred_fixture("cppython_global_configuration")
+fixture_plugin_build_data = _deferred_fixture("plugin_build_data")
+fixture_plugin_cppython_data = _deferred_fixture("plugin_cppython_data")
+fixture_cppython_data = _deferred_fixture("cppython_data")
+fixture_core_data = _deferred_fixture("core_data")
+fixture_mutable_core_data = _deferred_fixture("mutable_core_data")
+fixture_project_configuration = _deferred_fixture("project_configuration")
+fixture_workspace_snapshot = _deferred_fixture("workspace_snapshot")
+fixture_project_data = _deferred_fixture("project_data")
+fixture_project = _deferred_fixture("project")
+
+
+def _resolve_deferred_fixtures(metafunc: pytest.Metafunc) -> None:
+    """Registers the real fixtures when a test requests a placeholder, and resolves its fixture closure again
+
+    Args:
+        metafunc: The test function being generated
+    """
+
+    # A closure resolved after the registration holds the real fixture below any override of it
+    placeholders = [
+        name
+        for name in metafunc.fixturenames
+        if name in DEFERRED_FIXTURES
+        and all(definition.func.__module__ != FIXTURES_PLUGIN for definition in metafunc._arg2fixturedefs[name])
+    ]
+
+    if not placeholders:
+        return
+
+    plugin_manager = metafunc.config.pluginmanager
+
+    if not plugin_manager.has_plugin(FIXTURES_PLUGIN):
+        plugin_manager.import_plugin(FIXTURES_PLUGIN)
+
+    # The closure is shared with the items created from this call, so update it in place
+    fixture_manager = metafunc.definition.session._fixturemanager
+    resolved = fixture_manager.getfixtureinfo(metafunc.definition, metafunc.function, metafunc.cls)
+    metafunc.fixturenames[:] = resolved.names_closure
+    metafunc._arg2fixturedefs.clear()
+    metafunc._arg2fixturedefs.update(resolved.name2fixturedefs)
 
-@pytest.fixture(
-    name="pep621_data",
-    scope="session",
-)
-def fixture_pep621_data(
-    pep621_configuration: PEP621Configuration, project_configuration: ProjectConfiguration
-) -> PEP621Data:
-    """Resolved project table fixture
+
+@pytest.fixture(name="cppython_benchmark")
+def fixture_cppython_benchmark(request: pytest.FixtureRequest) -> "Benchmark":
+    """Measures plugin operations and compares them against the baselines of earlier sessions
 
     Args:
-        pep621_configuration: The input configuration to resolve
-        project_configuration: The project configuration to help with the resolve
+        request: The fixture request, used to identify the test
 
     Returns:
-        The resolved project table
+        The benchmark runner for the requesting test
     """
 
-    return resolve_pep621(pep621_configuration, project_configuration, None)
+    from pytest_cppython.benchmark import (
+        Benchmark,
+        BenchmarkRecorder,
+        benchmark_recorder_key,
+    )
 
+    config = request.config
+
+    # The cache is missing when the cacheprovider plugin is disabled, benchmarks then run without baselines
+    recorder = _session_state(
+        config,
+        benchmark_recorder_key,
+        lambda: BenchmarkRecorder(
+            getattr(config, "cache", None),
+            config.getoption("cppython_benchmark_rounds"),
+            config.getoption("cppython_benchmark_threshold"),
+            config.getoption("cppython_benchmark_update"),
+        ),
+    )
 
-@pytest.fixture(
-    name="cppython_local_configuration",
-    scope="session",
-    params=cppython_local_variants,
-)
-def fixture_cppython_local_configuration(
-    request: pytest.FixtureRequest, install_path: Path
-) -> CPPythonLocalConfiguration:
-    """Fixture defining all testable variations of CPPythonData
+    return Benchmark(recorder, request.node.nodeid)
+
+
+@pytest.fixture(name="event_loop_runner", scope="session")
+def fixture_event_loop_runner() -> Iterator["asyncio.Runner"]:
+    """The one event loop that runs every plugin coroutine of the session
+
+    Yields:
+        The runner owning the loop
+    """
+
+    import asyncio
+
+    with asyncio.Runner() as runner:
+        yield runner
+
+
+@pytest.fixture(name="event_loop_lag")
+def fixture_event_loop_lag(request: pytest.FixtureRequest) -> "EventLoopLag":
+    """Measures how long plugin coroutines keep the session event loop from running other work
 
     Args:
-        request: Parameterization list
-        install_path: The temporary install directory
+        request: The fixture request, used to identify the test
 
     Returns:
-        Variation of CPPython data
+        The lag probe for the requesting test
     """
-    cppython_local_configuration = cast(CPPythonLocalConfiguration, request.param)
 
-    data = cppython_local_configuration.model_dump(by_alias=True)
+    from pytest_cppython.eventloop import (
+        EventLoopLag,
+        EventLoopLagRecorder,
+        event_loop_lag_key,
+    )
 
-    # Pin the install location to the base temporary directory
-    data["install-path"] = install_path
+    recorder = _session_state(request.config, event_loop_lag_key, EventLoopLagRecorder)
 
-    # Fill the plugin names with mocked values
-    data["provider-name"] = "mock"
-    data["generator-name"] = "mock"
+    return EventLoopLag(recorder, request.node.nodeid)
 
-    return CPPythonLocalConfiguration(**data)
 
+@pytest.fixture(name="concurrency", scope="session")
+def fixture_concurrency() -> int:
+    """The largest number of simultaneous workers in the concurrency tests
+
+    Returns:
+        The worker count
+    """
+
+    return min(os.cpu_count() or 1, 8)
+
+
+@pytest.fixture(name="concurrency_calls", scope="session")
+def fixture_concurrency_calls() -> int:
+    """The number of calls made at every worker count of a scaling curve
+
+    Returns:
+        The call count
+    """
+
+    return 64
 
-@pytest.fixture(
-    name="cppython_global_configuration",
-    scope="session",
-    params=cppython_global_variants,
-)
-def fixture_cppython_global_configuration(request: pytest.FixtureRequest) -> CPPythonGlobalConfiguration:
-    """Fixture defining all testable variations of CPPythonData
+
+@pytest.fixture(name="startup_profiler")
+def fixture_startup_profiler(request: pytest.FixtureRequest) -> "StartupProfiler":
+    """Loads entry points in fresh interpreters and measures their imports
 
     Args:
-        request: Parameterization list
+        request: The fixture request, used to identify the test
 
     Returns:
-        Variation of CPPython data
+        The profiler for the requesting test
     """
-    cppython_global_configuration = cast(CPPythonGlobalConfiguration, request.param)
 
-    return cppython_global_configuration
+    from pytest_cppython.startup import (
+        StartupProfiler,
+        StartupRecorder,
+        startup_recorder_key,
+    )
 
+    recorder = _session_state(request.config, startup_recorder_key, StartupRecorder)
 
-@pytest.fixture(
-    name="plugin_build_data",
-    scope="session",
-)
-def fixture_plugin_build_data(
-    provider_type: type[Provider],
-    generator_type: type[Generator],
-    scm_type: type[SCM],
-) -> PluginBuildData:
-    """Fixture for constructing resolved CPPython table data
+    return StartupProfiler(recorder, request.node.nodeid)
+
+
+@pytest.fixture(name="package_registry", scope="session")
+def fixture_package_registry(tmp_path_factory: pytest.TempPathFactory) -> Iterator["RegistryServer"]:
+    """A local HTTP registry to point provider plugins at instead of the network
+
+    Args:
+        tmp_path_factory: Factory for centralized temporary directories
+
+    Yields:
+        The running registry. Tests add artifacts to its store and adjust its latency and bandwidth
+    """
+
+    from pytest_cppython.registry import RegistryServer
+
+    with RegistryServer(tmp_path_factory.mktemp("registry-")) as server:
+        yield server
+
+
+@pytest.fixture(name="sync_pipeline")
+def fixture_sync_pipeline(request: pytest.FixtureRequest) -> SyncPipeline:
+    """Times the stages of a provider to generator sync
 
     Args:
-        provider_type: The provider type
-        generator_type: The generator type
-        scm_type: The scm type
+        request: The fixture request, used to identify the test
 
     Returns:
-        The plugin build data
+        The stage timer for the requesting test
     """
 
-    return PluginBuildData(generator_type=generator_type, provider_type=provider_type, scm_type=scm_type)
+    return SyncPipeline(request.config.stash[pipeline_recorder_key], request.node.nodeid)
 
 
-@pytest.fixture(
-    name="plugin_cppython_data",
-    scope="session",
-)
-def fixture_plugin_cppython_data(
-    provider_type: type[Provider],
-    generator_type: type[Generator],
-    scm_type: type[SCM],
-) -> PluginCPPythonData:
-    """Fixture for constructing resolved CPPython table data
+@pytest.fixture(name="git_repository_factory", scope="session")
+def fixture_git_repository_factory(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> "RepositoryFactory":
+    """Builds synthetic git repositories, kept in the pytest cache between sessions
 
     Args:
-        provider_type: The provider type
-        generator_type: The generator type
-        scm_type: The scm type
+        request: The fixture request, used to reach the pytest cache
+        tmp_path_factory: Factory for centralized temporary directories, used when the cache is disabled
 
     Returns:
-        The plugin data for CPPython resolution
+        The repository factory
     """
 
-    return PluginCPPythonData(
-        generator_name=generator_type.name(), provider_name=provider_type.name(), scm_name=scm_type.name()
-    )
+    from pytest_cppython.repository import RepositoryFactory
 
+    if shutil.which("git") is None:
+        pytest.skip("git isn't installed")
+
+    cache = getattr(request.config, "cache", None)
+    root = cache.mkdir("cppython-repositories") if cache is not None else tmp_path_factory.mktemp("repositories-")
+
+    return RepositoryFactory(root)
 
-@pytest.fixture(
-    name="cppython_data",
-    scope="session",
-)
-def fixture_cppython_data(
-    cppython_local_configuration: CPPythonLocalConfiguration,
-    cppython_global_configuration: CPPythonGlobalConfiguration,
-    project_data: ProjectData,
-    plugin_cppython_data: PluginCPPythonData,
-) -> CPPythonData:
-    """Fixture for constructing resolved CPPython table data
+
+def _session_directory(request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """The temporary directory shared by every process of the session
 
     Args:
-        cppython_local_configuration: The local configuration to resolve
-        cppython_global_configuration: The global configuration to resolve
-        project_data: The project data to help with the resolve
-        plugin_cppython_data: Plugin data for CPPython resolution
+        request: The fixture request, used to detect pytest-xdist workers
+        tmp_path_factory: Factory for centralized temporary directories
 
     Returns:
-        The resolved CPPython table
+        The directory
     """
 
-    return resolve_cppython(
-        cppython_local_configuration, cppython_global_configuration, project_data, plugin_cppython_data
+    path = tmp_path_factory.getbasetemp()
+
+    # pytest-xdist gives each worker its own base directory. Share the parent so tooling is only installed once
+    if hasattr(request.config, "workerinput"):
+        path = path.parent
+
+    return path
+
+
+@pytest.fixture(name="workspace_storage", scope="session")
+def fixture_workspace_storage(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> Iterator["WorkspaceStorage"]:
+    """Places the workspaces on the selected backend, releasing the memory they used at the end of the session
+
+    Args:
+        request: The fixture request, used to reach the session state and detect pytest-xdist workers
+        tmp_path_factory: Factory for centralized temporary directories, probed against memory
+
+    Yields:
+        The workspace storage
+    """
+
+    from pytest_cppython.storage import (
+        WorkspaceBackend,
+        WorkspaceStorage,
+        workspace_storage_key,
     )
 
+    config = request.config
+    storage = _session_state(
+        config,
+        workspace_storage_key,
+        lambda: WorkspaceStorage(
+            WorkspaceBackend(config.getoption("cppython_workspace_backend")),
+            config.getoption("cppython_workspace_memory_size") * 2**20,
+        ),
+    )
+    worker = request.config.workerinput["workerid"] if hasattr(request.config, "workerinput") else None
+    storage.open(_session_directory(request, tmp_path_factory), worker)
+
+    yield storage
+
+    storage.close()
+
 
 @pytest.fixture(
-    name="core_data",
+    name="install_path",
+    scope="session",
 )
-def fixture_core_data(cppython_data: CPPythonData, project_data: ProjectData) -> CoreData:
-    """Fixture for creating the wrapper CoreData type
-
+def fixture_install_path(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory, workspace_storage: "WorkspaceStorage"
+) -> Path:
+    """Creates temporary install location
     Args:
-        cppython_data: CPPython data
-        project_data: The project data
-
+        request: The fixture request, used to detect pytest-xdist workers
+        tmp_path_factory: Factory for centralized temporary directories
+        workspace_storage: Provides the RAM backed root when the memory backend is selected
     Returns:
-        Wrapper Core Type
+        A temporary directory
     """
 
-    return CoreData(cppython_data=cppython_data, project_data=project_data)
+    # The workspaces are created below the root, where the persistent cache expects them. The pytest-xdist workers
+    # share it like the disk directory
+    if workspace_storage.root is not None:
+        return workspace_storage.root
+
+    path = _session_directory(request, tmp_path_factory)
+    path.mkdir(parents=True, exist_ok=True)
+
+    return path
 
 
-def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
-    """Called for each test function
+@pytest.hookimpl(wrapper=True)
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> Generator[None, None, None]:
+    """Called for each test function. Parametrizes the data directories and prunes the variant matrix
 
     Args:
         metafunc: Pytest hook data
+
+    Yields:
+        Control to the other implementations, which parametrize the variant fixtures
     """
 
+    _resolve_deferred_fixtures(metafunc)
+
+    start = perf_counter()
+    scanner = metafunc.config.stash[directory_scanner_key]
+
     for fixture in metafunc.fixturenames:
         match fixture.split("_", 1):
             case ["internal", "plugin_data_path"]:
                 # There should only ever be one fixture named 'internal_plugin_data_path' for value caching
                 data_path = metafunc.config.rootpath / "tests" / "data"
 
-                test_paths: list[Path | None] = []
-
-                for path in data_path.glob("*"):
-                    if path.is_dir():
-                        test_paths.append(path)
+                test_paths: list[Path | None] = list(scanner.subdirectories(data_path))
 
                 if not test_paths:
                     test_paths = [None]
@@ -258,12 +679,20 @@ def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
             case ["internal", "data_path"]:
                 # There should only ever be one fixture named 'internal_data_path' for value caching
                 data_path = Path(__file__).parent / "data"
-                metafunc.parametrize(fixture, list(data_path.glob("*")), scope="session")
+                metafunc.parametrize(fixture, scanner.children(data_path), scope="session")
 
             case ["build", directory]:
                 data_path = metafunc.config.rootpath / "tests" / "build" / directory
                 metafunc.parametrize(fixture, [data_path], scope="session")
 
+    scanner.record(start)
+
+    yield
+
+    # The variant fixtures are parametrized now, prune their product before pytest creates an item for each call
+    if (mode := MatrixMode(metafunc.config.getoption("cppython_matrix"))) is not MatrixMode.FULL:
+        metafunc._calls[:] = prune_callspecs(metafunc._calls, mode)
+
 
 @pytest.fixture(name="plugin_data_path", scope="session")
 def fixture_plugin_data_path(internal_plugin_data_path: list[Path | None]) -> list[Path | None]:
@@ -293,73 +722,22 @@ def fixture_data_path(internal_data_path: list[Path]) -> list[Path]:
     return internal_data_path
 
 
-@pytest.fixture(
-    name="project_configuration",
-    scope="session",
-    params=project_variants,
-)
-def fixture_project_configuration(
-    request: pytest.FixtureRequest,
-    tmp_path_factory: pytest.TempPathFactory,
-    data_path: Path,
-    plugin_data_path: Path | None,
-) -> ProjectConfiguration:
-    """Project configuration fixture
+@pytest.fixture(name="workspace_materializer", scope="session")
+def fixture_workspace_materializer(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory, workspace_storage: "WorkspaceStorage"
+) -> "WorkspaceMaterializer":
+    """Session wide materializer so each data directory pair is only copied once
 
     Args:
-        request: Parameterized configuration data
+        request: The fixture request, used to read the clone option
         tmp_path_factory: Factory for centralized temporary directories
-        data_path: Project file requirements
-        plugin_data_path: Parameterized path to a data directory
+        workspace_storage: Where the templates and workspaces are created
 
     Returns:
-        Configuration with temporary directory capabilities
+        The workspace materializer
     """
 
-    tmp_path = tmp_path_factory.mktemp("workspace-")
-
-    shutil.copytree(data_path, tmp_path, dirs_exist_ok=True)
-
-    if plugin_data_path is not None:
-        shutil.copytree(plugin_data_path, tmp_path, dirs_exist_ok=True)
-
-    configuration = cast(ProjectConfiguration, request.param)
-
-    # Pin the project location
-    paths = list(tmp_path.rglob("pyproject.toml"))
-
-    # 'paths' length guaranteed to be 1
-    configuration.pyproject_file = paths[0].resolve()
-
-    return configuration
-
-
-@pytest.fixture(
-    name="project_data",
-    scope="session",
-)
-def fixture_project_data(project_configuration: ProjectConfiguration) -> ProjectData:
-    """Fixture that creates a project space at 'workspace/test_project/pyproject.toml'
-    Args:
-        project_configuration: Project data
-    Returns:
-        A project data object that has populated a function level temporary directory
-    """
-
-    return resolve_project_configuration(project_configuration)
-
-
-@pytest.fixture(name="project")
-def fixture_project(
-    cppython_local_configuration: CPPythonLocalConfiguration, pep621_configuration: PEP621Configuration
-) -> PyProject:
-    """Parameterized construction of PyProject data
-    Args:
-        cppython_local_configuration: The parameterized cppython table
-        pep621_configuration: The project table
-    Returns:
-        All the data as one object
-    """
+    from pytest_cppython.workspace import CloneStrategy, WorkspaceMaterializer
 
-    tool = ToolData(cppython=cppython_local_configuration)
-    return PyProject(project=pep621_configuration, tool=tool)
+    strategy = CloneStrategy(request.config.getoption("cppython_workspace_clone"))
+    return WorkspaceMaterializer(tmp_path_factory, strategy, workspace_storage)
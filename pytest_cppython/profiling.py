@@ -0,0 +1,107 @@
+"""Setup profiling of the CPPython fixture graph"""
+
+from collections import defaultdict
+from collections.abc import Generator
+from pathlib import Path
+from statistics import fmean
+from time import perf_counter
+
+import pytest
+
+from pytest_cppython.matrix import variant_group
+
+# Fixtures are profiled when they are defined by one of these modules
+PROFILED_MODULES = (
+    "pytest_cppython.plugin",
+    "pytest_cppython.fixtures",
+    "pytest_cppython.shared",
+    "pytest_cppython.tests",
+)
+
+
+class FixtureProfiler:
+    """Pytest plugin that times every CPPython fixture setup, keyed by the variant being set up"""
+
+    def __init__(self, output: Path) -> None:
+        self.output = output
+        self.timings: defaultdict[tuple[str, str], list[float]] = defaultdict(list)
+        self._variant = "default"
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_setup(self, item: pytest.Item) -> Generator[None, None, None]:
+        """Tracks which variant the fixtures being set up belong to
+
+        Args:
+            item: The item being set up
+
+        Yields:
+            Control to the setup
+        """
+
+        self._variant = variant_group(item) or "default"
+
+        try:
+            yield
+        finally:
+            self._variant = "default"
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_fixture_setup(
+        self, fixturedef: pytest.FixtureDef[object], request: pytest.FixtureRequest
+    ) -> Generator[None, object, object]:
+        """Times a fixture setup
+
+        Args:
+            fixturedef: The fixture being set up
+            request: The fixture request
+
+        Yields:
+            Control to the setup
+
+        Returns:
+            The fixture value
+        """
+
+        if getattr(fixturedef.func, "__module__", None) not in PROFILED_MODULES:
+            return (yield)
+
+        start = perf_counter()
+
+        try:
+            return (yield)
+        finally:
+            self.timings[(fixturedef.argname, self._variant)].append(perf_counter() - start)
+
+    def pytest_terminal_summary(self, terminalreporter: pytest.TerminalReporter) -> None:
+        """Writes the timing table, slowest fixtures first
+
+        Args:
+            terminalreporter: The terminal reporter
+        """
+
+        if not self.timings:
+            return
+
+        terminalreporter.write_sep("-", "cppython fixture profile")
+        terminalreporter.write_line(f"{'total ms':>10} {'mean ms':>10} {'calls':>6}  fixture [variant]")
+
+        for (fixture, variant), timings in sorted(self.timings.items(), key=lambda entry: -sum(entry[1])):
+            terminalreporter.write_line(
+                f"{sum(timings) * 1000:>10.2f} {fmean(timings) * 1000:>10.2f} {len(timings):>6}  {fixture} [{variant}]"
+            )
+
+        terminalreporter.write_line(f"collapsed stacks written to {self.output}")
+
+    def pytest_sessionfinish(self) -> None:
+        """Writes the timings as collapsed stacks in microseconds, the input format of flame graph tools"""
+
+        if not self.timings:
+            return
+
+        lines = [
+            f"cppython;{variant};{fixture} {round(sum(timings) * 1_000_000)}"
+            for (fixture, variant), timings in sorted(self.timings.items())
+        ]
+
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+        self.output.write_text("\n".join(lines) + "\n", encoding="utf-8")
@@ -0,0 +1,308 @@
+"""A local stand-in for package and tooling registries"""
+
+import hashlib
+import re
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import TracebackType
+from typing import Self, cast
+
+# Bytes written between bandwidth checks
+_CHUNK_SIZE = 64 * 1024
+
+_RANGE_PATTERN = re.compile(r"bytes=(\d*)-(\d*)$")
+
+
+class ArtifactStore:
+    """Content addressed storage of artifacts, with optional names for tooling style lookups"""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.names: dict[str, str] = {}
+
+    def add(self, data: bytes, name: str | None = None) -> str:
+        """Stores an artifact
+
+        Args:
+            data: The artifact content
+            name: An optional name the artifact can also be fetched by
+
+        Returns:
+            The SHA-256 digest that addresses the artifact
+        """
+
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path(digest)
+
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+
+        if name is not None:
+            self.names[name] = digest
+
+        return digest
+
+    def path(self, digest: str) -> Path:
+        """The location of an artifact
+
+        Args:
+            digest: The artifact digest
+
+        Returns:
+            The path, which may not exist
+        """
+
+        return self.root / digest[:2] / digest
+
+    def resolve(self, request_path: str) -> tuple[str, Path] | None:
+        """Maps a request path to an artifact
+
+        Args:
+            request_path: '/artifacts/<digest>' or '/files/<name>'
+
+        Returns:
+            The digest and path of the artifact, or None if there is no such artifact
+        """
+
+        match request_path.split("?", 1)[0].strip("/").split("/", 1):
+            case ["artifacts", digest] if re.fullmatch(r"[0-9a-f]{64}", digest):
+                pass
+            case ["files", name] if name in self.names:
+                digest = self.names[name]
+            case _:
+                return None
+
+        path = self.path(digest)
+        return (digest, path) if path.is_file() else None
+
+
+class _RegistryHTTPServer(ThreadingHTTPServer):
+    """The HTTP server, holding the state its request handlers need"""
+
+    daemon_threads = True
+
+    def __init__(self, store: ArtifactStore) -> None:
+        super().__init__(("127.0.0.1", 0), _RegistryRequestHandler)
+        self.store = store
+        self.latency = 0.0
+        self.bandwidth: int | None = None
+        self.requests = 0
+        self.bytes_sent = 0
+        self.lock = threading.Lock()
+
+
+class _RegistryRequestHandler(BaseHTTPRequestHandler):
+    """Serves artifacts with ETag revalidation and single range requests for resumed downloads"""
+
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def registry(self) -> _RegistryHTTPServer:
+        """The owning server"""
+        return cast(_RegistryHTTPServer, self.server)
+
+    def log_message(self, format: str, *args: object) -> None:  # pylint: disable=redefined-builtin
+        """Keeps the test output clean
+
+        Args:
+            format: The message format
+            args: The message arguments
+        """
+
+    def do_HEAD(self) -> None:  # pylint: disable=invalid-name
+        """Answers a HEAD request"""
+        self._serve(send_body=False)
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Answers a GET request"""
+        self._serve(send_body=True)
+
+    def _serve(self, send_body: bool) -> None:
+        """Answers a request
+
+        Args:
+            send_body: Whether the artifact content is sent
+        """
+
+        registry = self.registry
+
+        with registry.lock:
+            registry.requests += 1
+
+        time.sleep(registry.latency)
+
+        if (artifact := registry.store.resolve(self.path)) is None:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+
+        digest, path = artifact
+        etag = f'"{digest}"'
+        size = path.stat().st_size
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        start, end = 0, size - 1
+        status = HTTPStatus.OK
+
+        if (requested := self.headers.get("Range")) is not None and (match := _RANGE_PATTERN.match(requested)):
+            first, last = match.groups()
+
+            if first:
+                start = int(first)
+                end = min(int(last), size - 1) if last else size - 1
+            elif last:
+                start = max(size - int(last), 0)
+
+            if start > end:
+                self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            status = HTTPStatus.PARTIAL_CONTENT
+
+        self.send_response(status)
+        self.send_header("ETag", etag)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(end - start + 1))
+
+        if status == HTTPStatus.PARTIAL_CONTENT:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+
+        self.end_headers()
+
+        if send_body:
+            self._send_content(path, start, end - start + 1)
+
+    def _send_content(self, path: Path, offset: int, length: int) -> None:
+        """Streams part of an artifact, throttled to the server's bandwidth
+
+        Args:
+            path: The artifact
+            offset: The first byte
+            length: The number of bytes
+        """
+
+        registry = self.registry
+
+        with path.open("rb") as file:
+            file.seek(offset)
+
+            while length > 0:
+                chunk = file.read(min(_CHUNK_SIZE, length))
+
+                if not chunk:
+                    break
+
+                # Pace before writing, so the client can't finish reading before the throttle applies
+                if registry.bandwidth:
+                    time.sleep(len(chunk) / registry.bandwidth)
+
+                self.wfile.write(chunk)
+                length -= len(chunk)
+
+                with registry.lock:
+                    registry.bytes_sent += len(chunk)
+
+
+class RegistryServer:
+    """An in-process HTTP registry serving an artifact store.
+
+    'latency' (seconds per request) and 'bandwidth' (bytes per second, None for unlimited) can be changed while
+    the server runs. 'requests' and 'bytes_sent' let tests check caching and resumption behavior
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.store = ArtifactStore(root)
+        self._server = _RegistryHTTPServer(self.store)
+        self._thread = threading.Thread(target=self._server.serve_forever, name="cppython-registry", daemon=True)
+
+    @property
+    def url(self) -> str:
+        """The base URL, without a trailing slash"""
+
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    @property
+    def latency(self) -> float:
+        """Seconds every request waits before it is answered"""
+        return self._server.latency
+
+    @latency.setter
+    def latency(self, value: float) -> None:
+        self._server.latency = value
+
+    @property
+    def bandwidth(self) -> int | None:
+        """Bytes per second each response is throttled to, or None for unlimited"""
+        return self._server.bandwidth
+
+    @bandwidth.setter
+    def bandwidth(self, value: int | None) -> None:
+        self._server.bandwidth = value
+
+    @property
+    def requests(self) -> int:
+        """The number of requests received"""
+        return self._server.requests
+
+    @property
+    def bytes_sent(self) -> int:
+        """The number of content bytes sent"""
+        return self._server.bytes_sent
+
+    def artifact_url(self, digest: str) -> str:
+        """The content addressed URL of an artifact
+
+        Args:
+            digest: The artifact digest
+
+        Returns:
+            The URL
+        """
+
+        return f"{self.url}/artifacts/{digest}"
+
+    def file_url(self, name: str) -> str:
+        """The named URL of an artifact
+
+        Args:
+            name: The artifact name
+
+        Returns:
+            The URL
+        """
+
+        return f"{self.url}/files/{name}"
+
+    def start(self) -> None:
+        """Starts serving in a background thread"""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops serving and releases the socket"""
+
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.stop()
@@ -0,0 +1,175 @@
+"""Synthetic git repositories for the SCM tests"""
+
+import os
+import shutil
+import subprocess
+import uuid
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+# Written once a repository is fully built, so an interrupted build is never reused
+COMPLETION_MARKER = ".cppython-repository-complete"
+
+# A fixed identity and clock keep the object hashes, and with them the repositories, identical between builds
+_IDENTITY = "CPPython Synthetic <synthetic@cppython.invalid>"
+_EPOCH = 1_700_000_000
+
+
+@dataclass(frozen=True)
+class RepositorySpec:
+    """The shape of a synthetic repository"""
+
+    commits: int
+    tags: int
+    files: int
+
+    @property
+    def key(self) -> str:
+        """Identifies repositories with this shape"""
+        return f"commits-{self.commits}-tags-{self.tags}-files-{self.files}"
+
+
+def _data(content: str) -> bytes:
+    """Encodes a fast-import data block
+
+    Args:
+        content: The block content
+
+    Returns:
+        The length prefixed block
+    """
+
+    encoded = content.encode()
+    return b"data %d\n" % len(encoded) + encoded + b"\n"
+
+
+def fast_import_stream(spec: RepositorySpec) -> Iterator[bytes]:
+    """Describes a repository in the 'git fast-import' format, which builds history far faster than committing
+
+    The first commit adds every file and each later commit changes one of them. Tags are annotated and spread
+    evenly over the history, the newest on the last commit
+
+    Args:
+        spec: The repository shape
+
+    Yields:
+        Chunks of the stream
+    """
+
+    commits = max(spec.commits, 1)
+    files = max(spec.files, 1)
+    tags = min(spec.tags, commits)
+    tagged = {commits - index * commits // tags: tags - index for index in range(tags)} if tags else {}
+
+    for number in range(1, commits + 1):
+        timestamp = f"{_EPOCH + number * 60} +0000"
+        chunk = [
+            b"commit refs/heads/main\n",
+            b"mark :%d\n" % number,
+            f"author {_IDENTITY} {timestamp}\n".encode(),
+            f"committer {_IDENTITY} {timestamp}\n".encode(),
+            _data(f"Commit {number}"),
+        ]
+
+        changed = range(files) if number == 1 else [number % files]
+
+        for index in changed:
+            chunk.append(f"M 100644 inline src/component-{index // 100}/file-{index}.cpp\n".encode())
+            chunk.append(_data(f"// file {index}, revision {number}\n"))
+
+        if number == 1:
+            chunk.append(b"M 100644 inline pyproject.toml\n")
+            chunk.append(_data('[project]\nname = "synthetic"\ndynamic = ["version"]\n'))
+
+        if (version := tagged.get(number)) is not None:
+            chunk.append(f"tag v{version // 100}.{version % 100}.0\n".encode())
+            chunk.append(b"from :%d\n" % number)
+            chunk.append(f"tagger {_IDENTITY} {timestamp}\n".encode())
+            chunk.append(_data(f"Release {version}"))
+
+        yield b"".join(chunk)
+
+
+def _git(directory: Path, *args: str, stdin: bytes | None = None) -> None:
+    """Runs a git command that must succeed
+
+    Args:
+        directory: The working directory
+        args: The git arguments
+        stdin: Input for the command
+    """
+
+    subprocess.run(["git", *args], cwd=directory, input=stdin, capture_output=True, check=True)
+
+
+def build_repository(directory: Path, spec: RepositorySpec) -> Path:
+    """Creates a repository with synthetic history, without any network access
+
+    Args:
+        directory: The empty directory to build in
+        spec: The repository shape
+
+    Returns:
+        The repository's working tree
+    """
+
+    _git(directory, "init", "--quiet")
+    _git(directory, "symbolic-ref", "HEAD", "refs/heads/main")
+
+    with subprocess.Popen(["git", "fast-import", "--quiet"], cwd=directory, stdin=subprocess.PIPE) as process:
+        assert process.stdin is not None
+
+        for chunk in fast_import_stream(spec):
+            process.stdin.write(chunk)
+
+        process.stdin.close()
+
+        if process.wait() != 0:
+            raise subprocess.CalledProcessError(process.returncode, "git fast-import")
+
+    _git(directory, "reset", "--quiet", "--hard", "main")
+
+    return directory
+
+
+class RepositoryFactory:
+    """Builds synthetic repositories once and keeps them between sessions"""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def __call__(self, spec: RepositorySpec) -> Path:
+        """Returns a repository of the requested shape, building it on first use
+
+        Args:
+            spec: The repository shape
+
+        Returns:
+            The working tree. It is shared, so tests must not modify it
+        """
+
+        repository = self.root / spec.key
+
+        if (repository / COMPLETION_MARKER).exists():
+            return repository
+
+        # Build privately and publish with a rename, so concurrent sessions never see a partial repository
+        staging = self.root / f".staging-{spec.key}-{uuid.uuid4().hex}"
+        staging.mkdir(parents=True)
+
+        try:
+            build_repository(staging, spec)
+            (staging / ".git" / "info" / "exclude").write_text(f"{COMPLETION_MARKER}\n", encoding="utf-8")
+            (staging / COMPLETION_MARKER).touch()
+
+            try:
+                os.replace(staging, repository)
+            except OSError:
+                # Another session published the same repository first
+                if not (repository / COMPLETION_MARKER).exists():
+                    raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        return repository
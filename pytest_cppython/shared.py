@@ -1,6 +1,10 @@
 """Composable test types"""
 
+import shutil
 from abc import ABCMeta
+from collections.abc import Callable, Iterator
+from functools import partial
+from importlib import metadata
 from pathlib import Path
 from typing import Any, LiteralString, cast
 
@@ -29,8 +33,18 @@ from cppython_core.schema import (
 from pytest_synodic.plugin import BaseTests as SynodicBaseTests
 from pytest_synodic.plugin import IntegrationTests as SynodicBaseIntegrationTests
 from pytest_synodic.plugin import UnitTests as SynodicBaseUnitTests
-
+from synodic_utilities.utility import canonicalize_type
+
+from pytest_cppython.benchmark import Benchmark
+from pytest_cppython.cache import ResolutionCache, freeze, thaw
+from pytest_cppython.concurrency import ConcurrencyProbe, invoke
+from pytest_cppython.pipeline import SyncPipeline
+from pytest_cppython.registry import RegistryServer
+from pytest_cppython.startup import StartupProfiler
+from pytest_cppython.synthetic import PROJECT_TREE_MUTATIONS, synthetic_project_tree
+from pytest_cppython.tooling import ToolingManager
 from pytest_cppython.variants import generator_variants, provider_variants, scm_variants
+from pytest_cppython.workspace import WorkspaceMaterializer, WorkspaceSnapshot
 
 
 class BaseTests[T: Plugin](SynodicBaseTests[T], metaclass=ABCMeta):
@@ -46,18 +60,24 @@ class BaseTests[T: Plugin](SynodicBaseTests[T], metaclass=ABCMeta):
         name="cppython_plugin_data",
         scope="session",
     )
-    def fixture_cppython_plugin_data(self, cppython_data: CPPythonData, plugin_type: type[T]) -> CPPythonPluginData:
+    def fixture_cppython_plugin_data(
+        self, cppython_data: CPPythonData, plugin_type: type[T], resolution_cache: ResolutionCache
+    ) -> CPPythonPluginData:
         """Fixture for created the plugin CPPython table
 
         Args:
             cppython_data: The CPPython table to help the resolve
             plugin_type: The data plugin type
+            resolution_cache: The session wide cache of resolved data
 
         Returns:
             The plugin specific CPPython table information
         """
 
-        return resolve_cppython_plugin(cppython_data, plugin_type)
+        # Resolving creates the plugin's directories
+        return resolution_cache.resolve(
+            "cppython_plugin_data", resolve_cppython_plugin, cppython_data, plugin_type, persist=False
+        )
 
     @pytest.fixture(
         name="core_plugin_data",
@@ -66,7 +86,7 @@ class BaseTests[T: Plugin](SynodicBaseTests[T], metaclass=ABCMeta):
     def fixture_core_plugin_data(
         self, cppython_plugin_data: CPPythonPluginData, project_data: ProjectData, pep621_data: PEP621Data
     ) -> CorePluginData:
-        """Fixture for creating the wrapper CoreData type
+        """Fixture for creating the wrapper CoreData type. The instance is shared and read-only
 
         Args:
             cppython_plugin_data: CPPython data
@@ -77,7 +97,22 @@ class BaseTests[T: Plugin](SynodicBaseTests[T], metaclass=ABCMeta):
             Wrapper Core Type
         """
 
-        return CorePluginData(cppython_data=cppython_plugin_data, project_data=project_data, pep621_data=pep621_data)
+        return freeze(
+            CorePluginData(cppython_data=cppython_plugin_data, project_data=project_data, pep621_data=pep621_data)
+        )
+
+    @pytest.fixture(name="mutable_core_plugin_data")
+    def fixture_mutable_core_plugin_data(self, core_plugin_data: CorePluginData) -> CorePluginData:
+        """A private, modifiable copy of core_plugin_data for tests that need to change it
+
+        Args:
+            core_plugin_data: The shared core data
+
+        Returns:
+            Wrapper Core Type
+        """
+
+        return thaw(core_plugin_data)
 
     @pytest.fixture(name="plugin_group_name", scope="session")
     def fixture_plugin_group_name(self) -> LiteralString:
@@ -187,6 +222,37 @@ class DataPluginTests[T: DataPlugin](BaseTests[T], metaclass=ABCMeta):
 
         return plugin
 
+    @pytest.fixture(name="plugin_snapshot")
+    def fixture_plugin_snapshot(
+        self,
+        core_plugin_data: CorePluginData,
+        workspace_snapshot: WorkspaceSnapshot,
+        workspace_materializer: WorkspaceMaterializer,
+    ) -> Iterator[WorkspaceSnapshot]:
+        """Opt in isolation for tests that install, update or sync. Both the plugin's install directory and the
+        project workspace are restored once the test finishes
+
+        Args:
+            core_plugin_data: The core metadata, holding the plugin's install directory
+            workspace_snapshot: The project workspace snapshot, restored after the install directory
+            workspace_materializer: Owns the snapshots
+
+        Yields:
+            The install directory snapshot
+        """
+
+        install_path = core_plugin_data.cppython_data.install_path
+
+        # Restoring a directory that holds the workspaces would delete the ones created during the test
+        if workspace_snapshot.workspace.is_relative_to(install_path):
+            pytest.fail(f"The install directory '{install_path}' contains the project workspace")
+
+        snapshot = workspace_materializer.snapshot(install_path)
+
+        yield snapshot
+
+        workspace_materializer.restore(snapshot)
+
 
 class DataPluginIntegrationTests[T: DataPlugin](BaseIntegrationTests[T], metaclass=ABCMeta):
     """Integration testing information for all data plugin test classes"""
@@ -208,6 +274,399 @@ class DataPluginUnitTests[T: DataPlugin](BaseUnitTests[T], metaclass=ABCMeta):
             assert not paths
 
 
+class DataPluginFootprintTests[T: DataPlugin](DataPluginTests[T], metaclass=ABCMeta):
+    """Memory footprint testing information for all data plugin test classes.
+    The retained size per instance fails the test when it grows past the session threshold against the stored baseline
+    """
+
+    @pytest.fixture(name="plugin_group_resolver", scope="session")
+    def fixture_plugin_group_resolver(self) -> Callable[[ProjectData, CPPythonPluginData], DataPluginGroupData]:
+        """A required testing hook that resolves the plugin's group data
+
+        Returns:
+            The resolver
+        """
+
+        raise NotImplementedError("Override this fixture")
+
+    def test_construction_footprint(
+        self,
+        plugin_type: type[T],
+        plugin_group_data: DataPluginGroupData,
+        core_plugin_data: CorePluginData,
+        plugin_data: dict[str, Any],
+        cppython_benchmark: Benchmark,
+    ) -> None:
+        """Measures constructing the plugin from already resolved data
+
+        Args:
+            plugin_type: Plugin type
+            plugin_group_data: The data group configuration
+            core_plugin_data: The core metadata
+            plugin_data: The data table
+            cppython_benchmark: The benchmark runner
+        """
+
+        cppython_benchmark.footprint(
+            "construction", lambda: plugin_type(plugin_group_data, core_plugin_data, plugin_data), instances=100
+        )
+
+    def test_data_chain_footprint(
+        self,
+        plugin_type: type[T],
+        cppython_data: CPPythonData,
+        project_data: ProjectData,
+        pep621_data: PEP621Data,
+        plugin_group_resolver: Callable[[ProjectData, CPPythonPluginData], DataPluginGroupData],
+        cppython_benchmark: Benchmark,
+    ) -> None:
+        """Measures resolving the data a plugin is constructed from
+
+        Args:
+            plugin_type: Plugin type
+            cppython_data: The CPPython table
+            project_data: The project data
+            pep621_data: Project table data
+            plugin_group_resolver: Resolves the plugin's group data
+            cppython_benchmark: The benchmark runner
+        """
+
+        def resolve() -> tuple[CorePluginData, DataPluginGroupData]:
+            cppython_plugin_data = resolve_cppython_plugin(cppython_data, plugin_type)
+            core_data = CorePluginData(
+                cppython_data=cppython_plugin_data, project_data=project_data, pep621_data=pep621_data
+            )
+
+            return core_data, plugin_group_resolver(project_data, cppython_plugin_data)
+
+        cppython_benchmark.footprint("data chain", resolve, instances=100)
+
+
+class ConcurrencyTests[T: Plugin](BaseTests[T], metaclass=ABCMeta):
+    """Concurrency stress testing information for all plugin test classes.
+    Every call must produce the same output as a sequential call, so a differing checksum reveals a race
+    """
+
+    @pytest.mark.parametrize("processes", [False, True], ids=["threads", "processes"])
+    def test_concurrent_features(
+        self,
+        plugin_type: type[T],
+        project_configuration: ProjectConfiguration,
+        processes: bool,
+        concurrency_probe: ConcurrencyProbe,
+    ) -> None:
+        """Evaluates the features of one shared workspace from many workers
+
+        Args:
+            plugin_type: Plugin type
+            project_configuration: The shared workspace
+            processes: Whether the workers are processes
+            concurrency_probe: The stress test runner
+        """
+
+        directory = project_configuration.pyproject_file.parent
+        reference = invoke(plugin_type, "features", directory)
+
+        task = partial(invoke, plugin_type, "features", directory)
+
+        assert concurrency_probe("features", task, processes) == {reference}
+
+
+class DataPluginConcurrencyTests[T: DataPlugin](ConcurrencyTests[T], metaclass=ABCMeta):
+    """Concurrency stress testing information for all data plugin test classes"""
+
+    @pytest.fixture(name="detached_plugin")
+    def fixture_detached_plugin(
+        self,
+        plugin_type: type[T],
+        plugin_group_data: DataPluginGroupData,
+        core_plugin_data: CorePluginData,
+        plugin_data: dict[str, Any],
+    ) -> T:
+        """A plugin built from mutable copies of the shared data, which can be pickled into worker processes
+
+        Args:
+            plugin_type: Plugin type
+            plugin_group_data: The data group configuration
+            core_plugin_data: The shared core metadata
+            plugin_data: The data table
+
+        Returns:
+            A newly constructed plugin
+        """
+
+        return plugin_type(plugin_group_data, thaw(core_plugin_data), plugin_data)
+
+
+class StartupTests[T: Plugin](BaseTests[T], metaclass=ABCMeta):
+    """Import time testing information for all plugin test classes.
+    The plugin is loaded through its entry point in a fresh interpreter, the way CPPython discovers it
+    """
+
+    @pytest.fixture(name="plugin_entry_point", scope="session")
+    def fixture_plugin_entry_point(self, plugin_type: type[T]) -> metadata.EntryPoint:
+        """The entry point that registers the plugin
+
+        Args:
+            plugin_type: Plugin type
+
+        Returns:
+            The entry point
+        """
+
+        group = f"cppython.{canonicalize_type(plugin_type).group}"
+        value = f"{plugin_type.__module__}:{plugin_type.__qualname__}"
+
+        for entry_point in metadata.entry_points(group=group):
+            if entry_point.value == value:
+                return entry_point
+
+        pytest.skip(f"'{value}' isn't registered in the '{group}' entry point group")
+
+    @pytest.fixture(name="import_time_budget", scope="session")
+    def fixture_import_time_budget(self) -> float:
+        """The seconds loading the plugin may take. Override to tighten it
+
+        Returns:
+            The budget
+        """
+
+        return 1.0
+
+    @pytest.fixture(name="import_module_budget", scope="session")
+    def fixture_import_module_budget(self) -> int:
+        """The number of modules loading the plugin may import. Override to tighten it
+
+        Returns:
+            The budget
+        """
+
+        return 1000
+
+    def test_import_budget(
+        self,
+        plugin_entry_point: metadata.EntryPoint,
+        import_time_budget: float,
+        import_module_budget: int,
+        startup_profiler: StartupProfiler,
+    ) -> None:
+        """Verifies that loading the plugin stays within its import time and module budgets
+
+        Args:
+            plugin_entry_point: The plugin's entry point
+            import_time_budget: The allowed seconds
+            import_module_budget: The allowed module count
+            startup_profiler: The import profiler
+        """
+
+        profile = startup_profiler(plugin_entry_point.group, plugin_entry_point.name)
+        heaviest = ", ".join(f"{record.module} {record.cumulative_time * 1000:.1f} ms" for record in profile.heaviest())
+
+        assert (
+            profile.elapsed <= import_time_budget
+        ), f"Loading took {profile.elapsed * 1000:.1f} ms, heaviest imports: {heaviest}"
+        assert profile.modules <= import_module_budget, f"Loading imported {profile.modules} modules"
+
+
+@pytest.mark.cppython_benchmark
+class FeatureBenchmarkTests[T: Plugin](BaseTests[T], metaclass=ABCMeta):
+    """Feature detection testing information for all plugin test classes.
+    'features()' runs for every plugin on every CPPython invocation, so it is measured over growing project trees,
+    and any result cache the plugin keeps must notice changes to the tree
+    """
+
+    @pytest.fixture(name="project_tree_size", scope="session", params=[10, 100, 1_000, 10_000, 100_000])
+    def fixture_project_tree_size(self, request: pytest.FixtureRequest) -> int:
+        """The number of source files in the synthetic project tree
+
+        Args:
+            request: Parameterization list
+
+        Returns:
+            The file count
+        """
+
+        return cast(int, request.param)
+
+    @pytest.fixture(name="project_tree", scope="session")
+    def fixture_project_tree(
+        self,
+        project_configuration: ProjectConfiguration,
+        project_tree_size: int,
+        tmp_path_factory: pytest.TempPathFactory,
+    ) -> Path:
+        """The project workspace, filled with a synthetic source tree
+
+        Args:
+            project_configuration: The project whose workspace is copied
+            project_tree_size: The number of source files
+            tmp_path_factory: Factory for centralized temporary directories
+
+        Returns:
+            The project root
+        """
+
+        root = tmp_path_factory.mktemp(f"tree-{project_tree_size}-")
+        shutil.copytree(project_configuration.pyproject_file.parent, root, dirs_exist_ok=True)
+
+        return synthetic_project_tree(root, project_tree_size)
+
+    @pytest.fixture(name="features_cache_clear", scope="session")
+    def fixture_features_cache_clear(self, plugin_type: type[T]) -> Callable[[], None]:
+        """Drops the plugin's cached 'features()' results. Override for caches other than 'functools' ones
+
+        Args:
+            plugin_type: Plugin type
+
+        Returns:
+            The function that clears the cache
+        """
+
+        return cast(Callable[[], None], getattr(plugin_type.features, "cache_clear", lambda: None))
+
+    @pytest.fixture(name="project_tree_mutations", scope="session")
+    def fixture_project_tree_mutations(self) -> dict[str, Callable[[Path], None]]:
+        """The changes a cached result must notice. Override to add the files the plugin looks for
+
+        Returns:
+            The mutations by name
+        """
+
+        return dict(PROJECT_TREE_MUTATIONS)
+
+    def test_features_benchmark(self, plugin_type: type[T], project_tree: Path, cppython_benchmark: Benchmark) -> None:
+        """Measures feature detection, one project tree size per test so the sizes form a scaling curve
+
+        Args:
+            plugin_type: Plugin type
+            project_tree: The synthetic project
+            cppython_benchmark: The benchmark runner
+        """
+
+        cppython_benchmark("features", lambda: plugin_type.features(project_tree))
+
+    def test_features_cache_invalidation(
+        self,
+        plugin_type: type[T],
+        project_configuration: ProjectConfiguration,
+        features_cache_clear: Callable[[], None],
+        project_tree_mutations: dict[str, Callable[[Path], None]],
+        tmp_path: Path,
+    ) -> None:
+        """Verifies that every mutation of the project tree is reflected by the next 'features()' call
+
+        Args:
+            plugin_type: Plugin type
+            project_configuration: The project whose workspace is copied
+            features_cache_clear: Drops the plugin's cached results
+            project_tree_mutations: The changes to make
+            tmp_path: Temporary directory for the mutable project
+        """
+
+        root = tmp_path / "project"
+        shutil.copytree(project_configuration.pyproject_file.parent, root)
+        synthetic_project_tree(root, 100)
+
+        for name, mutate in project_tree_mutations.items():
+            # Populate the plugin's cache before the change
+            plugin_type.features(root)
+
+            mutate(root)
+            cached = plugin_type.features(root)
+
+            features_cache_clear()
+
+            assert cached == plugin_type.features(root), f"'features()' returned a stale result after '{name}'"
+
+
+class SyncPipelineIntegrationTests[T: DataPlugin](DataPluginIntegrationTests[T], metaclass=ABCMeta):
+    """End to end sync testing information for data plugin test classes.
+    A real provider hands its sync data to a real generator through the same negotiation CPPython performs
+    """
+
+    @pytest.fixture(name="pipeline_provider_data", scope="session")
+    def fixture_pipeline_provider_data(self) -> dict[str, Any]:
+        """A required testing hook that supplies the provider's data table
+
+        Returns:
+            The data table
+        """
+
+        raise NotImplementedError("Override this fixture")
+
+    @pytest.fixture(name="pipeline_generator_data", scope="session")
+    def fixture_pipeline_generator_data(self) -> dict[str, Any]:
+        """A required testing hook that supplies the generator's data table
+
+        Returns:
+            The data table
+        """
+
+        raise NotImplementedError("Override this fixture")
+
+    def test_sync_pipeline(
+        self,
+        provider_type: type[Provider],
+        generator_type: type[Generator],
+        pipeline_provider_data: dict[str, Any],
+        pipeline_generator_data: dict[str, Any],
+        cppython_data: CPPythonData,
+        project_data: ProjectData,
+        pep621_data: PEP621Data,
+        sync_pipeline: SyncPipeline,
+    ) -> None:
+        """Runs resolution, construction, negotiation, 'sync_data' and 'sync' for one provider and generator pair
+
+        Args:
+            provider_type: The provider variant
+            generator_type: The generator variant
+            pipeline_provider_data: The provider's data table
+            pipeline_generator_data: The generator's data table
+            cppython_data: The CPPython table
+            project_data: The project data
+            pep621_data: Project table data
+            sync_pipeline: The stage timer
+        """
+
+        with sync_pipeline.stage("resolve"):
+            provider_cppython_data = resolve_cppython_plugin(cppython_data, provider_type)
+            generator_cppython_data = resolve_cppython_plugin(cppython_data, generator_type)
+
+            provider_group_data = resolve_provider(project_data=project_data, cppython_data=provider_cppython_data)
+            generator_group_data = resolve_generator(project_data=project_data, cppython_data=generator_cppython_data)
+
+        with sync_pipeline.stage("construct"):
+            provider = provider_type(
+                provider_group_data,
+                CorePluginData(
+                    cppython_data=provider_cppython_data, project_data=project_data, pep621_data=pep621_data
+                ),
+                pipeline_provider_data,
+            )
+            generator = generator_type(
+                generator_group_data,
+                CorePluginData(
+                    cppython_data=generator_cppython_data, project_data=project_data, pep621_data=pep621_data
+                ),
+                pipeline_generator_data,
+            )
+
+        with sync_pipeline.stage("negotiate"):
+            supported = [sync_type for sync_type in generator.sync_types() if provider.supported_sync_type(sync_type)]
+
+        if not supported:
+            pytest.skip(f"'{provider_type.name()}' and '{generator_type.name()}' share no sync type")
+
+        with sync_pipeline.stage("sync_data"):
+            sync_data = provider.sync_data(generator)
+
+        assert sync_data is not None, "The provider produced no sync data for a negotiated sync type"
+        assert isinstance(sync_data, tuple(supported))
+
+        with sync_pipeline.stage("sync"):
+            generator.sync(sync_data)
+
+
 class ProviderTests[T: Provider](DataPluginTests[T], metaclass=ABCMeta):
     """Shared functionality between the different Provider testing categories"""
 
@@ -290,6 +749,85 @@ class ProviderTests[T: Provider](DataPluginTests[T], metaclass=ABCMeta):
         return scm_type
 
 
+class ProviderToolingTests[T: Provider](ProviderTests[T], metaclass=ABCMeta):
+    """Shared functionality for the Provider testing categories that run install and update.
+    The provider is constructed from 'provider_plugin_data', which can point it at the local package registry
+    """
+
+    @pytest.fixture(name="registry_url", scope="session")
+    def fixture_registry_url(self, package_registry: RegistryServer) -> str:
+        """The local registry to fetch packages from instead of the network
+
+        Args:
+            package_registry: The running registry
+
+        Returns:
+            The registry's base URL
+        """
+
+        return package_registry.url
+
+    @pytest.fixture(name="registry_plugin_data", scope="session")
+    def fixture_registry_plugin_data(self) -> dict[str, Any]:
+        """A testing hook that points the provider at the local registry. Override it to request 'registry_url' and
+        return the provider's registry setting, the default leaves the provider on its own configuration
+
+        Returns:
+            The entries merged over 'plugin_data'
+        """
+
+        return {}
+
+    @pytest.fixture(name="provider_plugin_data", scope="session")
+    def fixture_provider_plugin_data(
+        self, plugin_data: dict[str, Any], registry_plugin_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """The data table the provider is constructed from
+
+        Args:
+            plugin_data: The data table
+            registry_plugin_data: The registry settings
+
+        Returns:
+            The data table with the registry settings merged in
+        """
+
+        return {**plugin_data, **registry_plugin_data}
+
+    @staticmethod
+    @pytest.fixture(
+        name="plugin",
+        scope="session",
+    )
+    def fixture_plugin(
+        plugin_type: type[T],
+        plugin_group_data: ProviderPluginGroupData,
+        core_plugin_data: CorePluginData,
+        provider_plugin_data: dict[str, Any],
+    ) -> T:
+        """Overridden plugin generator for creating a provider that uses the registry settings
+
+        Args:
+            plugin_type: Plugin type
+            plugin_group_data: The data group configuration
+            core_plugin_data: The core metadata
+            provider_plugin_data: The data table with the registry settings
+
+        Returns:
+            A newly constructed provider
+        """
+
+        return plugin_type(plugin_group_data, core_plugin_data, provider_plugin_data)
+
+    @pytest.fixture(autouse=True, scope="session")
+    def _fixture_install_dependency(
+        self, plugin: T, provider_plugin_data: dict[str, Any], tooling_manager: ToolingManager
+    ) -> None:
+        """Downloads the tooling once per test session, outside of the tested operations"""
+
+        tooling_manager.ensure(type(plugin), provider_plugin_data)
+
+
 class GeneratorTests[T: Generator](DataPluginTests[T], metaclass=ABCMeta):
     """Shared functionality between the different Generator testing categories"""
 
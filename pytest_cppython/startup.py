@@ -0,0 +1,184 @@
+"""Import time measurement of plugin entry points"""
+
+import json
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+
+import pytest
+
+# Runs in a fresh interpreter, so the measured imports aren't already cached in 'sys.modules'
+_LOADER = """
+import json, sys, time
+from importlib.metadata import entry_points
+
+entry_point = next(iter(entry_points(group=sys.argv[1], name=sys.argv[2])))
+before = len(sys.modules)
+
+sys.stderr.write("cppython-import-start\\n")
+sys.stderr.flush()
+
+start = time.perf_counter()
+entry_point.load()
+elapsed = time.perf_counter() - start
+
+sys.stderr.flush()
+print(json.dumps({"elapsed": elapsed, "modules": len(sys.modules) - before}))
+"""
+
+_IMPORT_TIME_PATTERN = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)")
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """One line of the '-X importtime' breakdown"""
+
+    module: str
+    self_time: float
+    cumulative_time: float
+    depth: int
+
+
+@dataclass(frozen=True)
+class ImportProfile:
+    """The cost of loading an entry point into a fresh interpreter"""
+
+    group: str
+    name: str
+    elapsed: float
+    modules: int
+    records: tuple[ImportRecord, ...]
+
+    def heaviest(self, count: int = 5) -> list[ImportRecord]:
+        """The top level imports that took the longest, including what they imported in turn
+
+        Args:
+            count: The number of imports
+
+        Returns:
+            The imports, slowest first
+        """
+
+        top_level = [record for record in self.records if record.depth == 0]
+        return sorted(top_level, key=lambda record: -record.cumulative_time)[:count]
+
+
+def parse_import_times(output: str) -> list[ImportRecord]:
+    """Parses the '-X importtime' lines that follow the loader's start marker
+
+    Args:
+        output: The interpreter's standard error
+
+    Returns:
+        The imports in the order the interpreter finished them
+    """
+
+    _, _, measured = output.partition("cppython-import-start\n")
+    records = []
+
+    for line in measured.splitlines():
+        if (match := _IMPORT_TIME_PATTERN.match(line)) is None:
+            continue
+
+        self_time, cumulative_time, indent, module = match.groups()
+        records.append(
+            ImportRecord(
+                module=module,
+                self_time=int(self_time) / 1_000_000,
+                cumulative_time=int(cumulative_time) / 1_000_000,
+                depth=(len(indent) - 1) // 2,
+            )
+        )
+
+    return records
+
+
+def profile_entry_point(group: str, name: str) -> ImportProfile:
+    """Loads an entry point in a fresh interpreter and measures the imports it triggers
+
+    Args:
+        group: The entry point group, such as 'cppython.provider' or 'pytest11'
+        name: The entry point name
+
+    Returns:
+        The profile
+
+    Raises:
+        RuntimeError: If the entry point can't be loaded
+    """
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _LOADER, group, name],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    if process.returncode != 0:
+        raise RuntimeError(f"Loading the '{group}' entry point '{name}' failed:\n{process.stderr}")
+
+    result = json.loads(process.stdout.splitlines()[-1])
+
+    return ImportProfile(
+        group=group,
+        name=name,
+        elapsed=float(result["elapsed"]),
+        modules=int(result["modules"]),
+        records=tuple(parse_import_times(process.stderr)),
+    )
+
+
+class StartupRecorder:
+    """Session wide entry point import profiles"""
+
+    def __init__(self) -> None:
+        self.profiles: list[tuple[str, ImportProfile]] = []
+
+    def report(self, terminal_reporter: pytest.TerminalReporter) -> None:
+        """Writes the import table with the heaviest imports of every entry point
+
+        Args:
+            terminal_reporter: The reporter to write to
+        """
+
+        if not self.profiles:
+            return
+
+        terminal_reporter.write_sep("-", "cppython entry point imports")
+        terminal_reporter.write_line(f"{'import ms':>10} {'modules':>8}  entry point [test]")
+
+        for node_id, profile in self.profiles:
+            terminal_reporter.write_line(
+                f"{profile.elapsed * 1000:>10.2f} {profile.modules:>8}  {profile.group}:{profile.name} [{node_id}]"
+            )
+
+            for record in profile.heaviest(3):
+                terminal_reporter.write_line(f"{record.cumulative_time * 1000:>21.2f}    {record.module}")
+
+
+class StartupProfiler:
+    """Profiles entry points on behalf of a single test"""
+
+    def __init__(self, recorder: StartupRecorder, node_id: str) -> None:
+        self.recorder = recorder
+        self.node_id = node_id
+
+    def __call__(self, group: str, name: str) -> ImportProfile:
+        """Loads an entry point in a fresh interpreter and records its profile
+
+        Args:
+            group: The entry point group
+            name: The entry point name
+
+        Returns:
+            The profile
+        """
+
+        profile = profile_entry_point(group, name)
+        self.recorder.profiles.append((self.node_id, profile))
+
+        return profile
+
+
+startup_recorder_key = pytest.StashKey[StartupRecorder]()
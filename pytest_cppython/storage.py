@@ -0,0 +1,297 @@
+"""Placement of the workspace and install directories on disk or in memory"""
+
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+from enum import StrEnum
+from itertools import count
+from pathlib import Path
+from time import perf_counter
+
+import pytest
+
+# Mount points that are RAM backed on common Linux distributions, in order of preference
+MEMORY_ROOTS = (Path("/dev/shm"), Path("/run/shm"))
+
+_MEMORY_FILESYSTEMS = frozenset({"tmpfs", "ramfs"})
+
+# The I/O probe's workload, small files like the ones plugins write into a workspace
+_PROBE_FILES = 200
+_PROBE_FILE_SIZE = 4096
+
+
+class WorkspaceBackend(StrEnum):
+    """Where workspaces and the install path are created"""
+
+    DISK = "disk"
+    MEMORY = "memory"
+
+
+def _filesystem_type(path: Path) -> str | None:
+    """Looks up the type of the filesystem a path is mounted on
+
+    Args:
+        path: The path
+
+    Returns:
+        The filesystem type, or None when the mount table can't be read
+    """
+
+    if sys.platform != "linux":
+        return None
+
+    try:
+        mounts = Path("/proc/self/mounts").read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return None
+
+    resolved = path.resolve()
+    best: tuple[int, str] | None = None
+
+    for line in mounts:
+        fields = line.split()
+
+        if len(fields) < 3:
+            continue
+
+        # Spaces in mount points are octal escaped
+        mount_point = Path(fields[1].replace("\\040", " "))
+
+        if resolved.is_relative_to(mount_point) and (best is None or len(mount_point.parts) >= best[0]):
+            best = (len(mount_point.parts), fields[2])
+
+    return best[1] if best is not None else None
+
+
+def find_memory_root(candidates: tuple[Path, ...] = MEMORY_ROOTS) -> Path | None:
+    """Finds a writable RAM backed directory
+
+    Args:
+        candidates: The directories to try, in order
+
+    Returns:
+        The first usable directory, or None if there is none
+    """
+
+    for candidate in candidates:
+        if candidate.is_dir() and os.access(candidate, os.W_OK) and _filesystem_type(candidate) in _MEMORY_FILESYSTEMS:
+            return candidate
+
+    return None
+
+
+def probe_io(directory: Path) -> float:
+    """Times creating, reading and deleting a batch of small files
+
+    Args:
+        directory: Where to create the files
+
+    Returns:
+        The seconds the workload took
+    """
+
+    payload = os.urandom(_PROBE_FILE_SIZE)
+    probe = Path(tempfile.mkdtemp(prefix="cppython-probe-", dir=directory))
+
+    try:
+        start = perf_counter()
+
+        for index in range(_PROBE_FILES):
+            (probe / f"file-{index}").write_bytes(payload)
+
+        for index in range(_PROBE_FILES):
+            (probe / f"file-{index}").read_bytes()
+
+        for index in range(_PROBE_FILES):
+            (probe / f"file-{index}").unlink()
+
+        return perf_counter() - start
+    finally:
+        shutil.rmtree(probe, ignore_errors=True)
+
+
+class WorkspaceStorage:
+    """Creates the session's workspace directories on the selected backend.
+
+    With the memory backend, directories go to a RAM backed filesystem until the session's usage there reaches the size
+    cap, or the filesystem runs out of space, after which they fall back to the pytest temporary directory. The
+    processes of a session share one root there, which only the process that started the session deletes
+    """
+
+    def __init__(
+        self, backend: WorkspaceBackend = WorkspaceBackend.DISK, size_cap: int | None = None, memory: Path | None = None
+    ) -> None:
+        self.backend = backend
+        self.size_cap = size_cap
+        self.memory = memory if memory is not None or backend is WorkspaceBackend.DISK else find_memory_root()
+        self.root: Path | None = None
+        self.workspaces: Path | None = None
+        self.baseline = 0
+        self.allocated = 0
+        self.fallbacks = 0
+        self.io_time = 0.0
+        self.disk_probe: float | None = None
+        self.memory_probe: float | None = None
+
+    def session_root(self, disk: Path) -> Path | None:
+        """The session's RAM backed root
+
+        Args:
+            disk: The session's disk directory. pytest-xdist workers pass the same one, so they share the root
+
+        Returns:
+            The root, or None if the disk backend is selected or no RAM backed filesystem is available
+        """
+
+        if self.backend is not WorkspaceBackend.MEMORY or self.memory is None:
+            return None
+
+        digest = hashlib.sha256(str(disk.resolve()).encode()).hexdigest()[:16]
+        return self.memory / f"pytest-cppython-{digest}"
+
+    def open(self, disk: Path, worker: str | None = None) -> Path | None:
+        """Joins the session's RAM backed root, creating it on first use, and calibrates the I/O estimate
+
+        Args:
+            disk: The session's disk directory. pytest-xdist workers pass the same one, so they share the root
+            worker: The pytest-xdist worker ID, which gets its own directory for the workspaces below the root
+
+        Returns:
+            The root, or None if the disk backend is selected or no RAM backed filesystem is available
+        """
+
+        if self.root is None and (root := self.session_root(disk)) is not None:
+            self.workspaces = root / worker if worker is not None else root
+            self.workspaces.mkdir(parents=True, exist_ok=True)
+            self.root = root
+
+            self.baseline = shutil.disk_usage(self.root).used
+            self.disk_probe = probe_io(disk)
+            self.memory_probe = probe_io(self.root)
+
+        return self.root
+
+    def close(self) -> None:
+        """Leaves the RAM backed root, deleting this worker's workspaces. The root itself may still be in use by other
+        workers, 'remove' deletes it once the session is over
+        """
+
+        if self.root is None:
+            return
+
+        if self.workspaces is not None and self.workspaces != self.root:
+            shutil.rmtree(self.workspaces, ignore_errors=True)
+
+        self.root = self.workspaces = None
+
+    def remove(self, disk: Path) -> None:
+        """Deletes the session's RAM backed root to release its memory. Called by the pytest-xdist controller, or by
+        the only process of a session without workers, after every worker closed its storage
+
+        Args:
+            disk: The session's disk directory
+        """
+
+        if (root := self.session_root(disk)) is not None:
+            shutil.rmtree(root, ignore_errors=True)
+
+    def _has_room(self) -> bool:
+        """Whether another directory may be created in memory
+
+        Returns:
+            Whether the session's usage is below the cap and the filesystem has space left
+        """
+
+        assert self.root is not None
+
+        disk_usage = shutil.disk_usage(self.root)
+
+        # Measured against the filesystem's usage when the session started, which avoids walking the root every time
+        usage = max(disk_usage.used - self.baseline, 0)
+
+        if self.size_cap is not None and usage >= self.size_cap:
+            return False
+
+        # The filesystem is shared with the rest of the machine, so the remaining cap must still fit on it
+        return disk_usage.free > (self.size_cap or 0) - usage
+
+    def mktemp(self, basename: str, tmp_path_factory: pytest.TempPathFactory) -> Path:
+        """Creates a new numbered directory
+
+        Args:
+            basename: The directory name prefix
+            tmp_path_factory: Creates the directory on disk when memory isn't used
+
+        Returns:
+            The new directory
+        """
+
+        if self.workspaces is None:
+            return tmp_path_factory.mktemp(basename)
+
+        if not self._has_room():
+            self.fallbacks += 1
+            return tmp_path_factory.mktemp(basename)
+
+        # Numbered like the pytest directories, so the persistent cache sees the same paths every session
+        for number in count():
+            try:
+                (directory := self.workspaces / f"{basename}{number}").mkdir()
+            except FileExistsError:
+                continue
+
+            self.allocated += 1
+            return directory
+
+        raise AssertionError("unreachable")
+
+    def record(self, directory: Path, elapsed: float) -> None:
+        """Adds the duration of a workspace I/O operation that ran in memory
+
+        Args:
+            directory: The directory the operation wrote to
+            elapsed: The seconds the operation took
+        """
+
+        if self.root is not None and directory.is_relative_to(self.root):
+            self.io_time += elapsed
+
+    def report(self, terminal_reporter: pytest.TerminalReporter) -> None:
+        """Writes where the workspaces lived and the estimated I/O time saved by memory
+
+        Args:
+            terminal_reporter: The reporter to write to
+        """
+
+        if self.backend is not WorkspaceBackend.MEMORY:
+            return
+
+        terminal_reporter.write_sep("-", "cppython workspace backend")
+
+        if self.memory is None:
+            terminal_reporter.write_line("No RAM backed filesystem was found, the workspaces were created on disk")
+            return
+
+        cap = f"{self.size_cap / 2**20:.0f} MiB" if self.size_cap is not None else "no"
+        terminal_reporter.write_line(
+            f"{self.allocated} directories in {self.memory}, {self.fallbacks} fell back to disk ({cap} cap)"
+        )
+
+        if self.disk_probe is None or self.memory_probe is None:
+            return
+
+        # The workspace operations ran in memory, scale them by the probed speed difference to estimate the disk cost
+        ratio = self.disk_probe / self.memory_probe if self.memory_probe > 0 else 1.0
+        saved = self.io_time * ratio - self.io_time
+
+        terminal_reporter.write_line(
+            f"probe: disk {self.disk_probe * 1000:.2f} ms, memory {self.memory_probe * 1000:.2f} ms ({ratio:.2f}x)"
+        )
+        terminal_reporter.write_line(
+            f"workspace I/O: {self.io_time * 1000:.2f} ms in memory, about {saved * 1000:.2f} ms saved"
+        )
+
+
+workspace_storage_key = pytest.StashKey[WorkspaceStorage]()
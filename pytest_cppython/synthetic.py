@@ -0,0 +1,91 @@
+"""Synthetic workloads for the benchmark tests"""
+
+from collections.abc import Callable
+from pathlib import Path
+
+from cppython_core.plugin_schema.provider import Provider
+
+from pytest_cppython.mock.generator import MockSyncData
+
+# Files per directory of a synthetic project tree, about what real source directories hold
+_FILES_PER_DIRECTORY = 100
+
+_SOURCE_SUFFIXES = (".cpp", ".h", ".cmake", ".txt")
+
+
+def synthetic_sync_data(provider_type: type[Provider], dependency_count: int) -> MockSyncData:
+    """Creates the sync data a provider with a large dependency graph would hand to a generator
+
+    Args:
+        provider_type: The provider the data claims to come from
+        dependency_count: How many dependencies, include paths and targets to create
+
+    Returns:
+        The populated sync data
+    """
+
+    names = [f"package-{index}" for index in range(dependency_count)]
+
+    return MockSyncData(
+        provider_name=provider_type.name(),
+        dependencies=[f"{name}/{index % 97}.{index % 13}.0" for index, name in enumerate(names)],
+        include_paths=[Path("packages") / name / "include" for name in names],
+        targets=[f"{name}::{name}" for name in names],
+    )
+
+
+def synthetic_project_tree(root: Path, file_count: int) -> Path:
+    """Fills a project with a source tree, the way a large C++ project looks to 'features()'
+
+    Args:
+        root: The project root, which already holds the pyproject.toml
+        file_count: How many source files to create
+
+    Returns:
+        The project root
+    """
+
+    for index in range(file_count):
+        component = index // _FILES_PER_DIRECTORY
+        directory = root / "src" / f"module-{component // _FILES_PER_DIRECTORY}" / f"component-{component}"
+
+        if index % _FILES_PER_DIRECTORY == 0:
+            directory.mkdir(parents=True, exist_ok=True)
+
+        suffix = _SOURCE_SUFFIXES[index % len(_SOURCE_SUFFIXES)]
+        (directory / f"file-{index}{suffix}").write_text(f"// {index}\n", encoding="utf-8")
+
+    return root
+
+
+def _add_file(root: Path) -> None:
+    (root / "src" / "added.cpp").write_text("// added\n", encoding="utf-8")
+
+
+def _modify_file(root: Path) -> None:
+    (root / "src" / "module-0" / "component-0" / "file-0.cpp").write_text("// modified\n", encoding="utf-8")
+
+
+def _remove_file(root: Path) -> None:
+    (root / "src" / "module-0" / "component-0" / "file-1.h").unlink()
+
+
+def _add_directory(root: Path) -> None:
+    (root / "src" / "added" / "nested").mkdir(parents=True)
+
+
+def _modify_pyproject(root: Path) -> None:
+    pyproject = next(root.rglob("pyproject.toml"))
+
+    with pyproject.open("a", encoding="utf-8") as file:
+        file.write("\n# modified\n")
+
+
+# Changes a cached 'features()' result must notice. They expect a tree of at least two files
+PROJECT_TREE_MUTATIONS: dict[str, Callable[[Path], None]] = {
+    "add file": _add_file,
+    "modify file": _modify_file,
+    "remove file": _remove_file,
+    "add directory": _add_directory,
+    "modify pyproject": _modify_pyproject,
+}
@@ -2,37 +2,59 @@
 
 import asyncio
 from abc import ABCMeta
+from collections.abc import Callable
+from functools import partial
+from itertools import count
 from pathlib import Path
+from typing import Any, cast
 
 import pytest
-from cppython_core.plugin_schema.generator import Generator
-from cppython_core.plugin_schema.provider import Provider
+from cppython_core.plugin_schema.generator import (
+    Generator,
+    GeneratorPluginGroupData,
+    SyncConsumer,
+)
+from cppython_core.plugin_schema.provider import Provider, ProviderPluginGroupData
 from cppython_core.plugin_schema.scm import SCM
+from cppython_core.resolution import resolve_generator, resolve_provider
+from cppython_core.schema import (
+    CorePluginData,
+    CPPythonPluginData,
+    ProjectConfiguration,
+    ProjectData,
+    SyncData,
+)
 from synodic_utilities.utility import canonicalize_type
 
+from pytest_cppython.benchmark import Benchmark
+from pytest_cppython.cache import thaw
+from pytest_cppython.compatibility import CompatibilityIndex
+from pytest_cppython.concurrency import ConcurrencyProbe, checksum, invoke
+from pytest_cppython.eventloop import EventLoopLag
+from pytest_cppython.mock.generator import MockSyncData
+from pytest_cppython.repository import RepositoryFactory, RepositorySpec
 from pytest_cppython.shared import (
+    ConcurrencyTests,
+    DataPluginConcurrencyTests,
+    DataPluginFootprintTests,
     DataPluginIntegrationTests,
     DataPluginUnitTests,
+    FeatureBenchmarkTests,
     GeneratorTests,
     PluginIntegrationTests,
     PluginUnitTests,
     ProviderTests,
+    ProviderToolingTests,
     SCMTests,
+    StartupTests,
+    SyncPipelineIntegrationTests,
 )
+from pytest_cppython.synthetic import synthetic_sync_data
 
 
-class ProviderIntegrationTests[T: Provider](DataPluginIntegrationTests[T], ProviderTests[T], metaclass=ABCMeta):
+class ProviderIntegrationTests[T: Provider](DataPluginIntegrationTests[T], ProviderToolingTests[T], metaclass=ABCMeta):
     """Base class for all provider integration tests that test plugin agnostic behavior"""
 
-    @pytest.fixture(autouse=True, scope="session")
-    def _fixture_install_dependency(self, plugin: T, install_path: Path) -> None:
-        """Forces the download to only happen once per test session"""
-
-        path = install_path / canonicalize_type(type(plugin)).name
-        path.mkdir(parents=True, exist_ok=True)
-
-        asyncio.run(plugin.download_tooling(path))
-
     def test_install(self, plugin: T) -> None:
         """Ensure that the vanilla install command functions
 
@@ -58,6 +80,413 @@ class ProviderIntegrationTests[T: Provider](DataPluginIntegrationTests[T], Provi
         assert canonicalize_type(plugin_type).group == "provider"
 
 
+@pytest.mark.cppython_benchmark
+class ProviderBenchmarkTests[T: Provider](ProviderToolingTests[T], metaclass=ABCMeta):
+    """Base class for provider benchmarks.
+    Each operation fails when its median regresses past the session threshold against the stored baseline
+    """
+
+    def test_install_benchmark(self, plugin: T, cppython_benchmark: Benchmark) -> None:
+        """Measures the install command
+
+        Args:
+            plugin: A newly constructed provider
+            cppython_benchmark: The benchmark runner
+        """
+        cppython_benchmark("install", plugin.install)
+
+    def test_update_benchmark(self, plugin: T, cppython_benchmark: Benchmark) -> None:
+        """Measures the update command
+
+        Args:
+            plugin: A newly constructed provider
+            cppython_benchmark: The benchmark runner
+        """
+        cppython_benchmark("update", plugin.update)
+
+    def test_sync_data_benchmark(
+        self, plugin: T, generator_type: type[Generator], cppython_benchmark: Benchmark
+    ) -> None:
+        """Measures gathering synchronization data for a generator
+
+        Args:
+            plugin: A newly constructed provider
+            generator_type: The consuming generator
+            cppython_benchmark: The benchmark runner
+        """
+        cppython_benchmark("sync_data", lambda: plugin.sync_data(generator_type))
+
+    def test_download_tooling_benchmark(
+        self, plugin: T, tmp_path: Path, event_loop_runner: asyncio.Runner, cppython_benchmark: Benchmark
+    ) -> None:
+        """Measures a tooling download into an empty directory
+
+        Args:
+            plugin: A newly constructed provider
+            tmp_path: Temporary directory for the downloads
+            event_loop_runner: The session event loop
+            cppython_benchmark: The benchmark runner
+        """
+
+        rounds = count()
+
+        def download() -> None:
+            directory = tmp_path / f"round-{next(rounds)}"
+            directory.mkdir()
+            event_loop_runner.run(plugin.download_tooling(directory))
+
+        cppython_benchmark("download_tooling", download)
+
+
+class AsyncProviderIntegrationTests[T: Provider](
+    DataPluginIntegrationTests[T], ProviderToolingTests[T], metaclass=ABCMeta
+):
+    """Base class for provider integration tests that exercise the plugin under overlapping load.
+    Every operation runs on the session event loop, with the synchronous commands on worker threads, and the loop's
+    lag is reported so that coroutines blocking the loop stand out
+    """
+
+    @pytest.fixture(name="concurrency", scope="session")
+    def fixture_concurrency(self) -> int:
+        """The number of simultaneous operations in the stress tests
+
+        Returns:
+            The operation count
+        """
+
+        return 8
+
+    @pytest.fixture(name="concurrent_plugins")
+    def fixture_concurrent_plugins(
+        self,
+        plugin_type: type[T],
+        plugin_group_data: ProviderPluginGroupData,
+        core_plugin_data: CorePluginData,
+        provider_plugin_data: dict[str, Any],
+        concurrency: int,
+        tmp_path: Path,
+    ) -> list[T]:
+        """Providers that each install into their own workspace
+
+        Args:
+            plugin_type: Plugin type
+            plugin_group_data: The data group configuration
+            core_plugin_data: The shared core metadata
+            provider_plugin_data: The data table with the registry settings
+            concurrency: The number of providers
+            tmp_path: Temporary directory holding the workspaces
+
+        Returns:
+            The providers
+        """
+
+        plugins = []
+
+        for index in range(concurrency):
+            core_data = thaw(core_plugin_data)
+            core_data.cppython_data.install_path = tmp_path / f"workspace-{index}"
+            core_data.cppython_data.install_path.mkdir()
+
+            plugins.append(plugin_type(plugin_group_data, core_data, provider_plugin_data))
+
+        return plugins
+
+    def test_download_tooling(
+        self, plugin: T, tmp_path: Path, event_loop_runner: asyncio.Runner, event_loop_lag: EventLoopLag
+    ) -> None:
+        """Downloads the tooling on the session event loop
+
+        Args:
+            plugin: A newly constructed provider
+            tmp_path: Temporary directory for the download
+            event_loop_runner: The session event loop
+            event_loop_lag: The lag probe
+        """
+
+        async def download() -> None:
+            async with event_loop_lag.watch("download_tooling"):
+                await plugin.download_tooling(tmp_path)
+
+        event_loop_runner.run(download())
+
+    def test_install(self, plugin: T, event_loop_runner: asyncio.Runner, event_loop_lag: EventLoopLag) -> None:
+        """Ensure that the install command functions when driven from the event loop
+
+        Args:
+            plugin: A newly constructed provider
+            event_loop_runner: The session event loop
+            event_loop_lag: The lag probe
+        """
+
+        async def install() -> None:
+            async with event_loop_lag.watch("install"):
+                await asyncio.to_thread(plugin.install)
+
+        event_loop_runner.run(install())
+
+    def test_update(self, plugin: T, event_loop_runner: asyncio.Runner, event_loop_lag: EventLoopLag) -> None:
+        """Ensure that the update command functions when driven from the event loop
+
+        Args:
+            plugin: A newly constructed provider
+            event_loop_runner: The session event loop
+            event_loop_lag: The lag probe
+        """
+
+        async def update() -> None:
+            async with event_loop_lag.watch("update"):
+                await asyncio.to_thread(plugin.update)
+
+        event_loop_runner.run(update())
+
+    def test_concurrent_install(
+        self, concurrent_plugins: list[T], event_loop_runner: asyncio.Runner, event_loop_lag: EventLoopLag
+    ) -> None:
+        """Installs into separate workspaces simultaneously, verifying that the installs don't interfere
+
+        Args:
+            concurrent_plugins: Providers with their own workspaces
+            event_loop_runner: The session event loop
+            event_loop_lag: The lag probe
+        """
+
+        async def install_all() -> list[BaseException | None]:
+            async with event_loop_lag.watch(f"install x{len(concurrent_plugins)}"):
+                return await asyncio.gather(
+                    *(asyncio.to_thread(plugin.install) for plugin in concurrent_plugins), return_exceptions=True
+                )
+
+        failures = [result for result in event_loop_runner.run(install_all()) if result is not None]
+
+        assert not failures
+
+    def test_concurrent_download_tooling(
+        self,
+        plugin: T,
+        concurrency: int,
+        tmp_path: Path,
+        event_loop_runner: asyncio.Runner,
+        event_loop_lag: EventLoopLag,
+    ) -> None:
+        """Downloads the tooling into separate directories simultaneously on the session event loop
+
+        Args:
+            plugin: A newly constructed provider
+            concurrency: The number of downloads
+            tmp_path: Temporary directory for the downloads
+            event_loop_runner: The session event loop
+            event_loop_lag: The lag probe
+        """
+
+        directories = [tmp_path / f"tooling-{index}" for index in range(concurrency)]
+
+        for directory in directories:
+            directory.mkdir()
+
+        async def download_all() -> None:
+            async with event_loop_lag.watch(f"download_tooling x{concurrency}"):
+                await asyncio.gather(*(plugin.download_tooling(directory) for directory in directories))
+
+        event_loop_runner.run(download_all())
+
+    def test_group_name(self, plugin_type: type[T]) -> None:
+        """Verifies that the group name is the same as the plugin type
+
+        Args:
+            plugin_type: The type to register
+        """
+        assert canonicalize_type(plugin_type).group == "provider"
+
+
+class ProviderConcurrencyTests[T: Provider](DataPluginConcurrencyTests[T], ProviderTests[T], metaclass=ABCMeta):
+    """Base class that calls provider methods from many threads and processes at once.
+    Every call must produce the same output as a sequential call, so a differing checksum reveals a race
+    """
+
+    @pytest.mark.parametrize("processes", [False, True], ids=["threads", "processes"])
+    def test_concurrent_sync_data(
+        self,
+        plugin: T,
+        detached_plugin: T,
+        generator_type: type[Generator],
+        processes: bool,
+        concurrency_probe: ConcurrencyProbe,
+    ) -> None:
+        """Gathers synchronization data from one shared provider in threads, or from copies in processes
+
+        Args:
+            plugin: The shared provider
+            detached_plugin: The provider copied into worker processes
+            generator_type: The consuming generator
+            processes: Whether the workers are processes
+            concurrency_probe: The stress test runner
+        """
+
+        target = detached_plugin if processes else plugin
+        reference = invoke(target, "sync_data", generator_type)
+
+        task = partial(invoke, target, "sync_data", generator_type)
+
+        assert concurrency_probe("sync_data", task, processes) == {reference}
+
+    def test_concurrent_install(
+        self,
+        plugin_type: type[T],
+        plugin_group_data: ProviderPluginGroupData,
+        core_plugin_data: CorePluginData,
+        plugin_data: dict[str, Any],
+        tmp_path: Path,
+        concurrency_probe: ConcurrencyProbe,
+    ) -> None:
+        """Installs into a separate workspace per call from many threads, comparing the installed trees
+
+        Args:
+            plugin_type: Plugin type
+            plugin_group_data: The data group configuration
+            core_plugin_data: The shared core metadata
+            plugin_data: The data table
+            tmp_path: Temporary directory holding the workspaces
+            concurrency_probe: The stress test runner
+        """
+
+        workspaces = count()
+
+        def install() -> str:
+            core_data = thaw(core_plugin_data)
+            core_data.cppython_data.install_path = tmp_path / f"workspace-{next(workspaces)}"
+            core_data.cppython_data.install_path.mkdir()
+
+            plugin_type(plugin_group_data, core_data, plugin_data).install()
+
+            return checksum(core_data.cppython_data.install_path)
+
+        assert len(concurrency_probe("install", install)) == 1
+
+
+class ProviderFootprintTests[T: Provider](DataPluginFootprintTests[T], ProviderTests[T], metaclass=ABCMeta):
+    """Base class for provider memory footprint tests"""
+
+    @pytest.fixture(name="plugin_group_resolver", scope="session")
+    def fixture_plugin_group_resolver(self) -> Callable[[ProjectData, CPPythonPluginData], ProviderPluginGroupData]:
+        """Resolves the provider group data
+
+        Returns:
+            The resolver
+        """
+
+        return lambda project_data, cppython_data: resolve_provider(
+            project_data=project_data, cppython_data=cppython_data
+        )
+
+
+class ProviderStartupTests[T: Provider](StartupTests[T], ProviderTests[T], metaclass=ABCMeta):
+    """Base class for provider import time budget tests"""
+
+
+class ProviderFeatureBenchmarkTests[T: Provider](FeatureBenchmarkTests[T], ProviderTests[T], metaclass=ABCMeta):
+    """Base class for provider feature detection benchmarks"""
+
+
+class ProviderSyncPipelineTests[T: Provider](SyncPipelineIntegrationTests[T], ProviderTests[T], metaclass=ABCMeta):
+    """Base class for syncing the provider into every generator variant"""
+
+    @pytest.fixture(name="pipeline_provider_data", scope="session")
+    def fixture_pipeline_provider_data(self, plugin_data: dict[str, Any]) -> dict[str, Any]:
+        """The provider's own data table
+
+        Args:
+            plugin_data: The data table
+
+        Returns:
+            The data table
+        """
+
+        return plugin_data
+
+    @pytest.fixture(name="pipeline_generator_data", scope="session")
+    def fixture_pipeline_generator_data(self) -> dict[str, Any]:
+        """The generator variants' data table. Override for generators that require configuration
+
+        Returns:
+            The data table
+        """
+
+        return {}
+
+
+class _SingleTypeConsumer:
+    """Consumes a single sync type, so a provider is asked for that type alone"""
+
+    def __init__(self, sync_type: type[SyncData]) -> None:
+        self.sync_type = sync_type
+
+    def sync_types(self) -> list[type[SyncData]]:
+        """The consumed sync types
+
+        Returns:
+            The one sync type
+        """
+
+        return [self.sync_type]
+
+
+class ProviderCompatibilityTests[T: Provider](ProviderTests[T], metaclass=ABCMeta):
+    """Base class for provider tests that check the session compatibility index against the plugin's own answers"""
+
+    def test_supported_sync_type(self, plugin: T, compatibility_index: CompatibilityIndex) -> None:
+        """Verifies that the index lists the provider under exactly the consumed sync types it produces data for
+
+        Args:
+            plugin: A newly constructed provider
+            compatibility_index: The session compatibility index
+        """
+
+        if type(plugin) not in compatibility_index.provider_types:
+            pytest.skip(f"'{type(plugin).__qualname__}' isn't registered in the 'cppython.provider' entry point group")
+
+        consumed = {
+            sync_type
+            for generator_type in compatibility_index.generator_types
+            for sync_type in generator_type.sync_types()
+        }
+        produced: set[type[SyncData]] = set()
+
+        for sync_type in consumed:
+            if (sync_data := plugin.sync_data(cast(SyncConsumer, _SingleTypeConsumer(sync_type)))) is not None:
+                assert isinstance(sync_data, sync_type)
+                produced.add(sync_type)
+
+        indexed = {
+            sync_type
+            for sync_type in compatibility_index.sync_types
+            if type(plugin) in compatibility_index.providers_for(sync_type)
+        }
+
+        assert indexed == produced
+
+    def test_sync_data(
+        self, plugin: T, generator_type: type[Generator], compatibility_index: CompatibilityIndex
+    ) -> None:
+        """Verifies that the provider produces sync data exactly when the index pairs it with the generator
+
+        Args:
+            plugin: A newly constructed provider
+            generator_type: The consuming generator
+            compatibility_index: The session compatibility index
+        """
+
+        if type(plugin) not in compatibility_index.provider_types:
+            pytest.skip(f"'{type(plugin).__qualname__}' isn't registered in the 'cppython.provider' entry point group")
+
+        compatible = compatibility_index.compatible(type(plugin), generator_type)
+        sync_data = plugin.sync_data(generator_type)
+
+        if compatible:
+            assert isinstance(sync_data, compatible)
+        else:
+            assert sync_data is None
+
+
 class ProviderUnitTests[T: Provider](DataPluginUnitTests[T], ProviderTests[T], metaclass=ABCMeta):
     """Custom implementations of the Provider class should inherit from this class for its tests.
     Base class for all provider unit tests that test plugin agnostic behavior
@@ -76,6 +505,208 @@ class GeneratorIntegrationTests[T: Generator](DataPluginIntegrationTests[T], Gen
         assert canonicalize_type(plugin_type).group == "generator"
 
 
+@pytest.mark.cppython_benchmark
+class GeneratorBenchmarkTests[T: Generator](GeneratorTests[T], metaclass=ABCMeta):
+    """Base class for generator benchmarks over synthetic, large dependency graphs.
+    Generators that don't consume 'MockSyncData' override 'sync_data_factory' to build their own sync type
+    """
+
+    @pytest.fixture(name="sync_data_size", scope="session", params=[10_000, 100_000])
+    def fixture_sync_data_size(self, request: pytest.FixtureRequest) -> int:
+        """The number of dependencies in the synthetic provider output
+
+        Args:
+            request: Parameterization list
+
+        Returns:
+            The dependency count
+        """
+
+        return cast(int, request.param)
+
+    @pytest.fixture(name="sync_data_factory", scope="session")
+    def fixture_sync_data_factory(
+        self, plugin_type: type[T], provider_type: type[Provider]
+    ) -> Callable[[int], SyncData]:
+        """Creates synthetic provider output of a requested size
+
+        Args:
+            plugin_type: The generator type
+            provider_type: The provider the data claims to come from
+
+        Returns:
+            A factory taking the dependency count
+        """
+
+        if MockSyncData not in plugin_type.sync_types():
+            pytest.skip("The generator doesn't consume 'MockSyncData', override 'sync_data_factory'")
+
+        return lambda size: synthetic_sync_data(provider_type, size)
+
+    def test_sync_benchmark(
+        self,
+        plugin: T,
+        sync_data_factory: Callable[[int], SyncData],
+        sync_data_size: int,
+        cppython_benchmark: Benchmark,
+    ) -> None:
+        """Measures the latency and peak allocation of synchronizing a large provider output
+
+        Args:
+            plugin: A newly constructed generator
+            sync_data_factory: Creates the provider output
+            sync_data_size: The number of dependencies
+            cppython_benchmark: The benchmark runner
+        """
+
+        sync_data = sync_data_factory(sync_data_size)
+
+        cppython_benchmark("sync", lambda: plugin.sync(sync_data), trace_memory=True)
+
+
+class GeneratorConcurrencyTests[T: Generator](DataPluginConcurrencyTests[T], GeneratorTests[T], metaclass=ABCMeta):
+    """Base class that calls generator methods from many threads and processes at once.
+    Generators that don't consume 'MockSyncData' override 'sync_data' to build their own sync type
+    """
+
+    @pytest.fixture(name="sync_data", scope="session")
+    def fixture_sync_data(self, plugin_type: type[T], provider_type: type[Provider]) -> SyncData:
+        """Provider output to synchronize
+
+        Args:
+            plugin_type: The generator type
+            provider_type: The provider the data claims to come from
+
+        Returns:
+            The sync data
+        """
+
+        if MockSyncData not in plugin_type.sync_types():
+            pytest.skip("The generator doesn't consume 'MockSyncData', override 'sync_data'")
+
+        return synthetic_sync_data(provider_type, 100)
+
+    @pytest.mark.parametrize("processes", [False, True], ids=["threads", "processes"])
+    def test_concurrent_sync(
+        self,
+        plugin: T,
+        detached_plugin: T,
+        sync_data: SyncData,
+        processes: bool,
+        concurrency_probe: ConcurrencyProbe,
+    ) -> None:
+        """Synchronizes one shared generator from threads, or copies of it from processes
+
+        Args:
+            plugin: The shared generator
+            detached_plugin: The generator copied into worker processes
+            sync_data: The provider output
+            processes: Whether the workers are processes
+            concurrency_probe: The stress test runner
+        """
+
+        target = detached_plugin if processes else plugin
+        reference = invoke(target, "sync", sync_data)
+
+        task = partial(invoke, target, "sync", sync_data)
+
+        assert concurrency_probe("sync", task, processes) == {reference}
+
+
+class GeneratorFootprintTests[T: Generator](DataPluginFootprintTests[T], GeneratorTests[T], metaclass=ABCMeta):
+    """Base class for generator memory footprint tests"""
+
+    @pytest.fixture(name="plugin_group_resolver", scope="session")
+    def fixture_plugin_group_resolver(self) -> Callable[[ProjectData, CPPythonPluginData], GeneratorPluginGroupData]:
+        """Resolves the generator group data
+
+        Returns:
+            The resolver
+        """
+
+        return lambda project_data, cppython_data: resolve_generator(
+            project_data=project_data, cppython_data=cppython_data
+        )
+
+
+class GeneratorStartupTests[T: Generator](StartupTests[T], GeneratorTests[T], metaclass=ABCMeta):
+    """Base class for generator import time budget tests"""
+
+
+class GeneratorFeatureBenchmarkTests[T: Generator](FeatureBenchmarkTests[T], GeneratorTests[T], metaclass=ABCMeta):
+    """Base class for generator feature detection benchmarks"""
+
+
+class GeneratorSyncPipelineTests[T: Generator](SyncPipelineIntegrationTests[T], GeneratorTests[T], metaclass=ABCMeta):
+    """Base class for syncing every provider variant into the generator"""
+
+    @pytest.fixture(name="pipeline_provider_data", scope="session")
+    def fixture_pipeline_provider_data(self) -> dict[str, Any]:
+        """The provider variants' data table. Override for providers that require configuration
+
+        Returns:
+            The data table
+        """
+
+        return {}
+
+    @pytest.fixture(name="pipeline_generator_data", scope="session")
+    def fixture_pipeline_generator_data(self, plugin_data: dict[str, Any]) -> dict[str, Any]:
+        """The generator's own data table
+
+        Args:
+            plugin_data: The data table
+
+        Returns:
+            The data table
+        """
+
+        return plugin_data
+
+
+class GeneratorCompatibilityTests[T: Generator](GeneratorTests[T], metaclass=ABCMeta):
+    """Base class for generator tests that check the session compatibility index against the plugin's own answers"""
+
+    def test_sync_types(self, plugin_type: type[T], compatibility_index: CompatibilityIndex) -> None:
+        """Verifies that the index lists the generator under exactly the sync types it consumes
+
+        Args:
+            plugin_type: The type to register
+            compatibility_index: The session compatibility index
+        """
+
+        if plugin_type not in compatibility_index.generator_types:
+            pytest.skip(f"'{plugin_type.__qualname__}' isn't registered in the 'cppython.generator' entry point group")
+
+        indexed = {
+            sync_type
+            for sync_type in compatibility_index.sync_types
+            if plugin_type in compatibility_index.generators_for(sync_type)
+        }
+
+        assert indexed == set(plugin_type.sync_types())
+
+    def test_provider_pairs(
+        self, plugin_type: type[T], provider_type: type[Provider], compatibility_index: CompatibilityIndex
+    ) -> None:
+        """Verifies that a provider's indexed sync types are the ones it supports, in the generator's order
+
+        Args:
+            plugin_type: The type to register
+            provider_type: The producing provider
+            compatibility_index: The session compatibility index
+        """
+
+        if plugin_type not in compatibility_index.generator_types:
+            pytest.skip(f"'{plugin_type.__qualname__}' isn't registered in the 'cppython.generator' entry point group")
+
+        expected = tuple(
+            sync_type for sync_type in plugin_type.sync_types() if provider_type.supported_sync_type(sync_type)
+        )
+
+        assert compatibility_index.compatible(provider_type, plugin_type) == expected
+
+
 class GeneratorUnitTests[T: Generator](DataPluginUnitTests[T], GeneratorTests[T], metaclass=ABCMeta):
     """Custom implementations of the Generator class should inherit from this class for its tests.
     Base class for all Generator unit tests that test plugin agnostic behavior"""
@@ -93,6 +724,117 @@ class SCMIntegrationTests[T: SCM](PluginIntegrationTests[T], SCMTests[T], metacl
         assert canonicalize_type(plugin_type).group == "scm"
 
 
+class SCMConcurrencyTests[T: SCM](ConcurrencyTests[T], SCMTests[T], metaclass=ABCMeta):
+    """Base class that calls SCM methods from many threads and processes at once"""
+
+    @pytest.mark.parametrize("processes", [False, True], ids=["threads", "processes"])
+    def test_concurrent_version(
+        self,
+        plugin: T,
+        project_configuration: ProjectConfiguration,
+        processes: bool,
+        concurrency_probe: ConcurrencyProbe,
+    ) -> None:
+        """Extracts the version of one shared workspace from many workers
+
+        Args:
+            plugin: The shared SCM
+            project_configuration: The shared workspace
+            processes: Whether the workers are processes
+            concurrency_probe: The stress test runner
+        """
+
+        directory = project_configuration.pyproject_file.parent
+        reference = invoke(plugin, "version", directory)
+
+        task = partial(invoke, plugin, "version", directory)
+
+        assert concurrency_probe("version", task, processes) == {reference}
+
+
+class SCMStartupTests[T: SCM](StartupTests[T], SCMTests[T], metaclass=ABCMeta):
+    """Base class for SCM import time budget tests"""
+
+
+class SCMFeatureBenchmarkTests[T: SCM](FeatureBenchmarkTests[T], SCMTests[T], metaclass=ABCMeta):
+    """Base class for SCM feature detection benchmarks"""
+
+
+@pytest.mark.cppython_benchmark
+class SCMBenchmarkTests[T: SCM](SCMTests[T], metaclass=ABCMeta):
+    """Base class for SCM benchmarks against synthetic repositories with real history.
+    Override 'repository_spec' to match the size of the repositories the plugin is used with
+    """
+
+    @pytest.fixture(
+        name="repository_spec",
+        scope="session",
+        params=[RepositorySpec(commits=1_000, tags=10, files=100)],
+        ids=lambda spec: spec.key,
+    )
+    def fixture_repository_spec(self, request: pytest.FixtureRequest) -> RepositorySpec:
+        """The shape of the benchmarked repository
+
+        Args:
+            request: Parameterization list
+
+        Returns:
+            The repository shape
+        """
+
+        return cast(RepositorySpec, request.param)
+
+    @pytest.fixture(name="git_repository", scope="session")
+    def fixture_git_repository(
+        self, git_repository_factory: RepositoryFactory, repository_spec: RepositorySpec
+    ) -> Path:
+        """A synthetic repository, shared by every test of the session
+
+        Args:
+            git_repository_factory: Builds the repository on first use
+            repository_spec: The repository shape
+
+        Returns:
+            The repository's working tree
+        """
+
+        return git_repository_factory(repository_spec)
+
+    def test_version(self, plugin: T, git_repository: Path) -> None:
+        """Verifies that a version can be extracted from a repository with tagged history
+
+        Args:
+            plugin: A newly constructed SCM
+            git_repository: The synthetic repository
+        """
+
+        assert plugin.version(git_repository)
+
+    def test_version_benchmark(self, plugin: T, git_repository: Path, cppython_benchmark: Benchmark) -> None:
+        """Measures version extraction
+
+        Args:
+            plugin: A newly constructed SCM
+            git_repository: The synthetic repository
+            cppython_benchmark: The benchmark runner
+        """
+
+        cppython_benchmark("version", lambda: plugin.version(git_repository))
+
+    def test_features_benchmark(
+        self, plugin_type: type[T], git_repository: Path, cppython_benchmark: Benchmark
+    ) -> None:
+        """Measures repository detection
+
+        Args:
+            plugin_type: Plugin type
+            git_repository: The synthetic repository
+            cppython_benchmark: The benchmark runner
+        """
+
+        cppython_benchmark("features", lambda: plugin_type.features(git_repository))
+
+
 class SCMUnitTests[T: SCM](PluginUnitTests[T], SCMTests[T], metaclass=ABCMeta):
     """Custom implementations of the Generator class should inherit from this class for its tests.
     Base class for all Generator unit tests that test plugin agnostic behavior
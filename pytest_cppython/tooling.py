@@ -0,0 +1,381 @@
+"""Session wide management of provider tooling downloads"""
+
+import asyncio
+import json
+import os
+import shutil
+import sys
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from importlib import metadata
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any, Self, get_args
+
+import pytest
+from cppython_core.plugin_schema.provider import Provider
+from synodic_utilities.utility import canonicalize_type
+
+from pytest_cppython.cache import fingerprint
+from pytest_cppython.workspace import CloneStrategy, clone_tree
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+# Written once a download finished, so other processes know the directory is usable
+COMPLETION_MARKER = ".cppython-tooling-complete"
+
+
+class FileLock:
+    """A blocking lock shared between processes, such as pytest-xdist workers"""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._file: IO[bytes] | None = None
+
+    def acquire(self) -> None:
+        """Blocks until the lock is held"""
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        file = self.path.open("a+b")
+
+        if sys.platform == "win32":
+            # Windows locks byte ranges from the current position
+            file.seek(0)
+
+            while True:
+                try:
+                    # Gives up after ten attempts, so keep retrying
+                    msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        else:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+
+        self._file = file
+
+    def release(self) -> None:
+        """Releases a held lock"""
+
+        if self._file is None:
+            return
+
+        if sys.platform == "win32":
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+
+        self._file.close()
+        self._file = None
+
+    def __enter__(self) -> Self:
+        self.acquire()
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.release()
+
+
+def collect_provider_types(items: Iterable[pytest.Item]) -> list[type[Provider]]:
+    """Finds the providers that collected test classes are parameterized with
+
+    Args:
+        items: The collected test items
+
+    Returns:
+        The provider types, in collection order
+    """
+
+    found: dict[type[Provider], None] = {}
+
+    for item in items:
+        if (test_class := getattr(item, "cls", None)) is None:
+            continue
+
+        for ancestor in test_class.__mro__:
+            for base in getattr(ancestor, "__orig_bases__", ()):
+                for argument in get_args(base):
+                    if isinstance(argument, type) and issubclass(argument, Provider):
+                        found[argument] = None
+
+    return list(found)
+
+
+def _tree_size(path: Path) -> int:
+    """The total size of the files in a directory tree
+
+    Args:
+        path: The directory
+
+    Returns:
+        The size in bytes
+    """
+
+    return sum(file.stat().st_size for file in path.rglob("*") if file.is_file() and not file.is_symlink())
+
+
+def _provider_version(provider_type: type[Provider]) -> str | None:
+    """The version of the distribution that ships a provider
+
+    Args:
+        provider_type: The provider
+
+    Returns:
+        The version, or None if the provider isn't installed from a distribution
+    """
+
+    package = provider_type.__module__.partition(".")[0]
+
+    for distribution in metadata.packages_distributions().get(package, []):
+        return metadata.version(distribution)
+
+    return None
+
+
+class ToolCache:
+    """Tooling downloads kept between sessions. Once the session is over, the entries it didn't use are evicted least
+    recently used first until the cache fits its size limit
+    """
+
+    def __init__(self, root: Path, max_size: int | None = None) -> None:
+        self.root = root
+        self.max_size = max_size
+
+    @staticmethod
+    def key(provider_type: type[Provider], configuration: Mapping[str, Any]) -> str:
+        """Identifies the tooling of a provider
+
+        Args:
+            provider_type: The provider
+            configuration: The provider's configuration data
+
+        Returns:
+            A file name safe key
+        """
+
+        name = canonicalize_type(provider_type).name
+        digest = fingerprint(
+            provider_type,
+            _provider_version(provider_type),
+            provider_type.information(),
+            json.dumps(configuration, sort_keys=True, default=str),
+        )
+
+        return f"{name}-{digest[:16]}"
+
+    async def fetch(self, key: str, download: Callable[[Path], Awaitable[None]]) -> Path:
+        """Returns the cached entry for a key, downloading and publishing it first if needed
+
+        Args:
+            key: The entry key
+            download: Populates a directory with the tooling
+
+        Returns:
+            The entry directory. It must not be modified
+        """
+
+        entry = self.root / key
+
+        if not (entry / COMPLETION_MARKER).exists():
+            lock = FileLock(self.root / f"{key}.lock")
+            await asyncio.to_thread(lock.acquire)
+
+            try:
+                if not (entry / COMPLETION_MARKER).exists():
+                    # Download into a private directory and publish it with an atomic rename
+                    staging = self.root / f".staging-{key}-{uuid.uuid4().hex}"
+                    staging.mkdir(parents=True)
+
+                    try:
+                        await download(staging)
+                        (staging / COMPLETION_MARKER).touch()
+
+                        if entry.exists():
+                            shutil.rmtree(entry)
+
+                        os.replace(staging, entry)
+                    finally:
+                        shutil.rmtree(staging, ignore_errors=True)
+            finally:
+                lock.release()
+
+        # The marker's modification time records the last use. File system clocks are too coarse to order quick
+        # successive uses, so the precise time is set explicitly
+        now = time.time_ns()
+        os.utime(entry / COMPLETION_MARKER, ns=(now, now))
+
+        return entry
+
+    def evict(self, used_since: int) -> None:
+        """Deletes the least recently used entries until the cache fits its size limit
+
+        Args:
+            used_since: When the session started, in nanoseconds since the epoch. Entries used since then, by any
+                process, may be linked into an install path and are kept
+        """
+
+        if self.max_size is None:
+            return
+
+        entries = [
+            (marker.stat().st_mtime_ns, marker.parent)
+            for marker in self.root.glob(f"*/{COMPLETION_MARKER}")
+            if not marker.parent.name.startswith(".")
+        ]
+        sizes = {entry: _tree_size(entry) for _, entry in entries}
+        total = sum(sizes.values())
+
+        for last_use, entry in sorted(entries):
+            # The remaining entries were all used during the session
+            if total <= self.max_size or last_use >= used_since:
+                break
+
+            # Another process may be fetching the entry, and its use only shows once the lock is released
+            with FileLock(self.root / f"{entry.name}.lock"):
+                marker = entry / COMPLETION_MARKER
+
+                if marker.exists() and marker.stat().st_mtime_ns < used_since:
+                    shutil.rmtree(entry, ignore_errors=True)
+                    total -= sizes[entry]
+
+
+class ToolingManager:
+    """Downloads each provider's tooling once, concurrently and across processes"""
+
+    def __init__(self, install_path: Path, runner: asyncio.Runner, tool_cache: ToolCache | None = None) -> None:
+        self.install_path = install_path
+        self.runner = runner
+        self.tool_cache = tool_cache
+        # Providers registered from the collected tests have no known configuration yet
+        self._pending: dict[type[Provider], Mapping[str, Any] | None] = {}
+        self._ready: dict[type[Provider], Path] = {}
+
+    def directory(self, provider_type: type[Provider]) -> Path:
+        """The tooling location of a provider
+
+        Args:
+            provider_type: The provider
+
+        Returns:
+            The directory that is handed to 'download_tooling'
+        """
+
+        return self.install_path / canonicalize_type(provider_type).name
+
+    def register(self, provider_types: Iterable[type[Provider]]) -> None:
+        """Queues providers so their downloads happen alongside the first requested one. With a tool cache, they wait
+        for their own request instead, as their configuration isn't known yet
+
+        Args:
+            provider_types: The providers the session will need
+        """
+
+        for provider_type in provider_types:
+            if provider_type not in self._ready:
+                self._pending.setdefault(provider_type, None)
+
+    def ensure(self, provider_type: type[Provider], configuration: Mapping[str, Any] | None = None) -> Path:
+        """Makes sure the provider's tooling is downloaded, downloading every queued provider at the same time
+
+        Args:
+            provider_type: The provider that needs its tooling
+            configuration: The provider's configuration data, which is part of the tool cache key
+
+        Returns:
+            The tooling directory
+        """
+
+        if (directory := self._ready.get(provider_type)) is not None:
+            return directory
+
+        self._pending[provider_type] = configuration or {}
+
+        # The tool cache keys entries by configuration, so providers without a known one wait for their own request
+        batch = {
+            pending: pending_configuration or {}
+            for pending, pending_configuration in self._pending.items()
+            if pending_configuration is not None or self.tool_cache is None
+        }
+
+        for pending in batch:
+            del self._pending[pending]
+
+        self.runner.run(self._download_all(batch))
+
+        return self._ready[provider_type]
+
+    async def _download_all(self, batch: Mapping[type[Provider], Mapping[str, Any]]) -> None:
+        """Downloads a batch of providers on the manager's event loop
+
+        Args:
+            batch: The providers to download and their configuration data
+        """
+
+        await asyncio.gather(
+            *(self._download(provider_type, configuration) for provider_type, configuration in batch.items())
+        )
+
+    async def _download(self, provider_type: type[Provider], configuration: Mapping[str, Any]) -> None:
+        """Downloads a single provider unless another process already has
+
+        Args:
+            provider_type: The provider to download
+            configuration: The provider's configuration data
+        """
+
+        directory = self.directory(provider_type)
+        directory.parent.mkdir(parents=True, exist_ok=True)
+        marker = directory / COMPLETION_MARKER
+
+        if not marker.exists():
+            lock = FileLock(directory.with_name(f"{directory.name}.lock"))
+
+            # Waiting on another process must not stall the other downloads
+            await asyncio.to_thread(lock.acquire)
+
+            try:
+                if not marker.exists():
+                    if self.tool_cache is None:
+                        directory.mkdir(exist_ok=True)
+                        await provider_type.download_tooling(directory)
+                        marker.touch()
+                    else:
+                        entry = await self.tool_cache.fetch(
+                            ToolCache.key(provider_type, configuration), provider_type.download_tooling
+                        )
+                        self._link(entry, directory)
+            finally:
+                lock.release()
+
+        self._ready[provider_type] = directory
+
+    @staticmethod
+    def _link(entry: Path, directory: Path) -> None:
+        """Exposes a tool cache entry at the session's tooling location
+
+        Args:
+            entry: The cache entry
+            directory: The session's tooling location
+        """
+
+        # A link to an evicted entry, or an empty directory left by an interrupted session
+        if directory.is_symlink():
+            directory.unlink()
+        elif directory.is_dir() and not any(directory.iterdir()):
+            directory.rmdir()
+
+        try:
+            directory.symlink_to(entry, target_is_directory=True)
+        except OSError:
+            # Symbolic links need extra privileges on Windows
+            clone_tree(entry, directory, CloneStrategy.AUTO)
+
+
+collected_providers_key = pytest.StashKey[list[type[Provider]]]()
@@ -0,0 +1,476 @@
+"""Workspace materialization for the project fixtures"""
+
+import errno
+import hashlib
+import os
+import shutil
+import sys
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+from time import perf_counter, time_ns
+
+import pytest
+
+from pytest_cppython.storage import WorkspaceStorage
+
+if sys.platform == "linux":
+    import fcntl
+
+# Linux ioctl request number for a copy-on-write file clone
+_FICLONE = 0x40049409
+
+# Coarse filesystem clocks can give a file modified during a test the modification time it had at the snapshot
+_TIMESTAMP_GRANULARITY_NS = 2_000_000_000
+
+
+class CloneStrategy(StrEnum):
+    """How files are cloned from a template into a workspace"""
+
+    AUTO = "auto"
+    REFLINK = "reflink"
+    HARDLINK = "hardlink"
+    COPY = "copy"
+
+
+def _reflink(source: Path, destination: Path) -> bool:
+    """Attempts a copy-on-write clone of a single file
+
+    Args:
+        source: The file to clone
+        destination: The new file location
+
+    Returns:
+        True if the filesystem performed the clone
+    """
+
+    if sys.platform != "linux":
+        return False
+
+    with source.open("rb") as source_file, destination.open("wb") as destination_file:
+        try:
+            fcntl.ioctl(destination_file.fileno(), _FICLONE, source_file.fileno())
+        except OSError:
+            return False
+
+    shutil.copystat(source, destination)
+    return True
+
+
+def _clone_file(source: Path, destination: Path) -> None:
+    """Replaces a file with a clone of another, never writing through an existing hardlink
+
+    Args:
+        source: The file to clone
+        destination: The file to replace
+    """
+
+    if destination.exists() or destination.is_symlink():
+        destination.unlink()
+
+    if source.is_symlink():
+        destination.symlink_to(os.readlink(source), target_is_directory=source.is_dir())
+    elif not _reflink(source, destination):
+        shutil.copy2(source, destination)
+
+
+def clone_tree(source: Path, destination: Path, strategy: CloneStrategy = CloneStrategy.AUTO) -> CloneStrategy:
+    """Clones a directory tree, merging into any existing destination content
+
+    Args:
+        source: The directory to clone
+        destination: The directory to populate
+        strategy: The requested clone strategy. 'auto' and 'reflink' fall back to copies when cloning is unsupported
+
+    Returns:
+        The strategy that was actually used, so callers can skip probing on the next clone
+    """
+
+    # Hardlinks can't cross filesystems, such as from a template in memory to a workspace that fell back to disk
+    cross_device = False
+
+    for root, directories, files in os.walk(source):
+        relative = Path(root).relative_to(source)
+        target_root = destination / relative
+        target_root.mkdir(parents=True, exist_ok=True)
+
+        for directory in directories:
+            source_directory = Path(root) / directory
+            target_directory = target_root / directory
+
+            # 'os.walk' doesn't follow directory symlinks, recreate them instead of emptying them
+            if source_directory.is_symlink():
+                if target_directory.is_symlink() or target_directory.is_file():
+                    target_directory.unlink()
+                elif target_directory.exists():
+                    shutil.rmtree(target_directory)
+
+                target_directory.symlink_to(os.readlink(source_directory), target_is_directory=True)
+                continue
+
+            target_directory.mkdir(exist_ok=True)
+
+        for file in files:
+            source_file = Path(root) / file
+            target_file = target_root / file
+
+            if target_file.exists() or target_file.is_symlink():
+                target_file.unlink()
+
+            if source_file.is_symlink():
+                target_file.symlink_to(os.readlink(source_file))
+                continue
+
+            match strategy:
+                case CloneStrategy.AUTO | CloneStrategy.REFLINK:
+                    if not _reflink(source_file, target_file):
+                        # The filesystem does not support cloning, don't bother probing again
+                        strategy = CloneStrategy.COPY
+                        shutil.copy2(source_file, target_file)
+                    else:
+                        strategy = CloneStrategy.REFLINK
+                case CloneStrategy.HARDLINK if cross_device:
+                    shutil.copy2(source_file, target_file)
+                case CloneStrategy.HARDLINK:
+                    try:
+                        os.link(source_file, target_file)
+                    except OSError as error:
+                        if error.errno != errno.EXDEV:
+                            raise
+
+                        # Only this clone is affected, later ones may stay on one filesystem
+                        cross_device = True
+                        shutil.copy2(source_file, target_file)
+                case CloneStrategy.COPY:
+                    shutil.copy2(source_file, target_file)
+
+    return strategy
+
+
+class WorkspaceMaterializer:
+    """Builds one pristine template per data directory pair and clones it into fresh workspaces.
+
+    Hardlinked workspaces share file contents with their template, so they are only safe for plugins that replace
+    files rather than write into them.
+    """
+
+    def __init__(
+        self,
+        tmp_path_factory: pytest.TempPathFactory,
+        strategy: CloneStrategy = CloneStrategy.AUTO,
+        storage: WorkspaceStorage | None = None,
+    ) -> None:
+        self.tmp_path_factory = tmp_path_factory
+        self.strategy = strategy
+        self.storage = storage
+        self._templates: dict[tuple[Path, Path | None], Path] = {}
+        self._workspaces: dict[Path, tuple[Path, Path | None]] = {}
+        self._snapshots: dict[Path, WorkspaceSnapshot] = {}
+
+    def template(self, data_path: Path, plugin_data_path: Path | None) -> Path:
+        """Returns the pristine template for a data directory pair, building it on first use
+
+        Args:
+            data_path: The package project data
+            plugin_data_path: The plugin's test data, if any
+
+        Returns:
+            The template directory. It must not be modified
+        """
+
+        key = (data_path, plugin_data_path)
+
+        if (template := self._templates.get(key)) is None:
+            template = self._mktemp("template-")
+
+            # Never hardlink into the source trees, a workspace write would modify the plugin's repository
+            clone_tree(data_path, template)
+
+            if plugin_data_path is not None:
+                clone_tree(plugin_data_path, template)
+
+            self._templates[key] = template
+
+        return template
+
+    def materialize(self, data_path: Path, plugin_data_path: Path | None) -> Path:
+        """Creates a new workspace populated with the data directory pair
+
+        Args:
+            data_path: The package project data
+            plugin_data_path: The plugin's test data, if any
+
+        Returns:
+            The new workspace directory
+        """
+
+        template = self.template(data_path, plugin_data_path)
+        workspace = self._mktemp("workspace-")
+
+        start = perf_counter()
+        self.strategy = clone_tree(template, workspace, self.strategy)
+        self._record(workspace, perf_counter() - start)
+
+        # Resolved, as the project fixtures resolve the paths they find in it
+        self._workspaces[workspace.resolve()] = (data_path, plugin_data_path)
+
+        return workspace
+
+    def origin(self, path: Path) -> tuple[Path, tuple[Path, Path | None]] | None:
+        """Finds the workspace holding a path and the data directory pair it was cloned from
+
+        Args:
+            path: A path inside a workspace
+
+        Returns:
+            The workspace directory and its data directory pair, or None if no workspace holds the path
+        """
+
+        for workspace, key in self._workspaces.items():
+            if path.is_relative_to(workspace):
+                return workspace, key
+
+        return None
+
+    def snapshot(self, workspace: Path) -> "WorkspaceSnapshot":
+        """Returns the snapshot of a workspace, capturing it on first use
+
+        Args:
+            workspace: The workspace directory
+
+        Returns:
+            The snapshot
+        """
+
+        if (snapshot := self._snapshots.get(workspace)) is None:
+            snapshot = WorkspaceSnapshot(workspace, self._mktemp("snapshot-"))
+            self._snapshots[workspace] = snapshot
+            self._record(workspace, snapshot.capture_time)
+
+        return snapshot
+
+    def restore(self, snapshot: "WorkspaceSnapshot") -> "RestoreResult":
+        """Restores a workspace to its snapshot
+
+        Args:
+            snapshot: The snapshot
+
+        Returns:
+            The restoration statistics
+        """
+
+        result = snapshot.restore()
+        self._record(snapshot.workspace, result.elapsed)
+
+        return result
+
+    def _mktemp(self, basename: str) -> Path:
+        """Creates a new directory on the configured storage
+
+        Args:
+            basename: The directory name prefix
+
+        Returns:
+            The new directory
+        """
+
+        if self.storage is None:
+            return self.tmp_path_factory.mktemp(basename)
+
+        return self.storage.mktemp(basename, self.tmp_path_factory)
+
+    def _record(self, directory: Path, elapsed: float) -> None:
+        """Reports the duration of a workspace I/O operation to the storage
+
+        Args:
+            directory: The directory the operation wrote to
+            elapsed: The seconds the operation took
+        """
+
+        if self.storage is not None:
+            self.storage.record(directory, elapsed)
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """The recorded state of one workspace file"""
+
+    size: int
+    mtime_ns: int
+    digest: str
+
+
+def _digest(path: Path) -> str:
+    """Hashes a file's content, or a symlink's target
+
+    Args:
+        path: The file
+
+    Returns:
+        The hex digest
+    """
+
+    if path.is_symlink():
+        return hashlib.sha256(os.readlink(path).encode()).hexdigest()
+
+    with path.open("rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+def scan_tree(root: Path) -> tuple[dict[str, ManifestEntry], set[str]]:
+    """Records every file and directory below a root
+
+    Args:
+        root: The directory to scan
+
+    Returns:
+        The files by relative path, and the relative directory paths. Symlinks to directories are recorded as files
+    """
+
+    files = {}
+    directories = set()
+
+    for directory, subdirectories, names in os.walk(root):
+        relative = Path(directory).relative_to(root)
+
+        # 'os.walk' lists directory symlinks as directories without following them
+        links = [name for name in subdirectories if (Path(directory) / name).is_symlink()]
+        directories.update((relative / name).as_posix() for name in subdirectories if name not in links)
+
+        for name in [*names, *links]:
+            path = Path(directory) / name
+            status = path.lstat()
+            files[(relative / name).as_posix()] = ManifestEntry(status.st_size, status.st_mtime_ns, _digest(path))
+
+    return files, directories
+
+
+@dataclass(frozen=True)
+class RestoreResult:
+    """What restoring a workspace had to undo"""
+
+    scanned: int
+    restored: int
+    removed: int
+    elapsed: float
+
+
+class WorkspaceSnapshot:
+    """The state of a workspace after its setup, restored between tests instead of re-cloning the workspace.
+
+    Files whose size and modification time still match the manifest are trusted without hashing, only touched files
+    are hashed, and only changed files are copied back from a private clone.
+    """
+
+    def __init__(self, workspace: Path, storage: Path) -> None:
+        self.workspace = workspace
+        self.storage = storage
+
+        # Directories such as an install path may only be created by the tests
+        self.existed = workspace.exists()
+
+        start = perf_counter()
+        captured_ns = time_ns()
+
+        # Hardlinks would share the content the snapshot has to preserve
+        clone_tree(workspace, storage, CloneStrategy.AUTO)
+        self.files, self.directories = scan_tree(workspace)
+
+        # Files written just before the capture can't be trusted by their times alone
+        self.racy = {
+            key for key, entry in self.files.items() if entry.mtime_ns >= captured_ns - _TIMESTAMP_GRANULARITY_NS
+        }
+
+        self.capture_time = perf_counter() - start
+
+    def _unchanged(self, relative: str, path: Path) -> bool:
+        """Whether a file still holds its snapshot content, resetting the times of files that were only touched
+
+        Args:
+            relative: The manifest path
+            path: The workspace file
+
+        Returns:
+            Whether the file can be kept
+        """
+
+        entry = self.files[relative]
+        status = path.lstat()
+
+        if status.st_size != entry.size:
+            return False
+
+        if status.st_mtime_ns == entry.mtime_ns and relative not in self.racy:
+            return True
+
+        if _digest(path) != entry.digest:
+            return False
+
+        if status.st_mtime_ns != entry.mtime_ns and not path.is_symlink():
+            os.utime(path, ns=(status.st_atime_ns, entry.mtime_ns))
+
+        return True
+
+    def restore(self) -> RestoreResult:
+        """Returns the workspace to the snapshot, copying back only what changed
+
+        Returns:
+            The restoration statistics
+        """
+
+        start = perf_counter()
+
+        if not self.existed:
+            removed = int(self.workspace.exists() or self.workspace.is_symlink())
+
+            # 'rmtree' refuses symlinks to directories
+            if self.workspace.is_symlink():
+                self.workspace.unlink()
+            else:
+                shutil.rmtree(self.workspace, ignore_errors=True)
+
+            return RestoreResult(scanned=0, restored=0, removed=removed, elapsed=perf_counter() - start)
+
+        restored = removed = scanned = 0
+        seen = set()
+
+        for directory, subdirectories, names in os.walk(self.workspace, topdown=True):
+            relative = Path(directory).relative_to(self.workspace)
+
+            # Directories created by the test are removed whole rather than walked
+            for name in list(subdirectories):
+                path = Path(directory) / name
+
+                # Directory symlinks are checked like files, 'rmtree' refuses them
+                if path.is_symlink():
+                    subdirectories.remove(name)
+                    names.append(name)
+                elif (relative / name).as_posix() not in self.directories:
+                    subdirectories.remove(name)
+                    shutil.rmtree(path)
+                    removed += 1
+
+            for name in names:
+                key = (relative / name).as_posix()
+                path = Path(directory) / name
+                scanned += 1
+
+                if key not in self.files:
+                    path.unlink()
+                    removed += 1
+                    continue
+
+                seen.add(key)
+
+                if not self._unchanged(key, path):
+                    _clone_file(self.storage / key, path)
+                    restored += 1
+
+        for directory in self.directories:
+            (self.workspace / directory).mkdir(parents=True, exist_ok=True)
+
+        for key in self.files.keys() - seen:
+            _clone_file(self.storage / key, self.workspace / key)
+            restored += 1
+
+        return RestoreResult(scanned=scanned, restored=restored, removed=removed, elapsed=perf_counter() - start)
@@ -0,0 +1,122 @@
+"""Benchmarks feature detection of the internal plugin implementations over synthetic project trees"""
+
+from typing import Any, cast
+
+import pytest
+
+from pytest_cppython.mock.generator import MockGenerator
+from pytest_cppython.mock.provider import MockProvider
+from pytest_cppython.mock.scm import MockSCM
+from pytest_cppython.tests import (
+    GeneratorFeatureBenchmarkTests,
+    ProviderFeatureBenchmarkTests,
+    SCMFeatureBenchmarkTests,
+)
+
+
+class TestMockProviderFeatures(ProviderFeatureBenchmarkTests[MockProvider]):
+    """The feature detection benchmarks for our Mock provider"""
+
+    @pytest.fixture(name="project_tree_size", scope="session", params=[10, 100])
+    def fixture_project_tree_size(self, request: pytest.FixtureRequest) -> int:
+        """Small trees, the Mock provider doesn't inspect them
+
+        Args:
+            request: Parameterization list
+
+        Returns:
+            The file count
+        """
+
+        return cast(int, request.param)
+
+    @pytest.fixture(name="plugin_data", scope="session")
+    def fixture_plugin_data(self) -> dict[str, Any]:
+        """Returns mock data
+
+        Returns:
+            An overridden data instance
+        """
+
+        return {}
+
+    @pytest.fixture(name="plugin_type", scope="session")
+    def fixture_plugin_type(self) -> type[MockProvider]:
+        """A required testing hook that allows type generation
+
+        Returns:
+            The overridden provider type
+        """
+        return MockProvider
+
+
+class TestCPPythonGeneratorFeatures(GeneratorFeatureBenchmarkTests[MockGenerator]):
+    """The feature detection benchmarks for the Mock generator"""
+
+    @pytest.fixture(name="project_tree_size", scope="session", params=[10, 100])
+    def fixture_project_tree_size(self, request: pytest.FixtureRequest) -> int:
+        """Small trees, the Mock generator doesn't inspect them
+
+        Args:
+            request: Parameterization list
+
+        Returns:
+            The file count
+        """
+
+        return cast(int, request.param)
+
+    @pytest.fixture(name="plugin_data", scope="session")
+    def fixture_plugin_data(self) -> dict[str, Any]:
+        """Returns mock data
+
+        Returns:
+            An overridden data instance
+        """
+
+        return {}
+
+    @pytest.fixture(name="plugin_type", scope="session")
+    def fixture_plugin_type(self) -> type[MockGenerator]:
+        """A required testing hook that allows type generation
+
+        Returns:
+            An overridden generator type
+        """
+        return MockGenerator
+
+
+class TestCPPythonSCMFeatures(SCMFeatureBenchmarkTests[MockSCM]):
+    """The feature detection benchmarks for the Mock version control"""
+
+    @pytest.fixture(name="project_tree_size", scope="session", params=[10, 100])
+    def fixture_project_tree_size(self, request: pytest.FixtureRequest) -> int:
+        """Small trees, the Mock version control doesn't inspect them
+
+        Args:
+            request: Parameterization list
+
+        Returns:
+            The file count
+        """
+
+        return cast(int, request.param)
+
+    @pytest.fixture(name="plugin_data", scope="session")
+    def fixture_plugin_data(self) -> dict[str, Any]:
+        """Returns mock data
+
+        Returns:
+            An overridden data instance
+        """
+
+        return {}
+
+    @pytest.fixture(name="plugin_type", scope="session")
+    def fixture_plugin_type(self) -> type[MockSCM]:
+        """A required testing hook that allows type generation
+
+        Returns:
+            An overridden version control type
+        """
+        return MockSCM
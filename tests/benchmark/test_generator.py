@@ -0,0 +1,67 @@
+"""Benchmarks the internal generator implementation against the 'Generator' benchmark base"""
+
+from typing import Any, cast
+
+import pytest
+
+from pytest_cppython.mock.generator import MockGenerator
+from pytest_cppython.tests import GeneratorBenchmarkTests, GeneratorFootprintTests
+
+
+class TestCPPythonGenerator(GeneratorBenchmarkTests[MockGenerator]):
+    """The benchmarks for the Mock generator"""
+
+    @pytest.fixture(name="sync_data_size", scope="session", params=[10, 100])
+    def fixture_sync_data_size(self, request: pytest.FixtureRequest) -> int:
+        """Small outputs, the Mock generator ignores them
+
+        Args:
+            request: Parameterization list
+
+        Returns:
+            The dependency count
+        """
+
+        return cast(int, request.param)
+
+    @pytest.fixture(name="plugin_data", scope="session")
+    def fixture_plugin_data(self) -> dict[str, Any]:
+        """Returns mock data
+
+        Returns:
+            An overridden data instance
+        """
+
+        return {}
+
+    @pytest.fixture(name="plugin_type", scope="session")
+    def fixture_plugin_type(self) -> type[MockGenerator]:
+        """A required testing hook that allows type generation
+
+        Returns:
+            An overridden generator type
+        """
+        return MockGenerator
+
+
+class TestCPPythonGeneratorFootprint(GeneratorFootprintTests[MockGenerator]):
+    """The memory footprint tests for the Mock generator"""
+
+    @pytest.fixture(name="plugin_data", scope="session")
+    def fixture_plugin_data(self) -> dict[str, Any]:
+        """Returns mock data
+
+        Returns:
+            An overridden data instance
+        """
+
+        return {}
+
+    @pytest.fixture(name="plugin_type", scope="session")
+    def fixture_plugin_type(self) -> type[MockGenerator]:
+        """A required testing hook that allows type generation
+
+        Returns:
+            An overridden generator type
+        """
+        return MockGenerator
@@ -0,0 +1,50 @@
+"""Benchmarks the internal SCM implementation against the 'SCM' benchmark base"""
+
+from typing import Any, cast
+
+import pytest
+
+from pytest_cppython.mock.scm import MockSCM
+from pytest_cppython.repository import RepositorySpec
+from pytest_cppython.tests import SCMBenchmarkTests
+
+
+class TestCPPythonSCM(SCMBenchmarkTests[MockSCM]):
+    """The benchmarks for the Mock version control"""
+
+    @pytest.fixture(
+        name="repository_spec",
+        scope="session",
+        params=[RepositorySpec(commits=50, tags=5, files=10)],
+        ids=lambda spec: spec.key,
+    )
+    def fixture_repository_spec(self, request: pytest.FixtureRequest) -> RepositorySpec:
+        """A small repository, the Mock version control doesn't read its history
+
+        Args:
+            request: Parameterization list
+
+        Returns:
+            The repository shape
+        """
+
+        return cast(RepositorySpec, request.param)
+
+    @pytest.fixture(name="plugin_data", scope="session")
+    def fixture_plugin_data(self) -> dict[str, Any]:
+        """Returns mock data
+
+        Returns:
+            An overridden data instance
+        """
+
+        return {}
+
+    @pytest.fixture(name="plugin_type", scope="session")
+    def fixture_plugin_type(self) -> type[MockSCM]:
+        """A required testing hook that allows type generation
+
+        Returns:
+            An overridden version control type
+        """
+        return MockSCM
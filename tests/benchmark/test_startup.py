@@ -0,0 +1,102 @@
+"""Measures the import time of the entry points this package registers"""
+
+from typing import Any
+
+import pytest
+
+from pytest_cppython.mock.generator import MockGenerator
+from pytest_cppython.mock.provider import MockProvider
+from pytest_cppython.mock.scm import MockSCM
+from pytest_cppython.startup import StartupProfiler
+from pytest_cppython.tests import (
+    GeneratorStartupTests,
+    ProviderStartupTests,
+    SCMStartupTests,
+)
+
+
+class TestPluginStartup:
+    """Import budget of the pytest plugin itself, which every test session of a CPPython plugin loads"""
+
+    def test_import_budget(self, startup_profiler: StartupProfiler) -> None:
+        """Verifies that loading the pytest plugin stays within its import time budget
+
+        Args:
+            startup_profiler: The import profiler
+        """
+
+        profile = startup_profiler("pytest11", "pytest_cppython")
+
+        assert profile.elapsed <= 2.0
+
+        # The data fixtures, and with them cppython_core, are only loaded by test suites that use them
+        assert not any(record.module.startswith("cppython_core") for record in profile.records)
+
+
+class TestMockProviderStartup(ProviderStartupTests[MockProvider]):
+    """The import budget tests for our Mock provider"""
+
+    @pytest.fixture(name="plugin_data", scope="session")
+    def fixture_plugin_data(self) -> dict[str, Any]:
+        """Returns mock data
+
+        Returns:
+            An overridden data instance
+        """
+
+        return {}
+
+    @pytest.fixture(name="plugin_type", scope="session")
+    def fixture_plugin_type(self) -> type[MockProvider]:
+        """A required testing hook that allows type generation
+
+        Returns:
+            The overridden provider type
+        """
+        return MockProvider
+
+
+class TestCPPythonGeneratorStartup(GeneratorStartupTests[MockGenerator]):
+    """The import budget tests for the Mock generator"""
+
+    @pytest.fixture(name="plugin_data", scope="session")
+    def fixture_plugin_data(self) -> dict[str, Any]:
+        """Returns mock data
+
+        Returns:
+            An overridden data instance
+        """
+
+        return {}
+
+    @pytest.fixture(name="plugin_type", scope="session")
+    def fixture_plugin_type(self) -> type[MockGenerator]:
+        """A required testing hook that allows type generation
+
+        Returns:
+            An overridden generator type
+        """
+        return MockGenerator
+
+
+class TestCPPythonSCMStartup(SCMStartupTests[MockSCM]):
+    """The import budget tests for the Mock version control"""
+
+    @pytest.fixture(name="plugin_data", scope="session")
+    def fixture_plugin_data(self) -> dict[str, Any]:
+        """Returns mock data
+
+        Returns:
+            An overridden data instance
+        """
+
+        return {}
+
+    @pytest.fixture(name="plugin_type", scope="session")
+    def fixture_plugin_type(self) -> type[MockSCM]:
+        """A required testing hook that allows type generation
+
+        Returns:
+            An overridden version control type
+        """
+        return MockSCM
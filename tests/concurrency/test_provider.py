@@ -0,0 +1,31 @@
+"""Stress tests the internal provider implementation against the 'Provider' concurrency base"""
+
+from typing import Any
+
+import pytest
+
+from pytest_cppython.mock.provider import MockProvider
+from pytest_cppython.tests import ProviderConcurrencyTests
+
+
+class TestMockProvider(ProviderConcurrencyTests[MockProvider]):
+    """The concurrency tests for the Mock provider"""
+
+    @pytest.fixture(name="plugin_data", scope="session")
+    def fixture_plugin_data(self) -> dict[str, Any]:
+        """Returns mock data
+
+        Returns:
+            An overridden data instance
+        """
+
+        return {"package-count": 4}
+
+    @pytest.fixture(name="plugin_type", scope="session")
+    def fixture_plugin_type(self) -> type[MockProvider]:
+        """A required testing hook that allows type generation
+
+        Returns:
+            An overridden provider type
+        """
+        return MockProvider
@@ -5,7 +5,7 @@ from typing import Any
 import pytest
 
 from pytest_cppython.mock.generator import MockGenerator
-from pytest_cppython.tests import GeneratorIntegrationTests
+from pytest_cppython.tests import GeneratorIntegrationTests, GeneratorSyncPipelineTests
 
 
 class TestCPPythonGenerator(GeneratorIntegrationTests[MockGenerator]):
@@ -29,3 +29,26 @@ class TestCPPythonGenerator(GeneratorIntegrationTests[MockGenerator]):
             An overridden generator type
         """
         return MockGenerator
+
+
+class TestCPPythonGeneratorSyncPipeline(GeneratorSyncPipelineTests[MockGenerator]):
+    """The end to end sync tests for the Mock generator"""
+
+    @pytest.fixture(name="plugin_data", scope="session")
+    def fixture_plugin_data(self) -> dict[str, Any]:
+        """Returns mock data
+
+        Returns:
+            An overridden data instance
+        """
+
+        return {}
+
+    @pytest.fixture(name="plugin_type", scope="session")
+    def fixture_plugin_type(self) -> type[MockGenerator]:
+        """A required testing hook that allows type generation
+
+        Returns:
+            An overridden generator type
+        """
+        return MockGenerator
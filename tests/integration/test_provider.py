@@ -4,13 +4,96 @@ from typing import Any
 
 import pytest
 
-from pytest_cppython.mock.provider import MockProvider
-from pytest_cppython.tests import ProviderIntegrationTests
+from pytest_cppython.mock.provider import MOCK_ARTIFACT, MockProvider
+from pytest_cppython.registry import RegistryServer
+from pytest_cppython.tests import (
+    AsyncProviderIntegrationTests,
+    ProviderIntegrationTests,
+    ProviderSyncPipelineTests,
+)
 
 
 class TestMockProvider(ProviderIntegrationTests[MockProvider]):
     """The tests for our Mock provider"""
 
+    @pytest.fixture(name="registry_plugin_data", scope="session")
+    def fixture_registry_plugin_data(self, package_registry: RegistryServer, registry_url: str) -> dict[str, Any]:
+        """Serves the mock packages from the local registry
+
+        Args:
+            package_registry: The running registry
+            registry_url: The registry's base URL
+
+        Returns:
+            The registry setting
+        """
+
+        package_registry.store.add(bytes(range(256)), name=MOCK_ARTIFACT)
+
+        return {"registry": registry_url}
+
+    @pytest.fixture(name="plugin_data", scope="session")
+    def fixture_plugin_data(self) -> dict[str, Any]:
+        """Returns mock data
+
+        Returns:
+            An overridden data instance
+        """
+
+        return {}
+
+    @pytest.fixture(name="plugin_type", scope="session")
+    def fixture_plugin_type(self) -> type[MockProvider]:
+        """A required testing hook that allows type generation
+
+        Returns:
+            The overridden provider type
+        """
+        return MockProvider
+
+
+class TestAsyncMockProvider(AsyncProviderIntegrationTests[MockProvider]):
+    """The event loop driven tests for our Mock provider"""
+
+    @pytest.fixture(name="registry_plugin_data", scope="session")
+    def fixture_registry_plugin_data(self, package_registry: RegistryServer, registry_url: str) -> dict[str, Any]:
+        """Serves the mock packages from the local registry
+
+        Args:
+            package_registry: The running registry
+            registry_url: The registry's base URL
+
+        Returns:
+            The registry setting
+        """
+
+        package_registry.store.add(bytes(range(256)), name=MOCK_ARTIFACT)
+
+        return {"registry": registry_url}
+
+    @pytest.fixture(name="plugin_data", scope="session")
+    def fixture_plugin_data(self) -> dict[str, Any]:
+        """Returns mock data with a workload, so the concurrent installs overlap
+
+        Returns:
+            An overridden data instance
+        """
+
+        return {"package-count": 4, "latency": 0.01}
+
+    @pytest.fixture(name="plugin_type", scope="session")
+    def fixture_plugin_type(self) -> type[MockProvider]:
+        """A required testing hook that allows type generation
+
+        Returns:
+            The overridden provider type
+        """
+        return MockProvider
+
+
+class TestMockProviderSyncPipeline(ProviderSyncPipelineTests[MockProvider]):
+    """The end to end sync tests for our Mock provider"""
+
     @pytest.fixture(name="plugin_data", scope="session")
     def fixture_plugin_data(self) -> dict[str, Any]:
         """Returns mock data
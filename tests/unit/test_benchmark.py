@@ -0,0 +1,94 @@
+"""Tests for benchmark measurement"""
+
+import sys
+from typing import Any, cast
+
+import pytest
+
+from pytest_cppython.benchmark import BenchmarkRecorder, BenchmarkResult, measure
+
+
+class _MemoryCache:
+    """Stand-in for the pytest cache that lives for one test"""
+
+    def __init__(self) -> None:
+        self.values: dict[str, Any] = {}
+
+    def get(self, key: str, default: Any) -> Any:
+        """Reads a value
+
+        Args:
+            key: The cache key
+            default: Returned on a missing key
+
+        Returns:
+            The stored value
+        """
+        return self.values.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        """Writes a value
+
+        Args:
+            key: The cache key
+            value: The value to store
+        """
+        self.values[key] = value
+
+
+class TestBenchmark:
+    """Tests for benchmark measurement"""
+
+    def test_statistics(self) -> None:
+        """Verifies the summary statistics of a result"""
+
+        result = BenchmarkResult(
+            name="operation", timings=tuple(float(value) for value in range(1, 21)), rss_growth=None
+        )
+
+        assert result.minimum == 1
+        assert result.median == 10.5
+        assert 19 <= result.p95 <= 20
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Windows doesn't report the peak resident set size")
+    def test_rss_growth(self) -> None:
+        """Verifies that an operation is charged with its growth of the process peak, not the whole peak"""
+
+        result = measure("noop", lambda: None, rounds=5)
+
+        assert result.rss_growth is not None
+        assert 0 <= result.rss_growth < 2**20
+
+    def test_regression(self) -> None:
+        """Verifies that a slower run than the stored baseline fails, and an updating run replaces it"""
+
+        cache = cast(pytest.Cache, _MemoryCache())
+        cache.set(BenchmarkRecorder.baseline_key("test", "sum"), {"median": 0.0, "p95": 0.0})
+
+        def slow() -> None:
+            sum(range(2_000_000))
+
+        with pytest.raises(pytest.fail.Exception):
+            BenchmarkRecorder(cache, rounds=1, threshold=0.25, update=False).run("test", "sum", slow)
+
+        BenchmarkRecorder(cache, rounds=1, threshold=0.25, update=True).run("test", "sum", slow)
+
+        assert cache.get(BenchmarkRecorder.baseline_key("test", "sum"), None)["median"] > 0.0
+
+    def test_footprint(self) -> None:
+        """Verifies that retained memory is attributed per instance and that growth past the baseline fails"""
+
+        result = BenchmarkRecorder(None, rounds=1, threshold=0.25, update=False).footprint(
+            "test", "buffer", lambda: bytearray(64 * 1024), instances=10
+        )
+
+        assert 64 * 1024 <= result.retained < 80 * 1024
+        assert result.peak >= result.retained
+
+        cache = cast(pytest.Cache, _MemoryCache())
+        cache.set(BenchmarkRecorder.footprint_key("test", "buffer"), {"retained": 1024, "peak": 1024})
+
+        with pytest.raises(pytest.fail.Exception):
+            BenchmarkRecorder(cache, rounds=1, threshold=0.25, update=False).footprint(
+                "test", "buffer", lambda: bytearray(64 * 1024)
+            )
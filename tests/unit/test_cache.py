@@ -0,0 +1,263 @@
+"""Tests for the resolution cache"""
+
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+from cppython_core.resolution import (
+    PluginCPPythonData,
+    resolve_cppython,
+    resolve_project_configuration,
+)
+from cppython_core.schema import (
+    CPPythonGlobalConfiguration,
+    CPPythonLocalConfiguration,
+    ProjectConfiguration,
+    ProjectData,
+)
+from pydantic import BaseModel, ValidationError
+
+from pytest_cppython.cache import (
+    PersistentStore,
+    ResolutionCache,
+    fingerprint,
+    freeze,
+    thaw,
+)
+from pytest_cppython.workspace import WorkspaceMaterializer
+
+
+class _Input(BaseModel):
+    """Resolution input"""
+
+    value: int
+
+
+class _Output(BaseModel):
+    """Resolution output"""
+
+    path: Path
+
+
+class _MemoryCache:
+    """Stand-in for the pytest cache that lives for one test"""
+
+    def __init__(self) -> None:
+        self.values: dict[str, Any] = {}
+
+    def get(self, key: str, default: Any) -> Any:
+        """Reads a value
+
+        Args:
+            key: The cache key
+            default: Returned on a missing key
+
+        Returns:
+            The stored value
+        """
+        return self.values.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        """Writes a value
+
+        Args:
+            key: The cache key
+            value: The value to store
+        """
+        self.values[key] = value
+
+
+class TestResolutionCache:
+    """Tests for the resolution cache"""
+
+    def test_fingerprint_stable(self) -> None:
+        """Verifies that equal models hash equally and different models do not"""
+
+        assert fingerprint(_Input(value=1)) == fingerprint(_Input(value=1))
+        assert fingerprint(_Input(value=1)) != fingerprint(_Input(value=2))
+
+    def test_hits(self) -> None:
+        """Verifies that equal inputs are only resolved once"""
+
+        cache = ResolutionCache()
+        calls: list[int] = []
+
+        def resolver(data: _Input) -> int:
+            calls.append(data.value)
+            return data.value * 2
+
+        assert cache.resolve("double", resolver, _Input(value=2)) == 4
+        assert cache.resolve("double", resolver, _Input(value=2)) == 4
+        assert cache.resolve("double", resolver, _Input(value=3)) == 6
+
+        assert calls == [2, 3]
+        assert cache.hits["double"] == 1
+        assert cache.misses["double"] == 2
+
+    def test_file_invalidation(self, tmp_path: Path) -> None:
+        """Verifies that a file content change invalidates the entry
+
+        Args:
+            tmp_path: Temporary directory
+        """
+
+        cache = ResolutionCache()
+        file = tmp_path / "pyproject.toml"
+        file.write_text("first", encoding="utf-8")
+
+        cache.resolve("read", file.read_text, files=[file])
+        file.write_text("second", encoding="utf-8")
+
+        assert cache.resolve("read", file.read_text, files=[file]) == "second"
+        assert cache.misses["read"] == 2
+
+    def test_rebuilt_workspace(self, tmp_path: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+        """Verifies that a workspace cloned again from the same template reuses the entry, moved into it
+
+        Args:
+            tmp_path: Temporary directory
+            tmp_path_factory: Factory for the workspaces
+        """
+
+        data_path = tmp_path / "data"
+        data_path.mkdir()
+        (data_path / "pyproject.toml").write_text("[project]", encoding="utf-8")
+
+        materializer = WorkspaceMaterializer(tmp_path_factory)
+        cache = ResolutionCache()
+        calls: list[Path] = []
+
+        def resolver(file: _Output) -> _Output:
+            calls.append(file.path)
+            return _Output(path=file.path.parent)
+
+        resolved = []
+
+        # Pytest tears the fixture chain down and materializes a new workspace when the parameters change
+        for _ in range(2):
+            workspace = materializer.materialize(data_path, None)
+            file = (workspace / "pyproject.toml").resolve()
+
+            resolved.append(
+                cache.resolve(
+                    "project", resolver, _Output(path=file), files=[file], workspace=materializer.origin(file)
+                )
+            )
+
+        first, second = (output.path for output in resolved)
+
+        assert len(calls) == 1
+        assert cache.hits["project"] == 1
+        assert cache.misses["project"] == 1
+        assert first != second
+        assert materializer.origin(second / "pyproject.toml") == (second, (data_path, None))
+
+    def test_persistent_restore(self, tmp_path: Path) -> None:
+        """Verifies that a new session restores entries with its own root substituted
+
+        Args:
+            tmp_path: Temporary directory
+        """
+
+        backing = cast(pytest.Cache, _MemoryCache())
+        first_root = tmp_path / "pytest-1"
+        second_root = tmp_path / "pytest-2"
+        second_root.mkdir()
+
+        def resolver(data: _Input) -> _Output:
+            return _Output(path=first_root / str(data.value))
+
+        first = ResolutionCache(PersistentStore(backing, "salt"))
+        first.root = first_root
+        first.resolve("output", resolver, _Input(value=1))
+
+        second = ResolutionCache(PersistentStore(backing, "salt"))
+        second.root = second_root
+        restored = second.resolve("output", resolver, _Input(value=1))
+
+        assert restored == _Output(path=second_root / "1")
+        assert second.restored["output"] == 1
+        assert second.misses["output"] == 0
+
+        # A different environment never sees the entry
+        other = ResolutionCache(PersistentStore(backing, "other"))
+        other.root = second_root
+        other.resolve("output", resolver, _Input(value=1))
+
+        assert other.misses["output"] == 1
+
+    def test_freeze(self) -> None:
+        """Verifies that frozen models reject changes and thawed copies are independent"""
+
+        frozen = freeze(_Output(path=Path("frozen")))
+
+        assert isinstance(frozen, _Output)
+
+        with pytest.raises(ValidationError):
+            frozen.path = Path("changed")
+
+        thawed = thaw(frozen)
+        thawed.path = Path("changed")
+
+        assert type(thawed) is _Output
+        assert frozen.path == Path("frozen")
+
+
+class TestPersistedModels:
+    """Tests for persisting the cppython_core models that the data fixtures resolve"""
+
+    def test_project_data(
+        self, project_configuration: ProjectConfiguration, workspace_materializer: WorkspaceMaterializer
+    ) -> None:
+        """Verifies that a later session restores the project data instead of resolving it
+
+        Args:
+            project_configuration: The project in its workspace
+            workspace_materializer: Identifies the template of the workspace
+        """
+
+        backing = cast(pytest.Cache, _MemoryCache())
+        origin = workspace_materializer.origin(project_configuration.pyproject_file)
+        files = [project_configuration.pyproject_file]
+
+        first = ResolutionCache(PersistentStore(backing, "salt"))
+        resolved = first.resolve(
+            "project_data", resolve_project_configuration, project_configuration, files=files, workspace=origin
+        )
+
+        second = ResolutionCache(PersistentStore(backing, "salt"))
+        restored = second.resolve(
+            "project_data", resolve_project_configuration, project_configuration, files=files, workspace=origin
+        )
+
+        assert isinstance(restored, ProjectData)
+        assert restored == resolved
+        assert second.restored["project_data"] == 1
+
+    def test_cppython_data(
+        self,
+        cppython_local_configuration: CPPythonLocalConfiguration,
+        cppython_global_configuration: CPPythonGlobalConfiguration,
+        project_data: ProjectData,
+        plugin_cppython_data: PluginCPPythonData,
+    ) -> None:
+        """Verifies that the CPPython data, whose resolution creates directories, is resolved in every session
+
+        Args:
+            cppython_local_configuration: The local configuration
+            cppython_global_configuration: The global configuration
+            project_data: The project data
+            plugin_cppython_data: Plugin data for CPPython resolution
+        """
+
+        backing = _MemoryCache()
+        arguments = (cppython_local_configuration, cppython_global_configuration, project_data, plugin_cppython_data)
+
+        for _ in range(2):
+            cache = ResolutionCache(PersistentStore(cast(pytest.Cache, backing), "salt"))
+            resolved = cache.resolve("cppython_data", resolve_cppython, *arguments, persist=False)
+
+            assert cache.misses["cppython_data"] == 1
+            assert resolved.install_path.is_dir()
+
+        assert not backing.values
@@ -0,0 +1,115 @@
+"""Tests the sync type compatibility index"""
+
+from typing import Any, cast
+
+from cppython_core.plugin_schema.generator import Generator
+from cppython_core.plugin_schema.provider import Provider
+
+from pytest_cppython.compatibility import build_compatibility_index
+
+
+class _First:
+    """A sync type"""
+
+
+class _Second:
+    """A sync type"""
+
+
+class _Unused:
+    """A sync type no generator consumes"""
+
+
+class _Generator:
+    """Consumes both sync types, preferring the second"""
+
+    @staticmethod
+    def sync_types() -> list[type]:
+        """The consumed sync types
+
+        Returns:
+            The types
+        """
+        return [_Second, _First]
+
+
+class _Provider:
+    """Produces the first and unused sync types"""
+
+    @staticmethod
+    def supported_sync_type(sync_type: type) -> bool:
+        """Whether the sync type is produced
+
+        Args:
+            sync_type: The sync type
+
+        Returns:
+            Whether it is supported
+        """
+        return sync_type in (_First, _Unused)
+
+
+class _Silent:
+    """Produces nothing"""
+
+    @staticmethod
+    def supported_sync_type(sync_type: type) -> bool:
+        """Whether the sync type is produced
+
+        Args:
+            sync_type: The sync type
+
+        Returns:
+            Never
+        """
+        return False
+
+
+def _build(providers: list[Any], generators: list[Any]) -> Any:
+    """Builds an index over the stand in plugins
+
+    Args:
+        providers: The providers
+        generators: The generators
+
+    Returns:
+        The index
+    """
+
+    return build_compatibility_index(cast(list[type[Provider]], providers), cast(list[type[Generator]], generators))
+
+
+class TestCompatibilityIndex:
+    """Tests the index construction and lookups"""
+
+    @staticmethod
+    def test_lookups() -> None:
+        """Verifies the sync type to plugin maps"""
+
+        index = _build([_Provider, _Silent], [_Generator])
+
+        assert index.sync_types == [_Second, _First]
+        assert index.providers_for(_First) == {_Provider}
+        assert index.providers_for(_Second) == frozenset()
+        assert index.generators_for(_First) == {_Generator}
+        assert index.provider_types == {_Provider, _Silent}
+        assert index.generator_types == {_Generator}
+
+    @staticmethod
+    def test_unconsumed_sync_type() -> None:
+        """Verifies that sync types no generator consumes aren't indexed"""
+
+        index = _build([_Provider], [_Generator])
+
+        assert _Unused not in index.sync_types
+        assert index.providers_for(_Unused) == frozenset()
+
+    @staticmethod
+    def test_pairs() -> None:
+        """Verifies the shared sync types of each provider and generator pair"""
+
+        index = _build([_Provider, _Silent, _Provider], [_Generator])
+
+        assert index.compatible(_Provider, _Generator) == (_First,)
+        assert index.compatible(_Silent, _Generator) == ()
+        assert index.compatible(_Provider, _Silent) == ()
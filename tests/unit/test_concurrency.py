@@ -0,0 +1,57 @@
+"""Tests for the concurrency stress test helpers"""
+
+from functools import partial
+from itertools import count
+from pathlib import Path
+
+from pytest_cppython.concurrency import ScalingRecorder, checksum, invoke, worker_counts
+
+
+class TestConcurrency:
+    """Tests for the concurrency stress test helpers"""
+
+    def test_directory_checksum(self, tmp_path: Path) -> None:
+        """Verifies that directories are compared by their content rather than their location
+
+        Args:
+            tmp_path: Temporary directory
+        """
+
+        for name in ("first", "second"):
+            (tmp_path / name / "package").mkdir(parents=True)
+            (tmp_path / name / "package" / "artifact.bin").write_bytes(b"content")
+
+        assert checksum(tmp_path / "first") == checksum(tmp_path / "second")
+
+        (tmp_path / "second" / "package" / "artifact.bin").write_bytes(b"changed")
+
+        assert checksum(tmp_path / "first") != checksum(tmp_path / "second")
+
+    def test_worker_counts(self) -> None:
+        """Verifies that the curve doubles the workers and ends at the maximum"""
+
+        assert worker_counts(1) == [1]
+        assert worker_counts(6) == [1, 2, 4, 6]
+        assert worker_counts(8) == [1, 2, 4, 8]
+
+    def test_race_detection(self) -> None:
+        """Verifies that calls with differing output are reported as distinct checksums"""
+
+        recorder = ScalingRecorder()
+        calls = count()
+
+        stable = recorder.run("test", "stable", partial(invoke, "value", "upper"), max_workers=4, calls=16)
+        unstable = recorder.run("test", "unstable", lambda: checksum(next(calls)), max_workers=4, calls=16)
+
+        assert stable == {checksum("VALUE")}
+        assert len(unstable) > 1
+        assert [point.workers for point in recorder.curves[0][2]] == [1, 2, 4]
+
+    def test_processes(self) -> None:
+        """Verifies that picklable tasks run in worker processes"""
+
+        recorder = ScalingRecorder()
+
+        assert recorder.run("test", "upper", partial(invoke, "value", "upper"), 2, 4, processes=True) == {
+            checksum("VALUE")
+        }
@@ -0,0 +1,62 @@
+"""Tests for data directory discovery"""
+
+import os
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+
+from pytest_cppython.discovery import DirectoryScanner
+
+
+class TestDirectoryScanner:
+    """Tests for data directory discovery"""
+
+    def test_reuse_and_invalidate(self, tmp_path: Path) -> None:
+        """Verifies that listings are reused until the directory changes
+
+        Args:
+            tmp_path: Temporary directory
+        """
+
+        (tmp_path / "first").mkdir()
+        (tmp_path / "file.txt").write_text("", encoding="utf-8")
+
+        scanner = DirectoryScanner()
+
+        assert scanner.subdirectories(tmp_path) == [tmp_path / "first"]
+        assert scanner.subdirectories(tmp_path) == [tmp_path / "first"]
+        assert scanner.scans == 1
+        assert scanner.reuses == 1
+
+        (tmp_path / "second").mkdir()
+
+        # Coarse filesystem timestamps may not move on their own within the test
+        stat = tmp_path.stat()
+        os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert scanner.subdirectories(tmp_path) == [tmp_path / "first", tmp_path / "second"]
+        assert scanner.scans == 2
+
+    def test_missing_directory(self, tmp_path: Path) -> None:
+        """Verifies that a missing directory lists as empty
+
+        Args:
+            tmp_path: Temporary directory
+        """
+
+        assert not DirectoryScanner().children(tmp_path / "missing")
+
+    def test_report_without_scans(self, mocker: MockerFixture) -> None:
+        """Verifies that sessions which never scanned a data directory don't print the profile
+
+        Args:
+            mocker: The pytest-mock fixture
+        """
+
+        scanner = DirectoryScanner()
+        scanner.hook_calls = 10
+        terminal_reporter = mocker.Mock()
+
+        scanner.report(terminal_reporter)
+
+        terminal_reporter.write_sep.assert_not_called()
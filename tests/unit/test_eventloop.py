@@ -0,0 +1,32 @@
+"""Tests for event loop lag measurement"""
+
+import asyncio
+import time
+
+from pytest_cppython.eventloop import EventLoopLagRecorder
+
+
+class TestEventLoopLag:
+    """Tests for event loop lag measurement"""
+
+    def test_blocking_lag(self) -> None:
+        """Verifies that a coroutine blocking the loop shows up as lag while a sleeping one doesn't"""
+
+        recorder = EventLoopLagRecorder(interval=0.001)
+
+        async def run() -> None:
+            async with recorder.watch("test", "sleeping"):
+                await asyncio.sleep(0.05)
+
+            async with recorder.watch("test", "blocking"):
+                await asyncio.sleep(0.005)
+                time.sleep(0.1)
+                await asyncio.sleep(0.005)
+
+        asyncio.run(run())
+
+        sleeping, blocking = (result for _, result in recorder.results)
+
+        assert sleeping.samples
+        assert blocking.maximum >= 0.05
+        assert blocking.maximum > sleeping.maximum
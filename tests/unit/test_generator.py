@@ -5,7 +5,7 @@ from typing import Any
 import pytest
 
 from pytest_cppython.mock.generator import MockGenerator
-from pytest_cppython.tests import GeneratorUnitTests
+from pytest_cppython.tests import GeneratorCompatibilityTests, GeneratorUnitTests
 
 
 class TestCPPythonGenerator(GeneratorUnitTests[MockGenerator]):
@@ -29,3 +29,26 @@ class TestCPPythonGenerator(GeneratorUnitTests[MockGenerator]):
             An overridden generator type
         """
         return MockGenerator
+
+
+class TestMockGeneratorCompatibility(GeneratorCompatibilityTests[MockGenerator]):
+    """Checks the compatibility index against the Mock generator"""
+
+    @pytest.fixture(name="plugin_data", scope="session")
+    def fixture_plugin_data(self) -> dict[str, Any]:
+        """Returns mock data
+
+        Returns:
+            An overridden data instance
+        """
+
+        return {}
+
+    @pytest.fixture(name="plugin_type", scope="session")
+    def fixture_plugin_type(self) -> type[MockGenerator]:
+        """A required testing hook that allows type generation
+
+        Returns:
+            An overridden generator type
+        """
+        return MockGenerator
@@ -0,0 +1,50 @@
+"""Tests for variant matrix pruning"""
+
+from itertools import combinations, product
+from types import SimpleNamespace
+from typing import cast
+
+import pytest
+
+from pytest_cppython.matrix import covering_subset, variant_group
+
+
+class TestMatrix:
+    """Tests for variant matrix pruning"""
+
+    def test_pairwise_coverage(self) -> None:
+        """Verifies that the subset covers every pair of a full product while running fewer combinations"""
+
+        rows = [
+            (("first", first), ("second", second), ("third", third), ("fourth", fourth))
+            for first, second, third, fourth in product(range(3), repeat=4)
+        ]
+
+        picked = [rows[index] for index in covering_subset(rows)]
+
+        expected = {pair for row in rows for pair in combinations(row, 2)}
+        covered = {pair for row in picked for pair in combinations(row, 2)}
+
+        assert covered == expected
+        assert len(picked) < len(rows) / 4
+
+    def test_single_dimension(self) -> None:
+        """Verifies that every value of a lone dimension is kept"""
+
+        rows = [(("only", index),) for index in range(3)]
+
+        assert covering_subset(rows) == [0, 1, 2]
+
+    def test_variant_group(self) -> None:
+        """Verifies that items sharing session parameters share a group regardless of other parameters"""
+
+        def item(**indices: int) -> pytest.Item:
+            return cast(pytest.Item, SimpleNamespace(callspec=SimpleNamespace(indices=indices)))
+
+        first = variant_group(item(provider_type=0, internal_data_path=0, local=0))
+        second = variant_group(item(provider_type=0, internal_data_path=0, local=1))
+        other = variant_group(item(provider_type=1, internal_data_path=0, local=0))
+
+        assert first == second
+        assert first != other
+        assert variant_group(item(local=0)) is None
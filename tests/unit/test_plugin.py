@@ -0,0 +1,154 @@
+"""Tests for the pytest plugin entry point"""
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+from pytest_cppython.plugin import CLONE_STRATEGIES, WORKSPACE_BACKENDS
+from pytest_cppython.storage import WorkspaceBackend
+from pytest_cppython.workspace import CloneStrategy
+
+
+class TestPlugin:
+    """Tests for the pytest plugin entry point"""
+
+    def test_lazy_import(self) -> None:
+        """Verifies that loading the plugin doesn't import cppython_core, build the variants or import what only the
+        fixtures and hooks use
+        """
+
+        deferred = {
+            "asyncio",
+            "cppython_core",
+            "http.server",
+            "tracemalloc",
+            "pytest_cppython.benchmark",
+            "pytest_cppython.eventloop",
+            "pytest_cppython.registry",
+            "pytest_cppython.repository",
+            "pytest_cppython.startup",
+            "pytest_cppython.storage",
+            "pytest_cppython.variants",
+            "pytest_cppython.workspace",
+        }
+        script = f"import sys, pytest_cppython.plugin; print(sorted(set(sys.modules) & {deferred!r}))"
+        process = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+
+        assert process.stdout.strip() == "[]"
+
+    def test_option_choices(self) -> None:
+        """Verifies that the spelled out option choices match the enums they are parsed into"""
+
+        assert CLONE_STRATEGIES == tuple(strategy.value for strategy in CloneStrategy)
+        assert WORKSPACE_BACKENDS == tuple(backend.value for backend in WorkspaceBackend)
+
+    def test_deferred_fixtures(self, tmp_path: Path) -> None:
+        """Verifies that a module requesting a CPPython fixture without importing cppython_core gets the real,
+        parametrized fixture
+
+        Args:
+            tmp_path: Temporary directory
+        """
+
+        # Stands in for the fixtures module, which needs cppython_core. The conftest directory is on 'sys.path'
+        (tmp_path / "fixtures_stand_in.py").write_text(
+            "import pytest\n"
+            "@pytest.fixture(name='pep621_configuration', scope='session', params=[1, 2])\n"
+            "def fixture_pep621_configuration(request):\n"
+            "    return request.param\n"
+            "@pytest.fixture(name='core_data', scope='session')\n"
+            "def fixture_core_data(pep621_configuration):\n"
+            "    return pep621_configuration\n",
+            encoding="utf-8",
+        )
+        (tmp_path / "conftest.py").write_text(
+            "import pytest_cppython.plugin\npytest_cppython.plugin.FIXTURES_PLUGIN = 'fixtures_stand_in'\n",
+            encoding="utf-8",
+        )
+        (tmp_path / "test_core.py").write_text(
+            "def test_core(core_data):\n    assert core_data in (1, 2)\n", encoding="utf-8"
+        )
+
+        process = subprocess.run(
+            [sys.executable, "-m", "pytest", "-p", "pytest_cppython.plugin", "-p", "no:cacheprovider", "-q"],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+        assert "2 passed" in process.stdout, process.stdout + process.stderr
+
+    def test_without_cache_provider(self, tmp_path: Path) -> None:
+        """Verifies that a session runs with pytest's cache disabled
+
+        Args:
+            tmp_path: Temporary directory
+        """
+
+        (tmp_path / "test_empty.py").write_text("def test_empty() -> None:\n    pass\n", encoding="utf-8")
+
+        process = subprocess.run(
+            [sys.executable, "-m", "pytest", "-p", "no:cacheprovider", "-p", "pytest_cppython.plugin", "-q"],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+        assert process.returncode == 0, process.stdout + process.stderr
+
+    def test_matrix_pruned_at_generation(self, tmp_path: Path) -> None:
+        """Verifies that pairwise mode creates fewer items instead of deselecting collected ones
+
+        Args:
+            tmp_path: Temporary directory
+        """
+
+        dimensions = ("provider_type", "generator_type", "scm_type")
+        fixtures = "".join(
+            f"@pytest.fixture(name='{name}', params=[0, 1, 2])\n"
+            f"def fixture_{name}(request):\n"
+            "    return request.param\n"
+            for name in dimensions
+        )
+        test = f"def test_matrix({', '.join(dimensions)}):\n    pass\n"
+        (tmp_path / "test_matrix.py").write_text(f"import pytest\n{fixtures}{test}", encoding="utf-8")
+
+        process = subprocess.run(
+            [sys.executable, "-m", "pytest", "-p", "pytest_cppython.plugin", "--cppython-matrix=pairwise", "-q"],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+        assert process.returncode == 0, process.stdout + process.stderr
+        assert "deselected" not in process.stdout
+
+        # Every pair of the 3 dimensions has 9 value pairs to cover, the full product has 27 rows
+        assert (passed := re.search(r"(\d+) passed", process.stdout)) is not None
+        assert 9 <= int(passed.group(1)) < 27
+
+    def test_benchmarks_opt_in(self, tmp_path: Path) -> None:
+        """Verifies that benchmark tests are skipped unless requested
+
+        Args:
+            tmp_path: Temporary directory
+        """
+
+        (tmp_path / "test_benchmark.py").write_text(
+            "import pytest\n@pytest.mark.cppython_benchmark\ndef test_benchmark() -> None:\n    pass\n",
+            encoding="utf-8",
+        )
+
+        command = [sys.executable, "-m", "pytest", "-p", "pytest_cppython.plugin", "-q", "--strict-markers"]
+
+        skipped = subprocess.run(command, cwd=tmp_path, capture_output=True, text=True, check=False)
+        requested = subprocess.run(
+            [*command, "--cppython-benchmarks"], cwd=tmp_path, capture_output=True, text=True, check=False
+        )
+
+        assert "1 skipped" in skipped.stdout, skipped.stdout + skipped.stderr
+        assert "1 passed" in requested.stdout, requested.stdout + requested.stderr
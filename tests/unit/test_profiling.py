@@ -0,0 +1,28 @@
+"""Tests for the fixture profiler"""
+
+from pathlib import Path
+
+from pytest_cppython.profiling import FixtureProfiler
+
+
+class TestFixtureProfiler:
+    """Tests for the fixture profiler"""
+
+    def test_collapsed_stacks(self, tmp_path: Path) -> None:
+        """Verifies that timings are summed per fixture and variant in the collapsed stack format
+
+        Args:
+            tmp_path: Temporary directory
+        """
+
+        output = tmp_path / "profile.folded"
+        profiler = FixtureProfiler(output)
+
+        profiler.timings[("project_data", "cppython-variant")].extend([0.001, 0.002])
+        profiler.timings[("plugin", "default")].append(0.5)
+        profiler.pytest_sessionfinish()
+
+        assert output.read_text(encoding="utf-8").splitlines() == [
+            "cppython;default;plugin 500000",
+            "cppython;cppython-variant;project_data 3000",
+        ]
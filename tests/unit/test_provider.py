@@ -1,5 +1,6 @@
 """Test the functions related to the internal provider implementation and the 'Provider' interface itself"""
 
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -7,7 +8,7 @@ from pytest_mock import MockerFixture
 
 from pytest_cppython.mock.generator import MockGenerator, MockSyncData
 from pytest_cppython.mock.provider import MockProvider
-from pytest_cppython.tests import ProviderUnitTests
+from pytest_cppython.tests import ProviderCompatibilityTests, ProviderUnitTests
 
 
 class TestMockProvider(ProviderUnitTests[MockProvider]):
@@ -44,3 +45,47 @@ class TestMockProvider(ProviderUnitTests[MockProvider]):
         mock_generator.sync_types.return_value = MockGenerator.sync_types()
 
         assert plugin.sync_data(mock_generator)
+
+    def test_simulated_workload(self, plugin: MockProvider, tmp_path: Path) -> None:
+        """Verify that a configured workload writes its packages into the install path
+
+        Args:
+            plugin: The plugin instance
+            tmp_path: A private install path, the session one is shared with other provider tests
+        """
+
+        cppython_data = plugin.core_data.cppython_data.model_copy(update={"install_path": tmp_path})
+        core_data = plugin.core_data.model_copy(update={"cppython_data": cppython_data})
+
+        configuration = {"package-count": 3, "artifact-size": 300, "concurrency": 2}
+        provider = MockProvider(plugin.group_data, core_data, configuration)
+
+        provider.install()
+
+        artifacts = sorted(tmp_path.glob("package-*/artifact.bin"))
+
+        assert len(artifacts) == 3
+        assert all(artifact.read_bytes() == bytes(range(256)) + bytes(range(44)) for artifact in artifacts)
+
+
+class TestMockProviderCompatibility(ProviderCompatibilityTests[MockProvider]):
+    """Checks the compatibility index against the Mock provider"""
+
+    @pytest.fixture(name="plugin_data", scope="session")
+    def fixture_plugin_data(self) -> dict[str, Any]:
+        """Returns mock data
+
+        Returns:
+            An overridden data instance
+        """
+
+        return {}
+
+    @pytest.fixture(name="plugin_type", scope="session")
+    def fixture_plugin_type(self) -> type[MockProvider]:
+        """A required testing hook that allows type generation
+
+        Returns:
+            An overridden provider type
+        """
+        return MockProvider
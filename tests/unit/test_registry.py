@@ -0,0 +1,88 @@
+"""Tests for the local registry server"""
+
+import time
+import urllib.error
+import urllib.request
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from pytest_cppython.registry import RegistryServer
+
+
+class TestRegistryServer:
+    """Tests for the local registry server"""
+
+    @pytest.fixture(name="registry")
+    def fixture_registry(self, tmp_path: Path) -> Iterator[RegistryServer]:
+        """A registry for a single test
+
+        Args:
+            tmp_path: Temporary directory
+
+        Yields:
+            The running registry
+        """
+
+        with RegistryServer(tmp_path) as server:
+            yield server
+
+    def test_download(self, registry: RegistryServer) -> None:
+        """Verifies that artifacts are served by digest and by name
+
+        Args:
+            registry: The running registry
+        """
+
+        digest = registry.store.add(b"tooling", name="tool.zip")
+
+        with urllib.request.urlopen(registry.artifact_url(digest)) as response:
+            assert response.read() == b"tooling"
+
+        with urllib.request.urlopen(registry.file_url("tool.zip")) as response:
+            assert response.headers["ETag"] == f'"{digest}"'
+
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(registry.file_url("missing"))
+
+    def test_resume_and_revalidate(self, registry: RegistryServer) -> None:
+        """Verifies that ranges resume downloads and matching ETags skip them
+
+        Args:
+            registry: The running registry
+        """
+
+        digest = registry.store.add(b"0123456789")
+
+        resume = urllib.request.Request(registry.artifact_url(digest), headers={"Range": "bytes=4-"})
+
+        with urllib.request.urlopen(resume) as response:
+            assert response.status == 206
+            assert response.read() == b"456789"
+
+        revalidate = urllib.request.Request(registry.artifact_url(digest), headers={"If-None-Match": f'"{digest}"'})
+
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(revalidate)
+
+        assert error.value.code == 304
+        assert registry.bytes_sent == 6
+
+    def test_throttling(self, registry: RegistryServer) -> None:
+        """Verifies that latency and bandwidth slow responses down
+
+        Args:
+            registry: The running registry
+        """
+
+        digest = registry.store.add(bytes(64 * 1024))
+        registry.latency = 0.05
+        registry.bandwidth = 1024 * 1024
+
+        start = time.perf_counter()
+
+        with urllib.request.urlopen(registry.artifact_url(digest)) as response:
+            response.read()
+
+        assert time.perf_counter() - start >= 0.1
@@ -0,0 +1,58 @@
+"""Tests for synthetic git repositories"""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from pytest_cppython.repository import RepositoryFactory, RepositorySpec
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git isn't installed")
+class TestRepository:
+    """Tests for synthetic git repositories"""
+
+    def test_shape(self, tmp_path: Path) -> None:
+        """Verifies the commit, tag and file counts of a built repository
+
+        Args:
+            tmp_path: Temporary directory
+        """
+
+        repository = RepositoryFactory(tmp_path)(RepositorySpec(commits=50, tags=5, files=20))
+
+        def git(*args: str) -> str:
+            return subprocess.run(
+                ["git", *args], cwd=repository, capture_output=True, text=True, check=True
+            ).stdout.strip()
+
+        assert git("rev-list", "--count", "HEAD") == "50"
+        assert len(git("tag").splitlines()) == 5
+        assert git("describe", "--tags") == "v0.5.0"
+        assert len(git("ls-files").splitlines()) == 21
+        assert git("status", "--porcelain") == ""
+
+    def test_reuse(self, tmp_path: Path) -> None:
+        """Verifies that a later factory reuses the published repository, whose history is reproducible
+
+        Args:
+            tmp_path: Temporary directory
+        """
+
+        spec = RepositorySpec(commits=10, tags=1, files=5)
+        repository = RepositoryFactory(tmp_path / "first")(spec)
+        marker = repository / ".git" / "HEAD"
+        modified = marker.stat().st_mtime_ns
+
+        assert RepositoryFactory(tmp_path / "first")(spec) == repository
+        assert marker.stat().st_mtime_ns == modified
+
+        other = RepositoryFactory(tmp_path / "second")(spec)
+
+        def head(path: Path) -> str:
+            return subprocess.run(
+                ["git", "rev-parse", "HEAD"], cwd=path, capture_output=True, text=True, check=True
+            ).stdout
+
+        assert head(repository) == head(other)
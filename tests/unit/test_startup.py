@@ -0,0 +1,34 @@
+"""Tests for entry point import measurement"""
+
+import pytest
+
+from pytest_cppython.startup import parse_import_times, profile_entry_point
+
+
+class TestStartup:
+    """Tests for entry point import measurement"""
+
+    def test_parse_import_times(self) -> None:
+        """Verifies that only the imports after the start marker are parsed, with their nesting depth"""
+
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       100 |        100 | json\n"
+            "cppython-import-start\n"
+            "import time:        50 |         50 |   _heapq\n"
+            "import time:       200 |        250 | heapq\n"
+        )
+
+        records = parse_import_times(output)
+
+        assert [(record.module, record.depth) for record in records] == [("_heapq", 1), ("heapq", 0)]
+        assert records[1].cumulative_time == pytest.approx(0.00025)
+
+    def test_profile_entry_point(self) -> None:
+        """Verifies that an entry point is loaded in a fresh interpreter, where its imports are measured"""
+
+        profile = profile_entry_point("console_scripts", "pytest")
+
+        assert profile.modules > 0
+        assert profile.elapsed > 0
+        assert any(record.module.startswith("_pytest") for record in profile.records)
@@ -0,0 +1,146 @@
+"""Tests the workspace storage backends"""
+
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pytest_cppython.storage import (
+    WorkspaceBackend,
+    WorkspaceStorage,
+    find_memory_root,
+    probe_io,
+)
+
+
+class TestStorage:
+    """Tests the workspace storage backends"""
+
+    @staticmethod
+    def test_disk(tmp_path: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+        """Verifies that the disk backend defers to pytest
+
+        Args:
+            tmp_path: Temporary directory
+            tmp_path_factory: Factory for centralized temporary directories
+        """
+
+        storage = WorkspaceStorage(WorkspaceBackend.DISK)
+
+        assert storage.open(tmp_path) is None
+        assert storage.mktemp("workspace-", tmp_path_factory).is_relative_to(tmp_path_factory.getbasetemp())
+
+    @staticmethod
+    def test_memory(tmp_path: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+        """Verifies that directories are numbered below the memory root, which is only deleted by 'remove'
+
+        Args:
+            tmp_path: Temporary directory, standing in for the RAM backed filesystem
+            tmp_path_factory: Factory for centralized temporary directories
+        """
+
+        storage = WorkspaceStorage(WorkspaceBackend.MEMORY, memory=tmp_path)
+        root = storage.open(tmp_path_factory.getbasetemp())
+
+        assert root is not None and root.parent == tmp_path
+        assert storage.disk_probe is not None and storage.memory_probe is not None
+
+        first = storage.mktemp("workspace-", tmp_path_factory)
+        second = storage.mktemp("workspace-", tmp_path_factory)
+
+        assert (first.name, second.name) == ("workspace-0", "workspace-1")
+        assert first.parent == root
+
+        storage.record(first, 1.0)
+        storage.record(tmp_path_factory.getbasetemp(), 1.0)
+
+        assert storage.io_time == 1.0
+
+        storage.close()
+
+        assert root.exists()
+
+        storage.remove(tmp_path_factory.getbasetemp())
+
+        assert not root.exists()
+
+    @staticmethod
+    def test_shared_root(tmp_path: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+        """Verifies that workers share the root with their own workspace directories, and that a worker leaving
+        early only deletes its own directory
+
+        Args:
+            tmp_path: Temporary directory, standing in for the RAM backed filesystem
+            tmp_path_factory: Factory for centralized temporary directories
+        """
+
+        disk = tmp_path_factory.getbasetemp()
+        first = WorkspaceStorage(WorkspaceBackend.MEMORY, memory=tmp_path)
+        second = WorkspaceStorage(WorkspaceBackend.MEMORY, memory=tmp_path)
+
+        root = first.open(disk, "gw0")
+        assert root is not None
+        assert second.open(disk, "gw1") == root
+
+        early = first.mktemp("workspace-", tmp_path_factory)
+        late = second.mktemp("workspace-", tmp_path_factory)
+
+        assert (early.parent, late.parent) == (root / "gw0", root / "gw1")
+
+        first.close()
+
+        assert not early.exists()
+        assert late.exists()
+
+        second.close()
+        WorkspaceStorage(WorkspaceBackend.MEMORY, memory=tmp_path).remove(disk)
+
+        assert not root.exists()
+
+    @staticmethod
+    def test_size_cap(tmp_path: Path, tmp_path_factory: pytest.TempPathFactory, mocker: MockerFixture) -> None:
+        """Verifies that directories fall back to disk once the session's usage of the filesystem reaches the cap
+
+        Args:
+            tmp_path: Temporary directory, standing in for the RAM backed filesystem
+            tmp_path_factory: Factory for centralized temporary directories
+            mocker: The pytest-mock fixture
+        """
+
+        disk_usage = mocker.patch("pytest_cppython.storage.shutil.disk_usage")
+        disk_usage.return_value = mocker.Mock(used=2**20, free=2**30)
+
+        storage = WorkspaceStorage(WorkspaceBackend.MEMORY, size_cap=4096, memory=tmp_path)
+        root = storage.open(tmp_path_factory.getbasetemp())
+        assert root is not None
+
+        storage.mktemp("workspace-", tmp_path_factory)
+
+        # The workspace grew past the cap
+        disk_usage.return_value = mocker.Mock(used=2**20 + 8192, free=2**30 - 8192)
+
+        fallback = storage.mktemp("workspace-", tmp_path_factory)
+
+        assert not fallback.is_relative_to(root)
+        assert (storage.allocated, storage.fallbacks) == (1, 1)
+
+    @staticmethod
+    def test_find_memory_root(tmp_path: Path) -> None:
+        """Verifies that missing directories aren't used
+
+        Args:
+            tmp_path: Temporary directory
+        """
+
+        assert find_memory_root((tmp_path / "missing",)) is None
+
+    @staticmethod
+    def test_probe_io(tmp_path: Path) -> None:
+        """Verifies that the probe cleans up after itself
+
+        Args:
+            tmp_path: Temporary directory
+        """
+
+        assert probe_io(tmp_path) > 0
+        assert not list(tmp_path.iterdir())
@@ -0,0 +1,114 @@
+"""Tests for the tooling manager"""
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from pytest_cppython.mock.provider import MockProvider
+from pytest_cppython.tooling import COMPLETION_MARKER, ToolCache, ToolingManager
+
+
+class TestToolingManager:
+    """Tests for the tooling manager"""
+
+    def test_download_once(self, tmp_path: Path) -> None:
+        """Verifies that a completed download is reused by a later manager, such as another xdist worker
+
+        Args:
+            tmp_path: Temporary directory
+        """
+
+        with asyncio.Runner() as runner:
+            directory = ToolingManager(tmp_path, runner).ensure(MockProvider)
+
+        assert MockProvider.downloaded == directory
+        assert (directory / COMPLETION_MARKER).exists()
+
+        MockProvider.downloaded = None
+
+        with asyncio.Runner() as runner:
+            assert ToolingManager(tmp_path, runner).ensure(MockProvider) == directory
+
+        assert MockProvider.downloaded is None
+
+    def test_tool_cache(self, tmp_path: Path) -> None:
+        """Verifies that a later session links the cached tooling instead of downloading it again
+
+        Args:
+            tmp_path: Temporary directory
+        """
+
+        tool_cache = ToolCache(tmp_path / "cache")
+
+        with asyncio.Runner() as runner:
+            first = ToolingManager(tmp_path / "first", runner, tool_cache).ensure(MockProvider, {"latency": 0})
+
+        assert MockProvider.downloaded is not None
+        assert (first / COMPLETION_MARKER).exists()
+
+        MockProvider.downloaded = None
+
+        with asyncio.Runner() as runner:
+            second = ToolingManager(tmp_path / "second", runner, tool_cache).ensure(MockProvider, {"latency": 0})
+
+        assert MockProvider.downloaded is None
+        assert second.resolve() == first.resolve()
+
+    def test_tool_cache_eviction(self, tmp_path: Path) -> None:
+        """Verifies that only the least recently used entries the session didn't use are evicted
+
+        Args:
+            tmp_path: Temporary directory
+        """
+
+        tool_cache = ToolCache(tmp_path, max_size=2048)
+
+        async def download(directory: Path) -> None:
+            (directory / "tool.bin").write_bytes(bytes(1024))
+
+        async def fetch_all(*keys: str) -> None:
+            for key in keys:
+                await tool_cache.fetch(key, download)
+
+        asyncio.run(fetch_all("first", "second"))
+        session_start = time.time_ns()
+        asyncio.run(fetch_all("first", "third"))
+
+        assert all((tmp_path / key / COMPLETION_MARKER).exists() for key in ("first", "second", "third"))
+
+        # Over the limit, but everything was used during a session that started before the fetches
+        tool_cache.evict(used_since=0)
+
+        assert all((tmp_path / key / COMPLETION_MARKER).exists() for key in ("first", "second", "third"))
+
+        tool_cache.evict(used_since=session_start)
+
+        assert (tmp_path / "first" / COMPLETION_MARKER).exists()
+        assert not (tmp_path / "second").exists()
+        assert (tmp_path / "third" / COMPLETION_MARKER).exists()
+
+    def test_unknown_configuration_not_batched(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verifies that registered providers aren't cached under a configuration they weren't requested with
+
+        Args:
+            tmp_path: Temporary directory
+            monkeypatch: Pytest monkeypatch
+        """
+
+        batches: list[dict[type[MockProvider], object]] = []
+
+        with asyncio.Runner() as runner:
+            manager = ToolingManager(tmp_path / "install", runner, ToolCache(tmp_path / "cache"))
+
+            async def download_all(batch: dict[type[MockProvider], object]) -> None:
+                batches.append(dict(batch))
+                manager._ready.update(dict.fromkeys(batch, tmp_path))
+
+            monkeypatch.setattr(manager, "_download_all", download_all)
+
+            manager.register([MockProvider])
+            manager.ensure(MockProvider, {"latency": 0})
+
+        assert batches == [{MockProvider: {"latency": 0}}]
@@ -0,0 +1,252 @@
+"""Tests for workspace materialization"""
+
+import errno
+import os
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pytest_cppython.workspace import (
+    CloneStrategy,
+    WorkspaceMaterializer,
+    clone_tree,
+    scan_tree,
+)
+
+
+class TestWorkspace:
+    """Tests for workspace materialization"""
+
+    @staticmethod
+    def _populate(directory: Path) -> None:
+        """Creates a small nested tree
+
+        Args:
+            directory: The directory to populate
+        """
+
+        (directory / "nested").mkdir(parents=True)
+        (directory / "root.txt").write_text("root", encoding="utf-8")
+        (directory / "nested" / "leaf.txt").write_text("leaf", encoding="utf-8")
+
+    @pytest.mark.parametrize("strategy", list(CloneStrategy))
+    def test_clone_tree(self, tmp_path: Path, strategy: CloneStrategy) -> None:
+        """Verifies every strategy reproduces the source tree
+
+        Args:
+            tmp_path: Temporary directory
+            strategy: The clone strategy
+        """
+
+        source = tmp_path / "source"
+        destination = tmp_path / "destination"
+        self._populate(source)
+
+        used = clone_tree(source, destination, strategy)
+
+        assert (destination / "root.txt").read_text(encoding="utf-8") == "root"
+        assert (destination / "nested" / "leaf.txt").read_text(encoding="utf-8") == "leaf"
+        assert used in CloneStrategy
+
+    @pytest.mark.parametrize("strategy", list(CloneStrategy))
+    def test_clone_directory_symlink(self, tmp_path: Path, strategy: CloneStrategy) -> None:
+        """Verifies that symlinks to directories are cloned as symlinks
+
+        Args:
+            tmp_path: Temporary directory
+            strategy: The clone strategy
+        """
+
+        source = tmp_path / "source"
+        destination = tmp_path / "destination"
+        self._populate(source)
+        (source / "link").symlink_to("nested", target_is_directory=True)
+
+        clone_tree(source, destination, strategy)
+
+        assert (destination / "link").is_symlink()
+        assert os.readlink(destination / "link") == "nested"
+        assert (destination / "link" / "leaf.txt").read_text(encoding="utf-8") == "leaf"
+
+    def test_hardlink_cross_device(self, tmp_path: Path, mocker: MockerFixture) -> None:
+        """Verifies that hardlinking between filesystems falls back to copies
+
+        Args:
+            tmp_path: Temporary directory
+            mocker: The pytest-mock fixture
+        """
+
+        source = tmp_path / "source"
+        destination = tmp_path / "destination"
+        self._populate(source)
+
+        link = mocker.patch("pytest_cppython.workspace.os.link", side_effect=OSError(errno.EXDEV, "cross device"))
+
+        assert clone_tree(source, destination, CloneStrategy.HARDLINK) is CloneStrategy.HARDLINK
+        assert (destination / "nested" / "leaf.txt").read_text(encoding="utf-8") == "leaf"
+        assert link.call_count == 1
+
+    def test_materialize_isolated(self, tmp_path: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+        """Verifies that workspaces share a template but not their modifications
+
+        Args:
+            tmp_path: Temporary directory
+            tmp_path_factory: Factory for centralized temporary directories
+        """
+
+        data = tmp_path / "data"
+        self._populate(data)
+
+        materializer = WorkspaceMaterializer(tmp_path_factory, CloneStrategy.COPY)
+
+        first = materializer.materialize(data, None)
+        second = materializer.materialize(data, None)
+
+        (first / "root.txt").write_text("modified", encoding="utf-8")
+
+        assert first != second
+        assert materializer.template(data, None) == materializer.template(data, None)
+        assert (second / "root.txt").read_text(encoding="utf-8") == "root"
+
+    def test_snapshot_restore(self, tmp_path: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+        """Verifies that restoring undoes modifications, additions and removals
+
+        Args:
+            tmp_path: Temporary directory
+            tmp_path_factory: Factory for centralized temporary directories
+        """
+
+        workspace = tmp_path / "workspace"
+        self._populate(workspace)
+
+        snapshot = WorkspaceMaterializer(tmp_path_factory).snapshot(workspace)
+
+        (workspace / "root.txt").write_text("modified", encoding="utf-8")
+        (workspace / "nested" / "leaf.txt").unlink()
+        (workspace / "added.txt").write_text("added", encoding="utf-8")
+        (workspace / "build" / "deep").mkdir(parents=True)
+        (workspace / "build" / "deep" / "output.o").write_bytes(b"\0")
+
+        result = snapshot.restore()
+
+        assert result.restored == 2
+        assert result.removed == 2
+        assert (workspace / "root.txt").read_text(encoding="utf-8") == "root"
+        assert (workspace / "nested" / "leaf.txt").read_text(encoding="utf-8") == "leaf"
+        assert not (workspace / "added.txt").exists()
+        assert not (workspace / "build").exists()
+        assert scan_tree(workspace) == (snapshot.files, snapshot.directories)
+
+    def test_snapshot_touched(self, tmp_path: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+        """Verifies that files whose times changed but whose content didn't are kept, with their times reset
+
+        Args:
+            tmp_path: Temporary directory
+            tmp_path_factory: Factory for centralized temporary directories
+        """
+
+        workspace = tmp_path / "workspace"
+        self._populate(workspace)
+
+        snapshot = WorkspaceMaterializer(tmp_path_factory).snapshot(workspace)
+        leaf = workspace / "nested" / "leaf.txt"
+        os.utime(leaf, ns=(0, 0))
+
+        result = snapshot.restore()
+
+        assert result.restored == 0
+        assert result.scanned == 2
+        assert leaf.stat().st_mtime_ns == snapshot.files["nested/leaf.txt"].mtime_ns
+
+    def test_snapshot_hardlinked(self, tmp_path: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+        """Verifies that restoring a hardlinked workspace file doesn't write through to the template
+
+        Args:
+            tmp_path: Temporary directory
+            tmp_path_factory: Factory for centralized temporary directories
+        """
+
+        data = tmp_path / "data"
+        self._populate(data)
+
+        materializer = WorkspaceMaterializer(tmp_path_factory, CloneStrategy.HARDLINK)
+        workspace = materializer.materialize(data, None)
+        snapshot = materializer.snapshot(workspace)
+
+        # Replace rather than write into the file, as hardlinked workspaces require
+        (workspace / "root.txt").unlink()
+        (workspace / "root.txt").write_text("modified", encoding="utf-8")
+
+        snapshot.restore()
+
+        assert (workspace / "root.txt").read_text(encoding="utf-8") == "root"
+        assert (materializer.template(data, None) / "root.txt").read_text(encoding="utf-8") == "root"
+        assert materializer.snapshot(workspace) is snapshot
+
+    def test_snapshot_directory_symlinks(self, tmp_path: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+        """Verifies that restoring removes, recreates and replaces symlinks to directories
+
+        Args:
+            tmp_path: Temporary directory
+            tmp_path_factory: Factory for centralized temporary directories
+        """
+
+        workspace = tmp_path / "workspace"
+        self._populate(workspace)
+        (workspace / "kept").symlink_to("nested", target_is_directory=True)
+        (workspace / "replaced").symlink_to("nested", target_is_directory=True)
+
+        snapshot = WorkspaceMaterializer(tmp_path_factory).snapshot(workspace)
+
+        (workspace / "added").symlink_to("nested", target_is_directory=True)
+        (workspace / "kept").unlink()
+        (workspace / "replaced").unlink()
+        (workspace / "replaced").mkdir()
+        (workspace / "nested").rename(workspace / "moved")
+        (workspace / "nested").symlink_to("moved", target_is_directory=True)
+
+        snapshot.restore()
+
+        assert not (workspace / "added").is_symlink()
+        assert not (workspace / "moved" / "leaf.txt").exists()
+        assert (workspace / "kept").is_symlink() and (workspace / "replaced").is_symlink()
+        assert (workspace / "replaced" / "leaf.txt").read_text(encoding="utf-8") == "leaf"
+        assert not (workspace / "nested").is_symlink()
+        assert scan_tree(workspace)[1] == snapshot.directories
+
+    def test_snapshot_missing(self, tmp_path: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+        """Verifies that a directory missing at capture, such as a fresh install path, is removed again
+
+        Args:
+            tmp_path: Temporary directory
+            tmp_path_factory: Factory for centralized temporary directories
+        """
+
+        install_path = tmp_path / "install"
+        snapshot = WorkspaceMaterializer(tmp_path_factory).snapshot(install_path)
+
+        (install_path / "package-0").mkdir(parents=True)
+        (install_path / "package-0" / "artifact.bin").write_bytes(b"\0")
+
+        assert snapshot.restore().removed == 1
+        assert not install_path.exists()
+        assert snapshot.restore().removed == 0
+
+    def test_snapshot_missing_symlink(self, tmp_path: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+        """Verifies that a directory missing at capture is removed again when the test created it as a symlink
+
+        Args:
+            tmp_path: Temporary directory
+            tmp_path_factory: Factory for centralized temporary directories
+        """
+
+        install_path = tmp_path / "install"
+        snapshot = WorkspaceMaterializer(tmp_path_factory).snapshot(install_path)
+
+        (tmp_path / "target").mkdir()
+        install_path.symlink_to(tmp_path / "target", target_is_directory=True)
+
+        assert snapshot.restore().removed == 1
+        assert not install_path.is_symlink()
+        assert (tmp_path / "target").exists()